@@ -0,0 +1,99 @@
+"""ファイルシステム走査モジュール
+
+ディレクトリツリーを並列に走査する処理を提供する。
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Container
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# 走査スレッド数の上限
+_MAX_SCAN_THREADS = 32
+
+# 走査はシステムコール待ちが中心のため、呼び出し元のワーカー1つあたりに割り当てるスレッド数
+_SCAN_THREADS_PER_WORKER = 4
+
+
+def scan_tree(
+    root: str,
+    *,
+    workers: int,
+    recursive: bool = True,
+    extensions: Container[str] | None = None,
+    stat: bool = False,
+) -> list[os.DirEntry[str]]:
+    """ディレクトリ配下のファイルを列挙する
+
+    サブディレクトリの走査をスレッドプールで並列に行い、
+    見つかったサブディレクトリは呼び出し元スレッドが順次投入する。
+
+    Args:
+        root: 走査するディレクトリのパス
+        workers: 呼び出し元が並列に処理するワーカー数。走査スレッド数はこの数倍とする
+        recursive: サブディレクトリも再帰的に走査するか
+        extensions: 対象とする小文字の拡張子。Noneの場合は全てのファイルを対象とする
+        stat: 走査スレッド上でstatを取得し、DirEntryにキャッシュさせるか。
+            statに失敗したファイルは結果に含めない
+
+    Returns:
+        ファイルのDirEntryのリスト（順序は不定）
+    """
+    files: list[os.DirEntry[str]] = []
+    scan_threads = max(1, min(_MAX_SCAN_THREADS, workers * _SCAN_THREADS_PER_WORKER))
+
+    with ThreadPoolExecutor(max_workers=scan_threads) as executor:
+        pending = {executor.submit(_scan_entries, root, extensions, stat)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_files, subdirs = future.result()
+                files.extend(dir_files)
+                if recursive:
+                    pending.update(
+                        executor.submit(_scan_entries, d, extensions, stat) for d in subdirs
+                    )
+
+    return files
+
+
+def _scan_entries(
+    directory: str, extensions: Container[str] | None, stat: bool
+) -> tuple[list[os.DirEntry[str]], list[str]]:
+    """単一ディレクトリの直下にあるファイルとサブディレクトリを列挙する
+
+    os.scandirのDirEntryが持つ種別情報を使い、エントリごとのstatを避ける。
+    読み込めないディレクトリはPath.globと同様に空として扱う。
+    シンボリックリンクのディレクトリは循環を避けるため辿らない。
+
+    Args:
+        directory: 列挙するディレクトリのパス
+        extensions: 対象とする小文字の拡張子（Noneの場合は全て）
+        stat: 対象ファイルのstatを取得するか
+
+    Returns:
+        (ファイルのDirEntryのリスト, サブディレクトリパスのリスト)のタプル
+    """
+    files: list[os.DirEntry[str]] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    if (
+                        extensions is not None
+                        and os.path.splitext(entry.name)[1].lower() not in extensions
+                    ):
+                        continue
+                    if stat:
+                        try:
+                            entry.stat()
+                        except OSError:
+                            continue
+                    files.append(entry)
+    except OSError:
+        pass
+    return files, subdirs
@@ -3,10 +3,16 @@
 アセット変換を行うすべてのConverterの基底クラスと共通データ型を定義する。
 """
 
+import os
+import stat
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import BinaryIO, ClassVar
 
 
 class ConversionStatus(Enum):
@@ -21,7 +27,7 @@ class ConversionStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversionResult:
     """変換結果を表すデータクラス
 
@@ -75,8 +81,20 @@ class BaseConverter(ABC):
     すべてのアセット変換クラスが継承する抽象基底クラス。
     エンコーディング変換、画像変換、動画変換等の具象クラスは
     このクラスを継承して実装する。
+
+    Attributes:
+        cpu_bound: 変換処理がGILを保持するCPUバウンド処理か。
+            Trueの場合、ConversionManagerはプロセスプールで実行できる
+        extension_based: can_convertが拡張子のみで判定するか。
+            Trueの場合、ConversionManagerはcan_convertを呼ばず拡張子の表引きだけで振り分ける
     """
 
+    cpu_bound: ClassVar[bool] = False
+    extension_based: ClassVar[bool] = False
+
+    # 作成済みディレクトリのキャッシュ（インスタンスごとに_ensure_parent_dirで遅延生成する）
+    _created_dirs: set[Path]
+
     @abstractmethod
     def can_convert(self, file_path: Path) -> bool:
         """このConverterで変換可能なファイルかを判定する
@@ -104,6 +122,28 @@ class BaseConverter(ABC):
         """
         ...
 
+    def convert_batch(self, pairs: list[tuple[Path, Path]]) -> list[ConversionResult | Exception]:
+        """複数のファイルをまとめて変換する
+
+        ConversionManagerがプロセスプールへ複数ファイルを1回で投入する際に使用する。
+        1ファイルの例外が他のファイルの変換を妨げないよう、例外は送出せずに
+        そのファイルの結果の代わりに返す。呼び出し元は単体のconvertが例外を送出した場合と
+        同じようにリトライや失敗の判定を行える。
+
+        Args:
+            pairs: (変換元パス, 変換先パス)のタプルのリスト
+
+        Returns:
+            pairsと同じ順序の、変換結果または変換中に発生した例外のリスト
+        """
+        results: list[ConversionResult | Exception] = []
+        for source, dest in pairs:
+            try:
+                results.append(self.convert(source, dest))
+            except Exception as e:
+                results.append(e)
+        return results
+
     @property
     @abstractmethod
     def supported_extensions(self) -> tuple[str, ...]:
@@ -111,26 +151,86 @@ class BaseConverter(ABC):
 
         このConverterが変換可能なファイル拡張子の一覧を返す。
         拡張子はドット付き小文字形式（例: ".txt", ".bmp"）。
+        can_convertはここに含まれない拡張子のファイルに対してTrueを返してはならない。
 
         Returns:
             対応する拡張子のタプル
         """
         ...
 
-    def _validate_source(self, source: Path) -> None:
+    def _validate_source(self, source: Path) -> os.stat_result:
         """変換元ファイルの検証を行う
 
         Args:
             source: 変換元ファイルのパス
 
+        Returns:
+            検証時に取得した変換元ファイルのstat結果（サイズ等の再取得に使う）
+
         Raises:
             FileNotFoundError: ファイルが存在しない場合
             ValueError: ファイルではなくディレクトリの場合
         """
-        if not source.exists():
-            raise FileNotFoundError(f"変換元ファイルが見つかりません: {source}")
-        if source.is_dir():
+        try:
+            st = os.stat(source)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"変換元ファイルが見つかりません: {source}") from None
+        if stat.S_ISDIR(st.st_mode):
             raise ValueError(f"変換元はファイルである必要があります: {source}")
+        return st
+
+    def _ensure_parent_dir(self, dest: Path) -> None:
+        """変換先ファイルの親ディレクトリを作成する
+
+        作成済みのディレクトリはConverterのインスタンスごとにキャッシュし、
+        同じディレクトリへのmkdir呼び出しを繰り返さない。
+        キャッシュ後に削除されたディレクトリへの書き込みは_open_destが作り直す。
+
+        Args:
+            dest: 変換先ファイルのパス
+        """
+        try:
+            created = self._created_dirs
+        except AttributeError:
+            created = self._created_dirs = set()
+        parent = dest.parent
+        if parent in created:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        created.add(parent)
+
+    @contextmanager
+    def _open_dest(self, dest: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+        """変換先ファイルを置き換え方式で書き込み用に開く
+
+        変換先と同じディレクトリの一時ファイルへ書き込み、ブロックが正常に終了した場合のみ
+        os.replaceで変換先へ置き換える。書き込み中に例外が発生した場合は一時ファイルを削除し、
+        既存の変換先は変更しない（空や書きかけのファイルを残さない）。
+
+        Args:
+            dest: 変換先ファイルのパス
+            buffering: openに渡すバッファサイズ
+
+        Yields:
+            一時ファイルのバイナリ書き込みストリーム
+        """
+        # 同一プロセス内の並行書き込みでも衝突しないよう、プロセスIDとスレッドIDを含める
+        tmp_path = f"{os.fspath(dest)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            fp = open(tmp_path, "wb", buffering=buffering)  # noqa: SIM115
+        except FileNotFoundError:
+            # キャッシュ済みの親ディレクトリが削除されていた場合は作り直して再試行する
+            getattr(self, "_created_dirs", set()).discard(dest.parent)
+            self._ensure_parent_dir(dest)
+            fp = open(tmp_path, "wb", buffering=buffering)  # noqa: SIM115
+        try:
+            with fp:
+                yield fp
+            os.replace(tmp_path, dest)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
 
     def _get_file_size(self, path: Path) -> int:
         """ファイルサイズを取得する
@@ -141,6 +241,7 @@ class BaseConverter(ABC):
         Returns:
             ファイルサイズ（バイト）。ファイルが存在しない場合は0
         """
-        if path.exists():
-            return path.stat().st_size
-        return 0
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
@@ -3,14 +3,24 @@
 スクリプトファイルの文字コードを検出し、UTF-8に変換する機能を提供する。
 """
 
+import codecs
+import io
+import os
+import shutil
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import BinaryIO, Final
 
 import chardet
+from chardet.resultdict import ResultDict
 
 from .base import BaseConverter, ConversionResult, ConversionStatus
+from .manager import ConversionManager
 
-SUPPORTED_ENCODINGS: tuple[str, ...] = (
+SUPPORTED_ENCODINGS: Final[tuple[str, ...]] = (
     "shift_jis",
     "euc-jp",
     "utf-8",
@@ -20,16 +30,63 @@ SUPPORTED_ENCODINGS: tuple[str, ...] = (
 )
 
 # chardetが返すエンコーディング名とSUPPORTED_ENCODINGSの対応マッピング
-_ENCODING_ALIASES: dict[str, str] = {
-    "shift-jis": "shift_jis",
-    "shiftjis": "shift_jis",
-    "sjis": "shift_jis",
-    "euc_jp": "euc-jp",
-    "eucjp": "euc-jp",
-    "utf8": "utf-8",
-    "utf-8-sig": "utf-8",
-    "ascii": "utf-8",  # ASCIIはUTF-8のサブセット
-}
+_ENCODING_ALIASES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "shift-jis": "shift_jis",
+        "shiftjis": "shift_jis",
+        "sjis": "shift_jis",
+        "euc_jp": "euc-jp",
+        "eucjp": "euc-jp",
+        "utf8": "utf-8",
+        "utf-8-sig": "utf-8",
+        "ascii": "utf-8",  # ASCIIはUTF-8のサブセット
+    }
+)
+
+# テキスト/バイナリ判定でNULバイトを探索する先頭バイト数（git等と同じ8KB）
+_NUL_SCAN_SIZE: Final[int] = 8192
+
+# テキスト判定時に読み込み・文字コード検出に使用する最大バイト数
+_TEXT_SAMPLE_SIZE: Final[int] = 65536
+
+# 非印字文字の割合を調べる先頭バイト数
+_PRINTABLE_SCAN_SIZE: Final[int] = 4096
+
+# 先頭部分における非印字文字の許容割合（これを超えるとバイナリと判定）
+_MAX_NONPRINTABLE_RATIO: Final[float] = 0.3
+
+# 非印字文字のバイトテーブル（bytes.translateのdelete引数に使用）
+# タブ・改行・改ページ・復帰とASCII印字文字、マルチバイト文字用の上位バイトは印字文字として扱う
+_NONPRINTABLE_BYTES: Final[bytes] = bytes(
+    b for b in range(256) if not (b in b"\t\n\x0c\r" or 0x20 <= b < 0x7F or b >= 0x80)
+)
+
+# ストリーム変換時のチャンクサイズ（先頭チャンクは文字コード検出にも使用する）
+_STREAM_CHUNK_SIZE: Final[int] = 65536
+
+
+def _build_canonical_map() -> dict[str, str]:
+    """エンコーディング名の表記ゆれから正規名への対応表を構築する
+
+    サポート対象のエンコーディング名とエイリアスについて、
+    小文字化したアンダースコア区切り・ハイフン区切りの両表記を登録する。
+
+    Returns:
+        casefold済みのエンコーディング名から正規名へのマッピング
+    """
+    canonical: dict[str, str] = {}
+    names = [(encoding, encoding) for encoding in SUPPORTED_ENCODINGS]
+    names.extend(_ENCODING_ALIASES.items())
+    for name, target in names:
+        folded = name.casefold()
+        canonical[folded] = target
+        canonical[folded.replace("_", "-")] = target
+        canonical[folded.replace("-", "_")] = target
+    return canonical
+
+
+# casefold済みのエンコーディング名からSUPPORTED_ENCODINGSの正規名への対応表
+_CANONICAL_ENCODINGS: Final[dict[str, str]] = _build_canonical_map()
 
 
 def _normalize_encoding(encoding: str | None) -> str | None:
@@ -44,14 +101,8 @@ def _normalize_encoding(encoding: str | None) -> str | None:
     if encoding is None:
         return None
 
-    lower_encoding = encoding.lower().replace("_", "-")
-
-    # エイリアスマッピングを確認
-    if lower_encoding in _ENCODING_ALIASES:
-        return _ENCODING_ALIASES[lower_encoding]
-
-    # 元のエンコーディング名を返す（小文字に変換）
-    return encoding.lower()
+    # 対応表にない場合は元のエンコーディング名を返す（小文字に変換）
+    return _CANONICAL_ENCODINGS.get(encoding.casefold(), encoding.lower())
 
 
 def _is_supported_encoding(encoding: str | None) -> bool:
@@ -63,24 +114,10 @@ def _is_supported_encoding(encoding: str | None) -> bool:
     Returns:
         サポートされている場合True
     """
-    if encoding is None:
-        return False
-
-    normalized = _normalize_encoding(encoding)
-    if normalized is None:
-        return False
+    return encoding is not None and encoding.casefold() in _CANONICAL_ENCODINGS
 
-    # 正規化後のエンコーディング名でチェック
-    normalized_lower = normalized.lower().replace("_", "-")
-    for supported in SUPPORTED_ENCODINGS:
-        supported_lower = supported.lower().replace("_", "-")
-        if normalized_lower == supported_lower:
-            return True
-
-    return False
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EncodingDetectionResult:
     """文字コード検出結果
 
@@ -136,7 +173,45 @@ class EncodingDetector:
                 is_supported=False,
             )
 
-        result = chardet.detect(data)
+        return self._to_result(chardet.detect(data))
+
+    def detect_stream(self, stream: BinaryIO, head: bytes = b"") -> EncodingDetectionResult:
+        """ストリーム全体の文字コードをチャンク単位で検出する
+
+        ファイル全体をメモリに読み込まずに、detect_bytesにファイル全体を渡した場合と同じ判定を行う。
+        先頭がASCIIのみで後半にマルチバイト文字が現れるファイルも正しく検出できるよう、
+        検出が確定するまでストリームの末尾まで読み進める。
+
+        Args:
+            stream: 検出対象の入力ストリーム（headの続きから読み込む）
+            head: 既に読み込み済みの先頭部分
+
+        Returns:
+            検出結果を表すEncodingDetectionResultオブジェクト
+        """
+        detector = chardet.UniversalDetector()
+        chunk = head or stream.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            return EncodingDetectionResult(
+                encoding=None,
+                confidence=0.0,
+                is_supported=False,
+            )
+        while chunk and not detector.done:
+            detector.feed(chunk)
+            chunk = stream.read(_STREAM_CHUNK_SIZE)
+        return self._to_result(detector.close())
+
+    @staticmethod
+    def _to_result(result: ResultDict) -> EncodingDetectionResult:
+        """chardetの検出結果をEncodingDetectionResultに変換する
+
+        Args:
+            result: chardetが返す検出結果の辞書
+
+        Returns:
+            エンコーディング名を正規化した検出結果
+        """
         encoding = result.get("encoding")
         confidence = result.get("confidence", 0.0) or 0.0
 
@@ -165,26 +240,48 @@ class EncodingDetector:
         Raises:
             FileNotFoundError: ファイルが存在しない場合
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
+        with open(os.fspath(file_path), "rb") as f:
+            head = f.read(_TEXT_SAMPLE_SIZE)
 
-        data = file_path.read_bytes()
+        return self.is_text_bytes(head)
+
+    def is_text_bytes(self, data: bytes) -> bool:
+        """バイトデータがテキストかどうかを判定する
 
+        読み込み済みのデータに対してis_text_fileと同じ判定を行う。
+        判定には先頭部分のみを使用する。
+
+        Args:
+            data: 判定対象のバイトデータ
+
+        Returns:
+            テキストの場合True、バイナリの場合False
+        """
         # 空ファイルはテキストファイルとして扱う
         if len(data) == 0:
             return True
 
-        # NULバイトが含まれている場合はバイナリファイルと判定
-        if b"\x00" in data:
+        # 先頭部分にNULバイトが含まれている場合はバイナリファイルと判定
+        if data.find(b"\x00", 0, _NUL_SCAN_SIZE) != -1:
+            return False
+
+        # 非印字文字が多い場合はchardetを使わずにバイナリファイルと判定
+        head = data[:_PRINTABLE_SCAN_SIZE]
+        nonprintable = len(head) - len(head.translate(None, delete=_NONPRINTABLE_BYTES))
+        if nonprintable > len(head) * _MAX_NONPRINTABLE_RATIO:
             return False
 
         # chardetで検出を試みる
-        result = self.detect_bytes(data)
+        result = self.detect_bytes(data[:_TEXT_SAMPLE_SIZE])
 
         # エンコーディングが検出できなかった場合はバイナリファイルと判定
         return result.encoding is not None
 
 
+# EncodingConverterが共有するデフォルトのEncodingDetector
+_DEFAULT_DETECTOR = EncodingDetector()
+
+
 class EncodingConverter(BaseConverter):
     """文字コード変換Converter
 
@@ -194,22 +291,35 @@ class EncodingConverter(BaseConverter):
     Attributes:
         target_encoding: 変換先の文字コード（デフォルト: utf-8）
         source_encoding: 変換元の文字コード（Noneの場合は自動検出）
+        copy_unchanged: 変換不要なファイルを変換先にコピーするか
     """
 
+    # 対応するテキストファイルの拡張子（メンバー判定用にfrozensetも保持する）
+    _SUPPORTED_EXTENSIONS: tuple[str, ...] = (".ks", ".tjs", ".txt", ".csv", ".ini")
+    _SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(_SUPPORTED_EXTENSIONS)
+
+    # 変換処理がGILを保持するためプロセスプールでの実行対象とする
+    cpu_bound = True
+
     def __init__(
         self,
         target_encoding: str = "utf-8",
         source_encoding: str | None = None,
+        copy_unchanged: bool = False,
+        detector: EncodingDetector | None = None,
     ) -> None:
         """EncodingConverterを初期化する
 
         Args:
             target_encoding: 変換先の文字コード（デフォルト: utf-8）
             source_encoding: 変換元の文字コード（Noneの場合は自動検出）
+            copy_unchanged: 変換不要なファイルを変換先にコピーするか（デフォルト: False）
+            detector: 使用するEncodingDetector（Noneの場合はモジュール共有のインスタンス）
         """
         self._target_encoding = target_encoding
         self._source_encoding = source_encoding
-        self._detector = EncodingDetector()
+        self._copy_unchanged = copy_unchanged
+        self._detector = detector or _DEFAULT_DETECTOR
 
     @property
     def target_encoding(self) -> str:
@@ -221,6 +331,11 @@ class EncodingConverter(BaseConverter):
         """変換元の文字コードを返す（Noneの場合は自動検出）"""
         return self._source_encoding
 
+    @property
+    def copy_unchanged(self) -> bool:
+        """変換不要なファイルを変換先にコピーするかを返す"""
+        return self._copy_unchanged
+
     @property
     def supported_extensions(self) -> tuple[str, ...]:
         """対応する拡張子のタプルを返す
@@ -228,7 +343,7 @@ class EncodingConverter(BaseConverter):
         Returns:
             対応するテキストファイル拡張子のタプル
         """
-        return (".ks", ".tjs", ".txt", ".csv", ".ini")
+        return self._SUPPORTED_EXTENSIONS
 
     def can_convert(self, file_path: Path) -> bool:
         """このConverterで変換可能なファイルかを判定する
@@ -241,13 +356,38 @@ class EncodingConverter(BaseConverter):
         Returns:
             変換可能な場合True、そうでない場合False
         """
-        if file_path.suffix.lower() not in self.supported_extensions:
+        # Pathのsuffix解析を避け、文字列パスのまま拡張子を取り出す
+        suffix = os.path.splitext(os.fspath(file_path))[1]
+        if suffix.lower() not in self._SUPPORTED_EXTENSION_SET:
             return False
-        if not file_path.exists():
+        try:
+            return self._detector.is_text_file(file_path)
+        except OSError:
             return False
-        return self._detector.is_text_file(file_path)
 
-    def convert(self, source: Path, dest: Path) -> ConversionResult:
+    def can_convert_bytes(self, suffix: str, data: bytes) -> bool:
+        """読み込み済みのデータがこのConverterで変換可能かを判定する
+
+        can_convertと同じ判定を、ファイルを再読み込みせずに行う。
+
+        Args:
+            suffix: ファイルの拡張子（ドット付き）
+            data: ファイルの内容
+
+        Returns:
+            変換可能な場合True、そうでない場合False
+        """
+        if suffix.lower() not in self._SUPPORTED_EXTENSION_SET:
+            return False
+        return self._detector.is_text_bytes(data)
+
+    def convert(
+        self,
+        source: Path,
+        dest: Path,
+        *,
+        data: bytes | None = None,
+    ) -> ConversionResult:
         """ファイルの文字コードを変換する
 
         指定された変換元ファイルを変換先文字コードに変換し、
@@ -256,65 +396,85 @@ class EncodingConverter(BaseConverter):
         Args:
             source: 変換元ファイルのパス
             dest: 変換先ファイルのパス
+            data: 読み込み済みのファイル内容（指定時はsourceを読み込まない）
 
         Returns:
             変換結果を表すConversionResultオブジェクト
         """
-        if not source.exists():
-            return ConversionResult(
-                source_path=source,
-                dest_path=None,
-                status=ConversionStatus.FAILED,
-                message=f"変換元ファイルが見つかりません: {source}",
-            )
-
-        bytes_before = self._get_file_size(source)
-        data = source.read_bytes()
-
-        # ソースエンコーディングの決定
-        if self._source_encoding is not None:
-            source_encoding = self._source_encoding
+        fin: BinaryIO
+        if data is not None:
+            fin = io.BytesIO(data)
         else:
-            detection_result = self._detector.detect_bytes(data)
-            source_encoding = detection_result.encoding or "utf-8"
-
-        # 既にターゲットエンコーディングの場合はスキップ（BOMなしのUTF-8）
-        target_normalized = self._target_encoding.lower().replace("-", "_")
-        source_normalized = source_encoding.lower().replace("-", "_")
-        utf8_bom = b"\xef\xbb\xbf"
-        has_bom = data.startswith(utf8_bom)
-
-        if source_normalized == target_normalized and not has_bom:
-            return ConversionResult(
-                source_path=source,
-                dest_path=dest,
-                status=ConversionStatus.SKIPPED,
-                message="既にターゲットエンコーディングです",
-                bytes_before=bytes_before,
-                bytes_after=bytes_before,
-            )
-
-        # BOM除去
-        if has_bom:
-            data = data[len(utf8_bom) :]
-
-        # 変換実行
-        try:
-            text = data.decode(source_encoding)
-            result_bytes = text.encode(self._target_encoding)
-        except (UnicodeDecodeError, UnicodeEncodeError) as e:
-            return ConversionResult(
-                source_path=source,
-                dest_path=None,
-                status=ConversionStatus.FAILED,
-                message=f"エンコーディング変換に失敗しました: {e}",
-                bytes_before=bytes_before,
-            )
-
-        # 出力先ディレクトリを作成
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_bytes(result_bytes)
-        bytes_after = self._get_file_size(dest)
+            try:
+                fin = open(os.fspath(source), "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                return ConversionResult(
+                    source_path=source,
+                    dest_path=None,
+                    status=ConversionStatus.FAILED,
+                    message=f"変換元ファイルが見つかりません: {source}",
+                )
+
+        with fin:
+            bytes_before = len(data) if data is not None else os.fstat(fin.fileno()).st_size
+            utf8_bom = b"\xef\xbb\xbf"
+
+            # ソースエンコーディングの決定
+            if self._source_encoding is not None:
+                # 検出不要なのでBOM判定に必要な先頭バイトのみ読む
+                source_encoding = self._source_encoding
+                head = fin.read(len(utf8_bom))
+            else:
+                # 先頭チャンクだけでは後半のマルチバイト文字を見落とすため、ストリーム全体で検出する
+                head = fin.read(_STREAM_CHUNK_SIZE)
+                detection_result = self._detector.detect_stream(fin, head)
+                source_encoding = detection_result.encoding or "utf-8"
+                # 変換は先頭チャンクの続きから読み込むため、読み込み位置を戻す
+                fin.seek(len(head))
+
+            # 既にターゲットエンコーディングの場合はスキップ（BOMなしのUTF-8）
+            target_normalized = self._target_encoding.lower().replace("-", "_")
+            source_normalized = source_encoding.lower().replace("-", "_")
+            has_bom = head.startswith(utf8_bom)
+
+            if source_normalized == target_normalized and not has_bom:
+                # 変換元と変換先が同一ファイルの場合は複製不要
+                if self._copy_unchanged and not (data is None and self._is_same_file(fin, dest)):
+                    # 変換不要なのでそのまま複製する
+                    self._ensure_parent_dir(dest)
+                    with self._open_dest(dest) as fout:
+                        if data is not None:
+                            fout.write(data)
+                        else:
+                            fin.seek(0)
+                            shutil.copyfileobj(fin, fout, _STREAM_CHUNK_SIZE)
+                return ConversionResult(
+                    source_path=source,
+                    dest_path=dest,
+                    status=ConversionStatus.SKIPPED,
+                    message="既にターゲットエンコーディングです",
+                    bytes_before=bytes_before,
+                    bytes_after=bytes_before,
+                )
+
+            # BOM除去
+            if has_bom:
+                head = head[len(utf8_bom) :]
+
+            # 出力先ディレクトリを作成
+            self._ensure_parent_dir(dest)
+
+            # 変換実行
+            try:
+                bytes_after = self._transcode_stream(fin, head, dest, source_encoding)
+            except (UnicodeDecodeError, UnicodeEncodeError) as e:
+                return ConversionResult(
+                    source_path=source,
+                    dest_path=None,
+                    status=ConversionStatus.FAILED,
+                    message=f"エンコーディング変換に失敗しました: {e}",
+                    bytes_before=bytes_before,
+                )
 
         return ConversionResult(
             source_path=source,
@@ -324,6 +484,90 @@ class EncodingConverter(BaseConverter):
             bytes_after=bytes_after,
         )
 
+    @staticmethod
+    def _is_same_file(fin: BinaryIO, dest: Path) -> bool:
+        """入力ストリームと変換先が同一ファイルかどうかを判定する
+
+        Args:
+            fin: 変換元ファイルの入力ストリーム
+            dest: 変換先ファイルのパス
+
+        Returns:
+            同一ファイルの場合True（変換先が存在しない場合はFalse）
+        """
+        try:
+            return os.path.samestat(os.fstat(fin.fileno()), os.stat(dest))
+        except OSError:
+            return False
+
+    def _transcode_stream(
+        self,
+        fin: BinaryIO,
+        head: bytes,
+        dest: Path,
+        source_encoding: str,
+    ) -> int:
+        """入力ストリームをチャンク単位で変換して書き込む
+
+        インクリメンタルデコーダ/エンコーダを使用し、
+        ファイル全体をメモリ上に保持せずに変換する。
+        変換に失敗した場合に既存の変換先を壊さないよう、一時ファイルへ書き込んでから置き換える。
+
+        Args:
+            fin: 変換元の入力ストリーム（headの続きから読み込む）
+            head: 既に読み込み済みの先頭チャンク
+            dest: 変換先ファイルのパス
+            source_encoding: 変換元の文字コード
+
+        Returns:
+            書き込んだバイト数
+
+        Raises:
+            UnicodeDecodeError: デコードに失敗した場合
+            UnicodeEncodeError: エンコードに失敗した場合
+        """
+        decoder = codecs.getincrementaldecoder(source_encoding)()
+        encoder = codecs.getincrementalencoder(self._target_encoding)()
+        written = 0
+
+        with self._open_dest(dest) as fout:
+            chunk = head
+            while chunk:
+                written += fout.write(encoder.encode(decoder.decode(chunk)))
+                chunk = fin.read(_STREAM_CHUNK_SIZE)
+            written += fout.write(encoder.encode(decoder.decode(b"", final=True), final=True))
+
+        return written
+
+    def convert_many(
+        self,
+        files: list[tuple[Path, Path]],
+        max_workers: int | None = None,
+    ) -> list[ConversionResult]:
+        """複数ファイルの文字コードをプロセス並列で変換する
+
+        文字コード検出はGILを保持するCPUバウンド処理のため、
+        スレッドではなくプロセスプールで並列化する。
+
+        Args:
+            files: (変換元パス, 変換先パス)のタプルのリスト
+            max_workers: 最大ワーカー数（Noneの場合は使用可能なCPUコア数）
+
+        Returns:
+            入力と同じ順序の変換結果のリスト
+        """
+        if not files:
+            return []
+
+        workers = max_workers or ConversionManager.usable_cpu_count()
+        if workers == 1 or len(files) == 1:
+            return [self.convert(source, dest) for source, dest in files]
+
+        sources = [source for source, _ in files]
+        dests = [dest for _, dest in files]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.convert, sources, dests, chunksize=8))
+
     def convert_bytes(self, data: bytes) -> tuple[bytes, str]:
         """バイトデータの文字コードを変換する
 
@@ -6,6 +6,12 @@ TLG画像形式のデコードおよび変換機能を提供する。
 また、BMP/JPG/PNG形式からWebP形式への変換機能も提供する。
 """
 
+import mmap
+import os
+import stat
+import struct
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -14,6 +20,12 @@ from PIL import Image
 
 from mnemonic.converter.base import BaseConverter, ConversionResult, ConversionStatus
 
+# 変換結果を書き込む際のバッファサイズ（1MB）
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 画像ファイルを読み込んでPIL.Imageを返す関数の型エイリアス
+ImageLoader = Callable[[Path], Image.Image]
+
 
 class TLGVersion(Enum):
     """TLG画像のバージョン
@@ -39,7 +51,7 @@ class QualityPreset(Enum):
     LOW = 70
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TLGInfo:
     """TLG画像のメタ情報
 
@@ -68,6 +80,21 @@ class TLGImageDecoder:
     # TLGマジックバイト
     TLG5_MAGIC = b"TLG5.0\x00raw\x1a"
     TLG6_MAGIC = b"TLG6.0\x00raw\x1a"
+    _TLG_MAGICS = frozenset((TLG5_MAGIC, TLG6_MAGIC))
+    _MAGIC_LENGTH = len(TLG5_MAGIC)
+    # マジックバイトのバージョン番号より後ろの共通部分とバージョン番号の対応
+    _MAGIC_SUFFIX = TLG5_MAGIC[4:]
+    _VERSION_BY_DIGIT = {ord("5"): TLGVersion.TLG5, ord("6"): TLGVersion.TLG6}
+    # マジックバイト直後のヘッダ（色数、幅、高さ）。TLG6は色数と幅の間に3バイトのフラグを持つ
+    _HEADER_STRUCTS = {
+        TLGVersion.TLG5: struct.Struct("<BII"),
+        TLGVersion.TLG6: struct.Struct("<B3xII"),
+    }
+    # バージョンごとに許容される色数（1: グレースケール、3: RGB、4: RGBA）
+    _VALID_COLORS = {
+        TLGVersion.TLG5: frozenset((3, 4)),
+        TLGVersion.TLG6: frozenset((1, 3, 4)),
+    }
 
     def is_tlg_file(self, file_path: Path) -> bool:
         """指定されたファイルがTLG形式かどうかを判定する
@@ -80,15 +107,86 @@ class TLGImageDecoder:
         Returns:
             TLG形式の場合True、そうでない場合False
         """
-        if not file_path.exists():
+        # exists()による事前statは行わず、openの失敗で判定する
+        # バッファ付きファイルオブジェクトを作らず、fdから先頭バイトを直接読む
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError:
             return False
 
         try:
-            with open(file_path, "rb") as f:
-                header = f.read(len(self.TLG5_MAGIC))
-                return header == self.TLG5_MAGIC or header == self.TLG6_MAGIC
+            header = os.read(fd, self._MAGIC_LENGTH)
         except OSError:
             return False
+        finally:
+            os.close(fd)
+
+        return header in self._TLG_MAGICS
+
+    def _detect_version(self, data: bytes | memoryview) -> TLGVersion:
+        """先頭のマジックバイトからTLGバージョンを判定する
+
+        TLG5とTLG6のマジックバイトは4バイト目（"5"/"6"）のみが異なるため、
+        共通部分を比較した後はその1バイトで分岐する。
+
+        Args:
+            data: TLG画像ファイルの内容
+
+        Returns:
+            判定されたTLGバージョン（TLG形式でない場合はUNKNOWN）
+        """
+        if (
+            len(data) < self._MAGIC_LENGTH
+            or data[:3] != b"TLG"
+            or data[4 : self._MAGIC_LENGTH] != self._MAGIC_SUFFIX
+        ):
+            return TLGVersion.UNKNOWN
+        return self._VERSION_BY_DIGIT.get(data[3], TLGVersion.UNKNOWN)
+
+    def _require_version(self, data: bytes | memoryview) -> TLGVersion:
+        """TLGバージョンを判定し、TLG形式でない場合は例外を送出する
+
+        Args:
+            data: TLG画像ファイルの内容
+
+        Returns:
+            判定されたTLGバージョン
+
+        Raises:
+            ValueError: TLG形式でないデータの場合
+        """
+        version = self._detect_version(data)
+        if version is TLGVersion.UNKNOWN:
+            raise ValueError("TLG形式ではないデータです")
+        return version
+
+    @contextmanager
+    def _map_file(self, file_path: Path) -> Iterator[bytes | memoryview]:
+        """TLGファイルを読み取り専用でメモリマップする
+
+        ファイル全体をヒープに読み込まず、参照されたページのみをOSが読み込む。
+        ヘッダのみを参照する場合はファイルの先頭部分しか読み込まれない。
+
+        Args:
+            file_path: TLG画像ファイルのパス
+
+        Yields:
+            ファイル内容のmemoryview（空ファイルの場合は空のbytes）
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        with open(file_path, "rb") as f:
+            # 空ファイルはmmapできない
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+
+            with (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                yield view
 
     def get_info(self, file_path: Path) -> TLGInfo:
         """TLG画像のメタ情報を取得する
@@ -103,7 +201,31 @@ class TLGImageDecoder:
             ValueError: TLG形式でないファイルの場合
             FileNotFoundError: ファイルが存在しない場合
         """
-        raise NotImplementedError
+        with self._map_file(file_path) as data:
+            return self.get_info_from_bytes(data)
+
+    def get_info_from_bytes(self, data: bytes | memoryview) -> TLGInfo:
+        """読み込み済みのTLGデータからメタ情報を取得する
+
+        Args:
+            data: TLG画像ファイルの内容
+
+        Returns:
+            TLG画像のメタ情報
+
+        Raises:
+            ValueError: TLG形式でないデータ、またはヘッダが不正な場合
+        """
+        version = self._require_version(data)
+        header = self._HEADER_STRUCTS[version]
+        if len(data) < self._MAGIC_LENGTH + header.size:
+            raise ValueError("TLGヘッダが途中で途切れています")
+
+        colors, width, height = header.unpack_from(data, self._MAGIC_LENGTH)
+        if colors not in self._VALID_COLORS[version]:
+            raise ValueError(f"未対応の色数です: {colors}")
+
+        return TLGInfo(version=version, width=width, height=height, has_alpha=colors == 4)
 
     def decode(self, file_path: Path) -> Image.Image:
         """TLG画像をデコードしてPIL.Imageオブジェクトを返す
@@ -118,6 +240,8 @@ class TLGImageDecoder:
             ValueError: TLG形式でないファイルの場合
             FileNotFoundError: ファイルが存在しない場合
         """
+        with self._map_file(file_path) as data:
+            self._require_version(data)
         raise NotImplementedError
 
     def decode_to_file(self, source: Path, dest: Path) -> None:
@@ -131,7 +255,11 @@ class TLGImageDecoder:
             ValueError: TLG形式でないファイルの場合
             FileNotFoundError: ファイルが存在しない場合
         """
-        raise NotImplementedError
+        image = self.decode(source)
+        try:
+            image.save(dest)
+        finally:
+            image.close()
 
 
 class ImageConverter(BaseConverter):
@@ -143,25 +271,45 @@ class ImageConverter(BaseConverter):
     Attributes:
         quality: WebP出力時の品質値（0-100）
         lossless_alpha: アルファチャンネルをロスレスで保存するか
+        skip_up_to_date: 変換先が変換元より新しい場合に再変換を省略するか
     """
 
+    # 対応する画像ファイルの拡張子（メンバー判定用にfrozensetも保持する）
+    _SUPPORTED_EXTENSIONS: tuple[str, ...] = (".tlg", ".bmp", ".jpg", ".jpeg", ".png")
+    _SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(_SUPPORTED_EXTENSIONS)
+
+    # Pillowのデコード・エンコードはGILを解放するため、cpu_boundは指定せずスレッドで実行する
+
+    # can_convertは拡張子のみで判定する
+    extension_based = True
+
     def __init__(
         self,
         quality: QualityPreset | int = QualityPreset.HIGH,
         lossless_alpha: bool = True,
+        skip_up_to_date: bool = False,
     ) -> None:
         """ImageConverterを初期化する
 
         Args:
             quality: WebP品質（プリセットまたは0-100の整数）
             lossless_alpha: アルファチャンネルをロスレスで保存するか
+            skip_up_to_date: 変換先の更新日時が変換元より新しい場合に再変換を省略するか。
+                変換先の内容や品質設定は確認しないため、同じ設定で出力した
+                ディレクトリへ再変換する場合にのみ有効にすること
         """
         if isinstance(quality, QualityPreset):
             self._quality = quality.value
         else:
             self._quality = quality
         self._lossless_alpha = lossless_alpha
+        self._skip_up_to_date = skip_up_to_date
         self._tlg_decoder = TLGImageDecoder()
+        # 拡張子ごとの画像読み込み関数
+        self._loaders: dict[str, ImageLoader] = {
+            ext: Image.open for ext in self._SUPPORTED_EXTENSIONS if ext != ".tlg"
+        }
+        self._loaders[".tlg"] = self._tlg_decoder.decode
 
     @property
     def quality(self) -> int:
@@ -173,6 +321,11 @@ class ImageConverter(BaseConverter):
         """ロスレスアルファ設定を返す"""
         return self._lossless_alpha
 
+    @property
+    def skip_up_to_date(self) -> bool:
+        """最新の変換先をスキップする設定を返す"""
+        return self._skip_up_to_date
+
     @property
     def supported_extensions(self) -> tuple[str, ...]:
         """対応する拡張子のタプルを返す
@@ -180,7 +333,7 @@ class ImageConverter(BaseConverter):
         Returns:
             対応する拡張子のタプル（.tlg, .bmp, .jpg, .jpeg, .png）
         """
-        return (".tlg", ".bmp", ".jpg", ".jpeg", ".png")
+        return self._SUPPORTED_EXTENSIONS
 
     def can_convert(self, file_path: Path) -> bool:
         """このConverterで変換可能なファイルかを判定する
@@ -193,8 +346,9 @@ class ImageConverter(BaseConverter):
         Returns:
             変換可能な場合True、そうでない場合False
         """
-        ext = file_path.suffix.lower()
-        return ext in self.supported_extensions
+        # Pathのsuffix解析を避け、文字列パスのまま拡張子を取り出す
+        ext = os.path.splitext(os.fspath(file_path))[1].lower()
+        return ext in self._SUPPORTED_EXTENSION_SET
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """画像ファイルをWebP形式に変換する
@@ -209,12 +363,16 @@ class ImageConverter(BaseConverter):
         Returns:
             変換結果を表すConversionResultオブジェクト
         """
-        self._validate_source(source)
-        bytes_before = self._get_file_size(source)
+        source_stat = self._validate_source(source)
+        bytes_before = source_stat.st_size
+
+        if self._skip_up_to_date:
+            up_to_date = self._up_to_date_result(source, dest, source_stat)
+            if up_to_date is not None:
+                return up_to_date
 
-        ext = source.suffix.lower()
-        # TLGファイルはTLGImageDecoderでデコード（decode()はまだ未実装）
-        img = self._tlg_decoder.decode(source) if ext == ".tlg" else Image.open(source)
+        loader = self._loaders.get(source.suffix.lower(), Image.open)
+        img = loader(source)
 
         try:
             result = self._save_as_webp(img, dest, source, bytes_before)
@@ -223,6 +381,43 @@ class ImageConverter(BaseConverter):
 
         return result
 
+    @staticmethod
+    def _up_to_date_result(
+        source: Path, dest: Path, source_stat: os.stat_result
+    ) -> ConversionResult | None:
+        """出力ファイルが変換元より新しい場合にスキップ結果を返す
+
+        変換先の更新日時が変換元より厳密に新しい場合のみ再エンコードを省略する。
+        更新日時を保ったままコピーされたファイル（同じ更新日時）は最新とみなさない。
+        空の変換先は書き込みに失敗した残骸の可能性があるため最新とみなさない。
+
+        Args:
+            source: 変換元ファイルのパス
+            dest: 変換先ファイルのパス
+            source_stat: 変換元ファイルのstat結果
+
+        Returns:
+            変換先が最新の場合はSKIPPEDの変換結果、それ以外はNone
+        """
+        try:
+            dest_stat = os.stat(dest)
+        except OSError:
+            return None
+        if (
+            not stat.S_ISREG(dest_stat.st_mode)
+            or dest_stat.st_size == 0
+            or dest_stat.st_mtime_ns <= source_stat.st_mtime_ns
+        ):
+            return None
+        return ConversionResult(
+            source_path=source,
+            dest_path=dest,
+            status=ConversionStatus.SKIPPED,
+            message="変換先が最新のためスキップしました",
+            bytes_before=source_stat.st_size,
+            bytes_after=dest_stat.st_size,
+        )
+
     def convert_from_image(self, image: Image.Image, dest: Path) -> ConversionResult:
         """PIL.ImageオブジェクトをWebP形式で保存する
 
@@ -257,23 +452,24 @@ class ImageConverter(BaseConverter):
         Returns:
             変換結果
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
-
-        has_alpha = image.mode in ("RGBA", "LA", "PA")
-
-        if has_alpha and self._lossless_alpha:
-            # アルファチャンネル付きでロスレスアルファ
-            image.save(dest, "WEBP", quality=self._quality, lossless=True)
-        elif has_alpha:
-            # アルファチャンネル付きだがロスレスでない
-            image.save(dest, "WEBP", quality=self._quality)
-        else:
-            # アルファチャンネルなし→RGB変換
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-            image.save(dest, "WEBP", quality=self._quality)
-
-        bytes_after = self._get_file_size(dest)
+        self._ensure_parent_dir(dest)
+
+        # RGB/RGBA以外のモード（L, P等）の変換はPillowのWebPエンコーダが保存時に1回だけ行う。
+        # ここで事前にconvertするとデコード済みバッファの複製が余分に作られる。
+        # 透過色（tRNS）を持つP/L画像もエンコーダがRGBAに変換するため、アルファ付きとして扱う
+        has_alpha = image.has_transparency_data
+        if has_alpha and image.mode == "RGB":
+            # RGBのままではエンコーダが透過色を捨てるため、ここでアルファ付きに変換する
+            image = image.convert("RGBA")
+
+        # アルファチャンネル付きの場合のみロスレスアルファを適用
+        lossless = has_alpha and self._lossless_alpha
+
+        # 大きな書き込みバッファでwrite呼び出し回数を抑え、書き込み位置から出力サイズを得る。
+        # 保存に失敗した場合に空の変換先を残さないよう、一時ファイル経由で置き換える
+        with self._open_dest(dest, buffering=_WRITE_BUFFER_SIZE) as fp:
+            image.save(fp, "WEBP", quality=self._quality, lossless=lossless)
+            bytes_after = fp.tell()
 
         return ConversionResult(
             source_path=source,
@@ -3,14 +3,25 @@
 複数ファイルの並列変換、リトライ、進捗管理を行うConversionManagerを提供する。
 """
 
+import heapq
+import itertools
 import os
 import time
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
-from threading import Lock
+from typing import Any
 
+from mnemonic._fs import scan_tree
 from mnemonic.converter.base import (
     BaseConverter,
     ConversionResult,
@@ -83,6 +94,12 @@ ProgressCallback = Callable[[int, int], None]
 # 1ワーカーあたりのメモリ使用量（MB）
 MEMORY_PER_WORKER_MB = 500
 
+# プロセスプールへまとめて投入する1バッチあたりの最大タスク数
+_MAX_BATCH_SIZE = 32
+
+# 負荷の偏りを抑えるため、1ワーカーあたりに割り当てるバッチ数の目安
+_BATCHES_PER_WORKER = 4
+
 
 class ConversionManager:
     """変換マネージャー
@@ -95,6 +112,7 @@ class ConversionManager:
         retry_config: リトライ設定
         max_workers: 最大ワーカー数
         progress_callback: 進捗報告用コールバック
+        use_processes: CPUバウンドなConverterをプロセスプールで実行するか
     """
 
     def __init__(
@@ -103,6 +121,7 @@ class ConversionManager:
         retry_config: RetryConfig | None = None,
         max_workers: int | None = None,
         progress_callback: ProgressCallback | None = None,
+        use_processes: bool = False,
     ) -> None:
         """ConversionManagerを初期化する
 
@@ -111,118 +130,301 @@ class ConversionManager:
             retry_config: リトライ設定（Noneの場合はデフォルト設定を使用）
             max_workers: 最大ワーカー数（Noneの場合は自動計算）
             progress_callback: 進捗報告用コールバック関数
+            use_processes: CPUバウンドなConverterをプロセスプールで実行するか。
+                有効にする場合、Converterはpickle可能である必要がある
         """
         self.converters = converters
+        self._dispatch_table = _build_dispatch_table(converters)
         self.retry_config = retry_config or RetryConfig()
         self.max_workers = max_workers or self.calculate_workers()
         self.progress_callback = progress_callback
+        self.use_processes = use_processes
+        # ワーカープールは必要になった時点で作成し、withブロック内では呼び出し間で再利用する
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._reuse_pools = False
+
+    def __enter__(self) -> "ConversionManager":
+        """ワーカープールを呼び出し間で再利用するコンテキストを開始する
+
+        Returns:
+            このConversionManager
+        """
+        self._reuse_pools = True
+        return self
 
-    def convert_files(self, files: list[tuple[Path, Path]]) -> ConversionSummary:
+    def __exit__(self, *args: object) -> None:
+        """コンテキストを終了し、ワーカープールを破棄する"""
+        self.close()
+
+    def close(self) -> None:
+        """ワーカープールを破棄する
+
+        withブロックを使わずに再利用を終える場合にも呼び出せる。
+        """
+        self._reuse_pools = False
+        self._shutdown_pools()
+
+    def _shutdown_pools(self) -> None:
+        """作成済みのワーカープールを終了する"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def convert_files(
+        self,
+        files: list[tuple[Path, Path]],
+        keep_results: bool = True,
+    ) -> ConversionSummary:
         """複数ファイルを変換する
 
-        指定されたファイルリストを並列で変換し、サマリーを返す。
+        指定されたファイルリストのConverterを判定したうえで並列に変換し、サマリーを返す。
+        対応するConverterが無いファイルはスキップとして集計する。
 
         Args:
             files: (変換元パス, 変換先パス)のタプルのリスト
+            keep_results: 個々の変換結果をsummary.resultsに保持するか。
+                Falseの場合は件数のみを集計し、結果は進捗報告後に破棄する
 
         Returns:
             変換結果のサマリー
         """
-        summary = ConversionSummary(total=len(files))
-        completed_count = 0
-        lock = Lock()
+        tasks, unsupported = self._resolve_tasks(files)
+        return self._convert_tasks(tasks, unsupported, keep_results=keep_results)
 
-        def convert_with_retry(source: Path, dest: Path) -> ConversionResult:
-            """リトライ付きで単一ファイルを変換する"""
-            converter = self.get_converter_for_file(source)
+    def iter_convert_files(self, files: list[tuple[Path, Path]]) -> Iterator[ConversionResult]:
+        """複数ファイルを変換し、完了した順に変換結果を返す
+
+        convert_filesと同様に並列で変換するが、結果を保持せず逐次返すため、
+        大量のファイルを変換する場合もメモリ使用量が結果の件数に比例しない。
+        進捗コールバックは呼び出さない。
+
+        Args:
+            files: (変換元パス, 変換先パス)のタプルのリスト
+
+        Yields:
+            完了した変換結果（対応するConverterが無いファイルはスキップ結果）
+        """
+        tasks, unsupported = self._resolve_tasks(files)
+        yield from unsupported
+        yield from self._iter_results(tasks)
 
+    def _resolve_tasks(
+        self, files: list[tuple[Path, Path]]
+    ) -> tuple[list[ConversionTask], list[ConversionResult]]:
+        """ファイルごとにConverterを判定して変換タスクを作成する
+
+        Args:
+            files: (変換元パス, 変換先パス)のタプルのリスト
+
+        Returns:
+            (変換タスクのリスト, 対応するConverterが無いファイルのスキップ結果のリスト)のタプル
+        """
+        tasks: list[ConversionTask] = []
+        unsupported: list[ConversionResult] = []
+        for source, dest in files:
+            # 再投入時にも実行先のプールを決められるよう、Converterを先に判定する
+            converter = self.get_converter_for_file(source)
             if converter is None:
-                return ConversionResult(
-                    source_path=source,
-                    dest_path=None,
-                    status=ConversionStatus.SKIPPED,
-                    message="対応するConverterが見つかりません",
-                )
-
-            attempt = 0
-            last_result: ConversionResult | None = None
-            last_error: Exception | None = None
-
-            while attempt < self.retry_config.max_attempts:
-                try:
-                    result = converter.convert(source, dest)
-
-                    if result.status == ConversionStatus.SUCCESS:
-                        return result
-
-                    last_result = result
-
-                except Exception as e:
-                    last_error = e
-                    last_result = ConversionResult(
-                        source_path=source,
-                        dest_path=None,
-                        status=ConversionStatus.FAILED,
-                        message=str(e),
-                    )
-
-                attempt += 1
-
-                if attempt < self.retry_config.max_attempts:
-                    # 指数バックオフ: backoff_base * (backoff_multiplier ** retry_count)
-                    sleep_time = self.retry_config.backoff_base * (
-                        self.retry_config.backoff_multiplier ** (attempt - 1)
-                    )
-                    time.sleep(sleep_time)
-
-            # 最大リトライ回数に達した場合
-            if last_error is not None:
-                return ConversionResult(
-                    source_path=source,
-                    dest_path=None,
-                    status=ConversionStatus.FAILED,
-                    message=f"最大リトライ回数超過: {last_error}",
-                )
-
-            return last_result or ConversionResult(
-                source_path=source,
-                dest_path=None,
-                status=ConversionStatus.FAILED,
-                message="変換に失敗しました",
-            )
+                unsupported.append(_unsupported_result(source))
+            else:
+                tasks.append(ConversionTask(source=source, dest=dest, converter=converter))
+        return tasks, unsupported
 
-        def process_file(source: Path, dest: Path) -> ConversionResult:
-            """ファイルを処理し、進捗を報告する"""
-            nonlocal completed_count
-            result = convert_with_retry(source, dest)
+    def _convert_tasks(
+        self,
+        tasks: list[ConversionTask],
+        unsupported: list[ConversionResult] | None = None,
+        keep_results: bool = True,
+    ) -> ConversionSummary:
+        """Converter判定済みのタスクを並列に変換し、結果を集計する
 
-            with lock:
-                completed_count += 1
-                if self.progress_callback:
-                    self.progress_callback(completed_count, summary.total)
+        結果の集計と進捗報告は呼び出し元スレッドのみで行う。
 
-            return result
+        Args:
+            tasks: 変換タスクのリスト
+            unsupported: 集計に含める、対応するConverterが無いファイルのスキップ結果
+            keep_results: 個々の変換結果をsummary.resultsに保持するか
 
-        # 並列実行
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(process_file, source, dest): (source, dest)
-                for source, dest in files
-            }
+        Returns:
+            変換結果のサマリー
+        """
+        unsupported = unsupported or []
+        summary = ConversionSummary(total=len(tasks) + len(unsupported))
+        completed_count = 0
 
-            for future in as_completed(futures):
-                result = future.result()
+        def record(result: ConversionResult) -> None:
+            """結果を集計し、進捗を報告する"""
+            nonlocal completed_count
+            if keep_results:
                 summary.results.append(result)
 
-                if result.status == ConversionStatus.SUCCESS:
-                    summary.success += 1
-                elif result.status == ConversionStatus.SKIPPED:
-                    summary.skipped += 1
-                else:
-                    summary.failed += 1
+            if result.status == ConversionStatus.SUCCESS:
+                summary.success += 1
+            elif result.status == ConversionStatus.SKIPPED:
+                summary.skipped += 1
+            else:
+                summary.failed += 1
+
+            completed_count += 1
+            if self.progress_callback:
+                self.progress_callback(completed_count, summary.total)
+
+        for result in unsupported:
+            record(result)
+        for result in self._iter_results(tasks):
+            record(result)
 
         return summary
 
+    def _iter_results(self, tasks: list[ConversionTask]) -> Iterator[ConversionResult]:
+        """Converter判定済みのタスクを並列に変換し、完了した順に結果を返す
+
+        use_processesが有効な場合、CPUバウンドなConverterの変換は
+        プロセスプールで実行し、それ以外はスレッドプールで実行する。
+
+        失敗したタスクはワーカー内で待機せず、指数バックオフ後の再実行時刻とともに
+        ヒープに積まれ、呼び出し元スレッドが時刻到来後に再投入する。
+        そのためバックオフ中もワーカーは他のファイルの変換を続けられる。
+
+        Args:
+            tasks: 変換タスクのリスト
+
+        Yields:
+            リトライを終えた最終的な変換結果
+        """
+        # 並列実行（リトライの予約は呼び出し元スレッドのみで行う）
+        with ExitStack() as stack:
+            # withブロックで使用されていない場合、プールはこの呼び出しの終了時に破棄する
+            if not self._reuse_pools:
+                stack.callback(self._shutdown_pools)
+            # 実行中のFutureと、その結果に対応するタスクのリスト
+            running: dict[Future[Any], list[ConversionTask]] = {}
+            # (再実行時刻, 投入順, タスク)のヒープ。投入順はタスク同士の比較を避けるため
+            retry_queue: list[tuple[float, int, ConversionTask]] = []
+            sequence = itertools.count()
+            # プロセスプールへ投入したFutureと投入先のプール（ワーカー異常終了時の破棄判定用）
+            batch_pools: dict[Future[Any], ProcessPoolExecutor] = {}
+
+            def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+                """ワーカーの異常終了で使えなくなったプロセスプールを破棄する
+
+                次の投入時に新しいプールが作成される。既に作り直したプールは破棄しない。
+                """
+                if self._process_pool is pool:
+                    self._process_pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+
+            def in_process(task: ConversionTask) -> bool:
+                """タスクをプロセスプールで実行するかを返す"""
+                return self.use_processes and task.converter.cpu_bound
+
+            def submit_batch(batch: list[ConversionTask]) -> None:
+                """同じConverterのタスクをまとめてプロセスプールへ投入する"""
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                pool = self._process_pool
+                converter = batch[0].converter
+                pairs = [(task.source, task.dest) for task in batch]
+                try:
+                    future = pool.submit(converter.convert_batch, pairs)
+                except BrokenProcessPool:
+                    # 結果の回収前にプールが壊れていた場合は作り直して投入し直す
+                    discard_process_pool(pool)
+                    pool = self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                    future = pool.submit(converter.convert_batch, pairs)
+                running[future] = batch
+                batch_pools[future] = pool
+
+            def submit(task: ConversionTask) -> None:
+                """タスクをConverterに応じたプールへ投入する"""
+                if in_process(task):
+                    submit_batch([task])
+                    return
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                future = self._thread_pool.submit(task.converter.convert, task.source, task.dest)
+                running[future] = [task]
+
+            # プロセスプールへの初回投入はConverterごとにまとめ、
+            # 投入ごとのConverterのpickleとプロセス間通信を償却する
+            process_groups: dict[int, list[ConversionTask]] = {}
+            for task in tasks:
+                if in_process(task):
+                    process_groups.setdefault(id(task.converter), []).append(task)
+                else:
+                    submit(task)
+            for group in process_groups.values():
+                size = _batch_size(len(group), self.max_workers)
+                for i in range(0, len(group), size):
+                    submit_batch(group[i : i + size])
+
+            while running or retry_queue:
+                now = time.monotonic()
+                while retry_queue and retry_queue[0][0] <= now:
+                    submit(heapq.heappop(retry_queue)[2])
+
+                timeout = retry_queue[0][0] - now if retry_queue else None
+                if not running:
+                    # 実行中のタスクが無い場合は次の再実行時刻まで待つ
+                    time.sleep(max(0.0, timeout or 0.0))
+                    continue
+
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = running.pop(future)
+                    pool = batch_pools.pop(future, None)
+                    # スレッドでの単体変換の例外も、バッチ内の各ファイルの例外も同じように扱う
+                    outcomes: list[ConversionResult | Exception]
+                    try:
+                        value = future.result()
+                    except BrokenProcessPool as e:
+                        # ワーカーが異常終了（OOM等）したプールは再利用できない
+                        # バッチのタスクは通常の失敗としてリトライし、再投入時は新しいプールを使う
+                        if pool is not None:
+                            discard_process_pool(pool)
+                        outcomes = [e] * len(batch)
+                    except Exception as e:
+                        outcomes = [e] * len(batch)
+                    else:
+                        outcomes = value if isinstance(value, list) else [value]
+
+                    for task, outcome in zip(batch, outcomes, strict=True):
+                        error: Exception | None = None
+                        if isinstance(outcome, Exception):
+                            error = outcome
+                            result = ConversionResult(
+                                source_path=task.source,
+                                dest_path=None,
+                                status=ConversionStatus.FAILED,
+                                message=str(error),
+                            )
+                        else:
+                            result = outcome
+                        if (
+                            result.status == ConversionStatus.FAILED
+                            and task.retry_count + 1 < self.retry_config.max_attempts
+                        ):
+                            wake_time = time.monotonic() + _backoff_delay(
+                                self.retry_config, task.retry_count
+                            )
+                            task.retry_count += 1
+                            heapq.heappush(retry_queue, (wake_time, next(sequence), task))
+                            continue
+
+                        if error is not None:
+                            # 最大リトライ回数に達した場合
+                            result = ConversionResult(
+                                source_path=task.source,
+                                dest_path=None,
+                                status=ConversionStatus.FAILED,
+                                message=f"最大リトライ回数超過: {error}",
+                            )
+                        yield result
+
     def convert_directory(
         self,
         source_dir: Path,
@@ -242,49 +444,76 @@ class ConversionManager:
         Returns:
             変換結果のサマリー
         """
-        files: list[tuple[Path, Path]] = []
+        tasks: list[ConversionTask] = []
+        # 走査結果は変換元ディレクトリを前置きした文字列なので、相対パスは前置き分を切り出す
+        prefix_len = len(os.path.join(os.fspath(source_dir), ""))
+
+        # ファイルを収集（Pathは変換対象のファイルに対してのみ生成する）
+        for file_path in self._scan_directory(source_dir, recursive):
+            # 対応するConverterがあるファイルのみ収集し、判定結果をタスクに持たせる
+            converter = self.get_converter_for_file(file_path)
+            if converter is None:
+                continue
 
-        # ファイルを収集
-        pattern = "**/*" if recursive else "*"
+            # 変換先パスを計算（ディレクトリ構造を保持）
+            dest_file = dest_dir / file_path[prefix_len:]
 
-        for source_file in source_dir.glob(pattern):
-            if not source_file.is_file():
-                continue
+            tasks.append(
+                ConversionTask(source=Path(file_path), dest=dest_file, converter=converter)
+            )
 
-            # 対応するConverterがあるファイルのみ収集
-            if self.get_converter_for_file(source_file) is None:
-                continue
+        return self._convert_tasks(tasks)
 
-            # 変換先パスを計算（ディレクトリ構造を保持）
-            relative_path = source_file.relative_to(source_dir)
-            dest_file = dest_dir / relative_path
+    def _scan_directory(self, source_dir: Path, recursive: bool) -> list[str]:
+        """ディレクトリ内のファイルパスを収集する
 
-            files.append((source_file, dest_file))
+        Args:
+            source_dir: 走査するディレクトリのパス
+            recursive: サブディレクトリも再帰的に走査するか
 
-        return self.convert_files(files)
+        Returns:
+            ファイルパスのリスト（順序は不定）
+        """
+        entries = scan_tree(os.fspath(source_dir), workers=self.max_workers, recursive=recursive)
+        return [entry.path for entry in entries]
 
-    def get_converter_for_file(self, file_path: Path) -> BaseConverter | None:
+    def get_converter_for_file(self, file_path: Path | str) -> BaseConverter | None:
         """ファイルに対応するConverterを取得する
 
         指定されたファイルを変換可能なConverterを検索し、最初にマッチしたものを返す。
+        拡張子から候補のConverterを表引きし、拡張子のみで判定するConverterに対しては
+        can_convertの呼び出しを省略する。
 
         Args:
-            file_path: ファイルのパス
+            file_path: ファイルのパス。文字列の場合、Pathはcan_convertの呼び出しが
+                必要な場合にのみ生成する
 
         Returns:
             対応するConverter、存在しない場合はNone
         """
-        for converter in self.converters:
-            if converter.can_convert(file_path):
+        suffix = os.path.splitext(file_path)[1].lower()
+        for converter in self._dispatch_table.get(suffix, ()):
+            if converter.extension_based or converter.can_convert(Path(file_path)):
                 return converter
         return None
 
+    @staticmethod
+    def usable_cpu_count() -> int:
+        """このプロセスが使用可能なCPUコア数を返す
+
+        calculate_workersと同じく、CPUアフィニティによる制限を反映した値を返す。
+
+        Returns:
+            使用可能なCPUコア数（最小1）
+        """
+        return _get_usable_cpu_count()
+
     @staticmethod
     def calculate_workers(available_memory_mb: int | None = None) -> int:
         """最適なワーカー数を計算する
 
-        メモリ使用量とCPUコア数に基づいて、最適なワーカー数を計算する。
-        1ワーカーあたり500MBのメモリを想定する。
+        メモリ使用量とこのプロセスが使用可能なCPUコア数に基づいて、
+        最適なワーカー数を計算する。1ワーカーあたり500MBのメモリを想定する。
 
         Args:
             available_memory_mb: 使用可能なメモリ（MB）。Noneの場合は自動検出
@@ -292,7 +521,7 @@ class ConversionManager:
         Returns:
             最適なワーカー数（最小1）
         """
-        cpu_count = os.cpu_count() or 1
+        cpu_count = _get_usable_cpu_count()
 
         if available_memory_mb is not None:
             memory_based_workers = available_memory_mb // MEMORY_PER_WORKER_MB
@@ -308,6 +537,20 @@ class ConversionManager:
         return max(1, cpu_count)
 
 
+def _get_usable_cpu_count() -> int:
+    """このプロセスが使用可能なCPUコア数を取得する
+
+    CPUアフィニティ（taskset、コンテナのcpuset等）による制限を反映するため、
+    利用可能な環境ではos.sched_getaffinityを使用する。
+
+    Returns:
+        使用可能なCPUコア数（最小1）
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
 def _get_available_memory_mb() -> int | None:
     """利用可能なメモリをMB単位で取得する
 
@@ -323,3 +566,76 @@ def _get_available_memory_mb() -> int | None:
         return available_bytes // (1024 * 1024)
     except (ImportError, AttributeError):
         return None
+
+
+def _build_dispatch_table(
+    converters: list[BaseConverter],
+) -> dict[str, tuple[BaseConverter, ...]]:
+    """拡張子から候補のConverterを引く振り分け表を構築する
+
+    候補はconvertersの順序を保つ。拡張子のみで判定するConverterは必ずマッチするため、
+    それより後ろの候補は表に含めない。
+
+    Args:
+        converters: 使用可能なConverterのリスト
+
+    Returns:
+        小文字の拡張子から候補Converterのタプルへの辞書
+    """
+    table: dict[str, list[BaseConverter]] = {}
+    for converter in converters:
+        for ext in dict.fromkeys(e.lower() for e in converter.supported_extensions):
+            candidates = table.setdefault(ext, [])
+            if candidates and candidates[-1].extension_based:
+                continue
+            candidates.append(converter)
+    return {ext: tuple(candidates) for ext, candidates in table.items()}
+
+
+def _unsupported_result(source: Path) -> ConversionResult:
+    """対応するConverterが無いファイルのスキップ結果を生成する
+
+    Args:
+        source: 変換元ファイルのパス
+
+    Returns:
+        スキップを表す変換結果
+    """
+    return ConversionResult(
+        source_path=source,
+        dest_path=None,
+        status=ConversionStatus.SKIPPED,
+        message="対応するConverterが見つかりません",
+    )
+
+
+def _batch_size(task_count: int, max_workers: int) -> int:
+    """プロセスプールへまとめて投入するタスク数を計算する
+
+    ワーカーごとに複数のバッチが行き渡るよう分割し、
+    1バッチの大きさは_MAX_BATCH_SIZEを上限とする。
+
+    Args:
+        task_count: 同じConverterのタスク数
+        max_workers: 最大ワーカー数
+
+    Returns:
+        1バッチあたりのタスク数（最小1）
+    """
+    per_worker = -(-task_count // (max_workers * _BATCHES_PER_WORKER))
+    return max(1, min(_MAX_BATCH_SIZE, per_worker))
+
+
+def _backoff_delay(retry_config: RetryConfig, retry_count: int) -> float:
+    """リトライまでの待機秒数を計算する
+
+    指数バックオフ: backoff_base * (backoff_multiplier ** retry_count)
+
+    Args:
+        retry_config: リトライ設定
+        retry_count: これまでのリトライ回数
+
+    Returns:
+        待機秒数
+    """
+    return retry_config.backoff_base * (retry_config.backoff_multiplier**retry_count)
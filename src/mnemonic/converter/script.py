@@ -4,12 +4,25 @@ KiriKiriZ向けにゲームスクリプト(.ks, .tjs)を調整するためのコ
 プラグインDLL読み込みの無効化やエンコーディングディレクティブの追加を行う。
 """
 
+import contextlib
+import hashlib
+import mmap
+import os
 import re
+import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 
 from mnemonic.converter.base import BaseConverter, ConversionResult, ConversionStatus
 
+# メモリマップで読み込むファイルサイズの閾値（これ未満は通常の読み込みの方が速い）
+_MMAP_THRESHOLD = 64 * 1024
+
+# 番号付き後方参照・名前付き後方参照・条件付きグループの参照を含むパターンの検出用。
+# これらはパターンをまとめると参照先のグループがずれるため、まとめる対象から外す
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
 
 @dataclass(frozen=True)
 class AdjustmentRule:
@@ -21,11 +34,14 @@ class AdjustmentRule:
         pattern: マッチする正規表現パターン
         replacement: 置換文字列
         description: ルールの説明（日本語）
+        anchor: パターンがマッチする場合に必ず内容に含まれる文字列。
+            指定した場合、内容に含まれなければ正規表現による走査を省略する
     """
 
     pattern: str
     replacement: str
     description: str
+    anchor: str | None = None
 
 
 class ScriptAdjuster(BaseConverter):
@@ -36,11 +52,22 @@ class ScriptAdjuster(BaseConverter):
     Android環境での動作に必要な調整を行う。
     """
 
+    # 対応するスクリプトファイルの拡張子（メンバー判定用にfrozensetも保持する）
+    _SUPPORTED_EXTENSIONS: tuple[str, ...] = (".ks", ".tjs")
+    _SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(_SUPPORTED_EXTENSIONS)
+
+    # 正規表現による置換はGILを保持するためプロセスプールでの実行対象とする
+    cpu_bound = True
+
+    # can_convertは拡張子のみで判定する
+    extension_based = True
+
     DEFAULT_RULES: list[AdjustmentRule] = [
         AdjustmentRule(
             pattern=r'^(\s*)(Plugins\.link\(["\'].*?\.dll["\']\);)',
             replacement=r"\1// \2 // Disabled for Android",
             description="プラグインDLL読み込みの無効化",
+            anchor="Plugins.link(",
         ),
     ]
 
@@ -48,15 +75,55 @@ class ScriptAdjuster(BaseConverter):
         self,
         rules: list[AdjustmentRule] | None = None,
         add_encoding_directive: bool = True,
+        cache_dir: Path | None = None,
+        copy_unchanged: bool = False,
     ) -> None:
         """ScriptAdjusterを初期化する
 
         Args:
             rules: 適用する調整ルールのリスト。Noneの場合はDEFAULT_RULESを使用
             add_encoding_directive: startup.tjsにエンコーディングディレクティブを追加するかどうか
+            cache_dir: 調整結果のキャッシュディレクトリ。指定した場合、
+                同じ内容・同じ設定のスクリプトは調整を省略してキャッシュから出力する
+            copy_unchanged: 調整が不要なファイルを変換先にコピーするか（デフォルト: False）
         """
         self._rules = rules if rules is not None else self.DEFAULT_RULES.copy()
         self._add_encoding_directive = add_encoding_directive
+        self._cache_dir = cache_dir
+        self._copy_unchanged = copy_unchanged
+        # ルールや設定が変わればキャッシュキーも変わるよう、設定のハッシュを前置きに使う
+        self._cache_salt = hashlib.sha256(
+            repr(
+                (
+                    [(rule.pattern, rule.replacement) for rule in self._rules],
+                    add_encoding_directive,
+                )
+            ).encode("utf-8")
+        ).digest()
+        # メタ文字も後方参照も含まないルールは正規表現エンジンを使わずstr.replaceで適用する。
+        # 適用順は定義順のまま保ち、正規表現のルールは_compiled等へのインデックスで表す
+        self._literals: list[tuple[str, str]] = []
+        self._steps: list[tuple[str, str] | int] = []
+        regex_rules: list[AdjustmentRule] = []
+        for rule in self._rules:
+            if _is_literal_rule(rule):
+                self._literals.append((rule.pattern, rule.replacement))
+                self._steps.append((rule.pattern, rule.replacement))
+            else:
+                self._steps.append(len(regex_rules))
+                regex_rules.append(rule)
+        # 呼び出しごとの再コンパイルを避けるため、ルールは初期化時に一度だけコンパイルする
+        self._compiled: list[tuple[re.Pattern[str], str]] = [
+            (re.compile(rule.pattern, re.MULTILINE), rule.replacement) for rule in regex_rules
+        ]
+        self._patterns = [rule.pattern for rule in regex_rules]
+        self._anchors = [rule.anchor for rule in regex_rules]
+        # 内容に応じて適用対象となるルールの組み合わせごとに、
+        # いずれかのルールがマッチするかを1回の走査で判定するためのまとめたパターンを保持する
+        all_rules = tuple(range(len(regex_rules)))
+        self._fused_cache: dict[tuple[int, ...], re.Pattern[str] | None] = {
+            all_rules: self._fuse_patterns(self._patterns, all_rules)
+        }
 
     @property
     def rules(self) -> list[AdjustmentRule]:
@@ -68,6 +135,16 @@ class ScriptAdjuster(BaseConverter):
         """エンコーディングディレクティブを追加するかどうかを返す"""
         return self._add_encoding_directive
 
+    @property
+    def cache_dir(self) -> Path | None:
+        """調整結果のキャッシュディレクトリを返す"""
+        return self._cache_dir
+
+    @property
+    def copy_unchanged(self) -> bool:
+        """調整が不要なファイルを変換先にコピーするかを返す"""
+        return self._copy_unchanged
+
     @property
     def supported_extensions(self) -> tuple[str, ...]:
         """対応する拡張子のタプルを返す
@@ -75,7 +152,7 @@ class ScriptAdjuster(BaseConverter):
         Returns:
             KAGスクリプト(.ks)とTJSスクリプト(.tjs)の拡張子タプル
         """
-        return (".ks", ".tjs")
+        return self._SUPPORTED_EXTENSIONS
 
     def can_convert(self, file_path: Path) -> bool:
         """このConverterで変換可能なファイルかを判定する
@@ -87,7 +164,7 @@ class ScriptAdjuster(BaseConverter):
             .ksまたは.tjsファイルの場合True、そうでない場合False
         """
         suffix = file_path.suffix.lower()
-        return suffix in self.supported_extensions
+        return suffix in self._SUPPORTED_EXTENSION_SET
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """スクリプトファイルを調整する
@@ -102,31 +179,53 @@ class ScriptAdjuster(BaseConverter):
         Returns:
             変換結果を表すConversionResultオブジェクト
         """
-        if not source.exists():
+        try:
+            content, bytes_before = _read_script(source)
+        except FileNotFoundError:
             return ConversionResult(
                 source_path=source,
                 dest_path=None,
                 status=ConversionStatus.FAILED,
                 message=f"変換元ファイルが見つかりません: {source}",
             )
+        except (OSError, UnicodeDecodeError) as e:
+            return ConversionResult(
+                source_path=source,
+                dest_path=None,
+                status=ConversionStatus.FAILED,
+                message=str(e),
+            )
 
         try:
-            content = source.read_text(encoding="utf-8")
-            bytes_before = len(content.encode("utf-8"))
+            is_startup = source.name.lower() == "startup.tjs"
+            cache_path = self._cache_path(content, is_startup)
+            cached = _load_cached(cache_path) if cache_path is not None else None
 
-            adjusted_content, adjustment_count = self.adjust_content(content, source.name)
+            if cached is not None:
+                adjustment_count, encoded = cached
+            else:
+                adjusted_content, adjustment_count = self.adjust_content(content, source.name)
 
-            # startup.tjsの場合、エンコーディングディレクティブを追加
-            is_startup = source.name.lower() == "startup.tjs"
-            if is_startup and self._add_encoding_directive:
-                adjusted_content = self.add_startup_directive(adjusted_content)
-                adjustment_count += 1
+                # startup.tjsの場合、エンコーディングディレクティブを追加
+                if is_startup and self._add_encoding_directive:
+                    adjusted_content = self.add_startup_directive(adjusted_content)
+                    adjustment_count += 1
+
+                # 調整後の内容は1回だけエンコードし、書き込みとサイズ計測に使う
+                encoded = adjusted_content.encode("utf-8") if adjustment_count else b""
+                if cache_path is not None:
+                    _store_cached(cache_path, adjustment_count, encoded)
 
             # 調整がなければスキップ
             if adjustment_count == 0:
+                if self._copy_unchanged:
+                    # 内容をエンコードし直さず、sendfileによるカーネル内コピーで複製する
+                    self._ensure_parent_dir(dest)
+                    with contextlib.suppress(shutil.SameFileError):
+                        shutil.copyfile(source, dest)
                 return ConversionResult(
                     source_path=source,
-                    dest_path=None,
+                    dest_path=dest if self._copy_unchanged else None,
                     status=ConversionStatus.SKIPPED,
                     message="調整が不要なファイルです",
                     bytes_before=bytes_before,
@@ -134,11 +233,11 @@ class ScriptAdjuster(BaseConverter):
                 )
 
             # 出力先ディレクトリを作成
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent_dir(dest)
 
-            # 調整後の内容を書き込み
-            dest.write_text(adjusted_content, encoding="utf-8")
-            bytes_after = len(adjusted_content.encode("utf-8"))
+            with self._open_dest(dest) as fp:
+                fp.write(encoded)
+            bytes_after = len(encoded)
 
             return ConversionResult(
                 source_path=source,
@@ -157,10 +256,29 @@ class ScriptAdjuster(BaseConverter):
                 message=str(e),
             )
 
+    def _cache_path(self, content: str, is_startup: bool) -> Path | None:
+        """スクリプト内容と設定から調整結果のキャッシュパスを求める
+
+        Args:
+            content: スクリプト内容
+            is_startup: startup.tjsかどうか
+
+        Returns:
+            キャッシュファイルのパス。キャッシュが無効な場合はNone
+        """
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256(self._cache_salt)
+        digest.update(b"\x01" if is_startup else b"\x00")
+        digest.update(content.encode("utf-8"))
+        key = digest.hexdigest()
+        return self._cache_dir / key[:2] / key
+
     def adjust_content(self, content: str, filename: str = "") -> tuple[str, int]:
         """スクリプト内容を調整する
 
-        与えられたスクリプト内容に調整ルールを適用する。
+        与えられたスクリプト内容に調整ルールを定義順に適用する。
+        リテラルのルールは文字列置換で、それ以外のルールは正規表現で適用する。
 
         Args:
             content: 調整するスクリプト内容
@@ -169,17 +287,66 @@ class ScriptAdjuster(BaseConverter):
         Returns:
             (調整後の内容, 調整回数)のタプル
         """
+        # 内容が最初に変わるのは元の内容にマッチするルールなので、
+        # どのルールも元の内容にマッチしなければ、ルールごとの走査を省略して確定させる
+        if not any(old in content for old, _ in self._literals):
+            # アンカー文字列を含まない内容には正規表現の走査そのものを行わない
+            active = tuple(
+                i for i, anchor in enumerate(self._anchors) if anchor is None or anchor in content
+            )
+            if not active:
+                return content, 0
+            if active not in self._fused_cache:
+                self._fused_cache[active] = self._fuse_patterns(self._patterns, active)
+            fused = self._fused_cache[active]
+            if fused is not None and fused.search(content) is None:
+                return content, 0
+
+        # マッチがある場合は、前のルールの置換結果に後のルールを適用するため定義順に適用する
         total_count = 0
         result = content
-
-        for rule in self._rules:
-            pattern = re.compile(rule.pattern, re.MULTILINE)
-            new_result, count = pattern.subn(rule.replacement, result)
+        for step in self._steps:
+            if isinstance(step, int):
+                anchor = self._anchors[step]
+                if anchor is not None and anchor not in result:
+                    continue
+                pattern, replacement = self._compiled[step]
+                result, count = pattern.subn(replacement, result)
+            else:
+                old, new = step
+                count = result.count(old)
+                if count:
+                    result = result.replace(old, new)
             total_count += count
-            result = new_result
 
         return result, total_count
 
+    @staticmethod
+    def _fuse_patterns(patterns: list[str], indices: tuple[int, ...]) -> re.Pattern[str] | None:
+        """複数のルールを選択で1つの正規表現にまとめる
+
+        まとめたパターンは、いずれかのルールが内容のどこかにマッチするかの判定にのみ使う。
+        置換には使わないため、ルールの適用順や置換結果への後続ルールの適用は変わらない。
+
+        Args:
+            patterns: 正規表現ルールのパターンのリスト
+            indices: まとめる対象のルールのインデックス
+
+        Returns:
+            まとめたパターン。ルールが1つ以下の場合や、後方参照を含むルールがある場合、
+            グループ名の衝突等でまとめられない場合はNone
+        """
+        if len(indices) < 2:
+            return None
+        # グループで囲むと番号付きのグループがずれ、後方参照が別のグループを指してしまう
+        if any(_GROUP_REFERENCE.search(patterns[i]) for i in indices):
+            return None
+        alternation = "|".join(f"(?:{patterns[i]})" for i in indices)
+        try:
+            return re.compile(alternation, re.MULTILINE)
+        except re.error:
+            return None
+
     def add_startup_directive(self, content: str) -> str:
         """startup.tjsにエンコーディングディレクティブを追加する
 
@@ -198,3 +365,89 @@ class ScriptAdjuster(BaseConverter):
 @endif
 """
         return directive + content
+
+
+def _read_script(source: Path) -> tuple[str, int]:
+    """スクリプトファイルをUTF-8として読み込む
+
+    読み込みはファイルごとに1回だけ行い、サイズは読み込んだバイト数から求める。
+    大きなファイルはメモリマップから直接デコードし、中間のbytesオブジェクトを作らない。
+    テキストモードでの読み込みと同様に、改行コード（CRLF/CR）はLFに統一する。
+
+    Args:
+        source: スクリプトファイルのパス
+
+    Returns:
+        (改行コードをLFに統一したスクリプト内容, ファイルサイズ)のタプル
+
+    Raises:
+        OSError: ファイルを読み込めない場合
+        UnicodeDecodeError: UTF-8としてデコードできない場合
+    """
+    with open(os.fspath(source), "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            data = fp.read()
+            content, size = data.decode("utf-8"), len(data)
+        else:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content, size = str(mm, "utf-8"), len(mm)
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content, size
+
+
+def _load_cached(cache_path: Path) -> tuple[int, bytes] | None:
+    """キャッシュから調整回数と調整後の内容を読み込む
+
+    Args:
+        cache_path: キャッシュファイルのパス
+
+    Returns:
+        (調整回数, 調整後の内容)のタプル。キャッシュが無いか壊れている場合はNone
+    """
+    try:
+        data = cache_path.read_bytes()
+        header, _, payload = data.partition(b"\n")
+        return int(header), payload
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(cache_path: Path, adjustment_count: int, encoded: bytes) -> None:
+    """調整回数と調整後の内容をキャッシュに書き込む
+
+    並列に変換するワーカーが途中の内容を読まないよう、一時ファイルに書いてから置き換える。
+    キャッシュの書き込みに失敗しても変換自体は失敗させない。
+
+    Args:
+        cache_path: キャッシュファイルのパス
+        adjustment_count: 調整回数
+        encoded: 調整後の内容
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(b"%d\n" % adjustment_count)
+                fp.write(encoded)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _is_literal_rule(rule: AdjustmentRule) -> bool:
+    """正規表現を使わずに文字列置換で適用できるルールかを判定する
+
+    Args:
+        rule: 判定する調整ルール
+
+    Returns:
+        パターンにメタ文字が無く、置換文字列に後方参照やエスケープが無い場合True
+    """
+    return re.escape(rule.pattern) == rule.pattern and "\\" not in rule.replacement
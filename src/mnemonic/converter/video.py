@@ -4,14 +4,21 @@ Windows向けゲームの動画アセット(.mpg, .mpeg, .wmv, .avi)を
 Android互換のMP4形式に変換するための機能を提供する。
 """
 
+import functools
+import json
+import os
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import ffmpeg  # type: ignore[import-untyped]
 
 from .base import BaseConverter, ConversionResult, ConversionStatus
 
+# get_video_infoで使う項目のみをffprobeに出力させる（全ストリームの全タグを出力させない）
+_PROBE_ENTRIES = "stream=codec_type,codec_name,width,height:format=duration,bit_rate"
+
 
 @dataclass(frozen=True)
 class VideoInfo:
@@ -38,6 +45,26 @@ class VideoInfo:
     bitrate: int
 
 
+@functools.cache
+def _detect_ffmpeg() -> bool:
+    """FFmpegが実行可能かを確認する
+
+    プロセスの起動コストを繰り返さないよう、結果はプロセス内で1回だけ求めてキャッシュする。
+
+    Returns:
+        FFmpegが利用可能な場合True、そうでない場合False
+    """
+    try:
+        subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True,
+            check=True,
+        )
+        return True
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return False
+
+
 class VideoConverter(BaseConverter):
     """動画ファイルをAndroid互換形式に変換するConverter
 
@@ -45,12 +72,22 @@ class VideoConverter(BaseConverter):
     (.mpg, .mpeg, .wmv, .avi)をH.264/AACのMP4形式に変換する。
     """
 
+    # 対応する動画ファイルの拡張子（メンバー判定用にfrozensetも保持する）
+    _SUPPORTED_EXTENSIONS: tuple[str, ...] = (".mpg", ".mpeg", ".wmv", ".avi")
+    _SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(_SUPPORTED_EXTENSIONS)
+
+    # can_convertは拡張子のみで判定する
+    extension_based = True
+
     def __init__(
         self,
         video_codec: str = "libx264",
         video_profile: str = "baseline",
         audio_codec: str = "aac",
         timeout: int = 300,
+        preset: str | None = "veryfast",
+        crf: int | None = 23,
+        threads: int = 0,
     ) -> None:
         """VideoConverterを初期化する
 
@@ -59,11 +96,24 @@ class VideoConverter(BaseConverter):
             video_profile: H.264のプロファイル（デフォルト: baseline）
             audio_codec: 使用する音声コーデック（デフォルト: aac）
             timeout: FFmpeg実行のタイムアウト秒数（デフォルト: 300秒）
+            preset: エンコード速度のプリセット（デフォルト: veryfast）。
+                Noneの場合は指定せず、コーデックの既定値を使う
+            crf: 品質指定の値（デフォルト: 23）。Noneの場合は指定しない
+            threads: エンコードに使うスレッド数（デフォルト: 0 = FFmpegによる自動決定）
         """
         self._video_codec = video_codec
         self._video_profile = video_profile
         self._audio_codec = audio_codec
         self._timeout = timeout
+        # FFmpegに渡す出力オプション（moov atomを先頭に置き、再生開始を早める）
+        self._output_options: dict[str, str | int] = {
+            "threads": threads,
+            "movflags": "+faststart",
+        }
+        if preset is not None:
+            self._output_options["preset"] = preset
+        if crf is not None:
+            self._output_options["crf"] = crf
 
     @property
     def supported_extensions(self) -> tuple[str, ...]:
@@ -72,7 +122,7 @@ class VideoConverter(BaseConverter):
         Returns:
             対応する動画ファイル拡張子のタプル
         """
-        return (".mpg", ".mpeg", ".wmv", ".avi")
+        return self._SUPPORTED_EXTENSIONS
 
     def can_convert(self, file_path: Path) -> bool:
         """このConverterで変換可能なファイルかを判定する
@@ -83,7 +133,7 @@ class VideoConverter(BaseConverter):
         Returns:
             変換可能な場合True、そうでない場合False
         """
-        return file_path.suffix.lower() in self.supported_extensions
+        return file_path.suffix.lower() in self._SUPPORTED_EXTENSION_SET
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """動画ファイルをMP4形式に変換する
@@ -95,7 +145,10 @@ class VideoConverter(BaseConverter):
         Returns:
             変換結果を表すConversionResultオブジェクト
         """
-        if not source.exists():
+        # 存在確認とサイズ取得を1回のstatで行う
+        try:
+            bytes_before = os.stat(source).st_size
+        except FileNotFoundError:
             return ConversionResult(
                 source_path=source,
                 dest_path=None,
@@ -103,9 +156,7 @@ class VideoConverter(BaseConverter):
                 message=f"変換元ファイルが見つかりません: {source}",
             )
 
-        bytes_before = self._get_file_size(source)
-
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_parent_dir(dest)
 
         try:
             stream = ffmpeg.input(str(source))
@@ -115,6 +166,7 @@ class VideoConverter(BaseConverter):
                 vcodec=self._video_codec,
                 acodec=self._audio_codec,
                 profile=self._video_profile,
+                **self._output_options,
             )
             stream.run(overwrite_output=True, quiet=True)
 
@@ -152,7 +204,7 @@ class VideoConverter(BaseConverter):
             raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
 
         try:
-            probe = ffmpeg.probe(str(file_path))
+            probe = self._probe(file_path)
         except Exception as e:
             raise ValueError(f"動画情報を取得できません: {file_path}: {e}") from e
 
@@ -181,18 +233,43 @@ class VideoConverter(BaseConverter):
             bitrate=int(format_info.get("bit_rate", 0)),
         )
 
+    def _probe(self, file_path: Path) -> dict[str, Any]:
+        """ffprobeで動画情報の取得に必要な項目のみを取得する
+
+        Args:
+            file_path: 動画ファイルのパス
+
+        Returns:
+            ffprobeのJSON出力を解析した辞書
+
+        Raises:
+            subprocess.SubprocessError: ffprobeが失敗またはタイムアウトした場合
+            ValueError: 出力がJSONとして解析できない場合
+        """
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                _PROBE_ENTRIES,
+                "-of",
+                "json",
+                str(file_path),
+            ],
+            capture_output=True,
+            check=True,
+            timeout=self._timeout,
+        )
+        probe: dict[str, Any] = json.loads(result.stdout)
+        return probe
+
     def is_ffmpeg_available(self) -> bool:
         """FFmpegが利用可能かを確認する
 
+        確認結果はプロセス内でキャッシュされ、2回目以降はFFmpegを起動しない。
+
         Returns:
             FFmpegが利用可能な場合True、そうでない場合False
         """
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (FileNotFoundError, subprocess.SubprocessError):
-            return False
+        return _detect_ffmpeg()
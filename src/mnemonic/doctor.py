@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -78,66 +81,92 @@ class DependencyChecker(Protocol):
         ...
 
 
-def _extract_version(output: str) -> str | None:
-    """コマンド出力からバージョン番号を抽出する"""
-    patterns = [
+# バージョン抽出に使う標準出力・標準エラー出力それぞれの先頭バイト数
+_VERSION_OUTPUT_LIMIT = 512
+
+# バージョン番号の抽出パターン（優先順。出力中の位置より先頭のパターンを優先する）
+_VERSION_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"(\d+\.\d+\.\d+)",
         r"(\d+\.\d+)",
         r"version\s+(\d+)",
         r"(\d+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, output, re.IGNORECASE)
+    )
+)
+
+
+def _extract_version(output: str) -> str | None:
+    """コマンド出力からバージョン番号を抽出する"""
+    for pattern in _VERSION_PATTERNS:
+        match = pattern.search(output)
         if match:
             return match.group(1)
     return None
 
 
-def check_dependency(info: DependencyInfo) -> CheckResult:
-    """単一の依存ツールをチェックする"""
+@functools.cache
+def _probe_command(command: str, version_flag: str) -> tuple[bool, str | None, str | None]:
+    """コマンドのバージョン確認を実行する
+
+    同じコマンドを繰り返し起動しないよう、結果はプロセス内でキャッシュする。
+
+    Returns:
+        (検出されたか, バージョン, メッセージ)のタプル
+    """
+    not_found = (False, None, f"コマンド '{command}' が見つかりません")
+    # PATH上に無いコマンドはプロセスを起動せずに未検出とする
+    if shutil.which(command) is None:
+        return not_found
+
     try:
+        # 入力待ちで止まらないよう標準入力は閉じ、出力はデコードせずに受け取る
         result = subprocess.run(
-            [info.command, info.version_flag],
+            [command, version_flag],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
             timeout=10,
         )
-        output = result.stdout + result.stderr
-        version = _extract_version(output)
-
-        return CheckResult(
-            name=info.name,
-            required=info.required,
-            found=True,
-            version=version,
-            message=None,
-        )
     except FileNotFoundError:
-        return CheckResult(
-            name=info.name,
-            required=info.required,
-            found=False,
-            version=None,
-            message=f"コマンド '{info.command}' が見つかりません",
-        )
+        return not_found
     except subprocess.TimeoutExpired:
-        return CheckResult(
-            name=info.name,
-            required=info.required,
-            found=False,
-            version=None,
-            message=f"コマンド '{info.command}' がタイムアウトしました",
-        )
+        return False, None, f"コマンド '{command}' がタイムアウトしました"
     except OSError as e:
-        return CheckResult(
-            name=info.name,
-            required=info.required,
-            found=False,
-            version=None,
-            message=f"コマンド実行エラー: {e}",
-        )
-
-
-def check_all_dependencies() -> list[CheckResult]:
-    """全ての依存ツールをチェックする"""
-    return [check_dependency(info) for info in DEPENDENCIES]
+        return False, None, f"コマンド実行エラー: {e}"
+
+    # バージョンは出力の先頭に現れるため、長いバナーは先頭部分のみをデコードする
+    head = result.stdout[:_VERSION_OUTPUT_LIMIT] + result.stderr[:_VERSION_OUTPUT_LIMIT]
+    return True, _extract_version(head.decode("utf-8", errors="replace")), None
+
+
+def check_dependency(info: DependencyInfo, refresh: bool = False) -> CheckResult:
+    """単一の依存ツールをチェックする
+
+    Args:
+        info: チェックする依存ツール情報
+        refresh: キャッシュ済みの確認結果を破棄して再確認するか
+    """
+    if refresh:
+        _probe_command.cache_clear()
+    found, version, message = _probe_command(info.command, info.version_flag)
+    return CheckResult(
+        name=info.name,
+        required=info.required,
+        found=found,
+        version=version,
+        message=message,
+    )
+
+
+def check_all_dependencies(refresh: bool = False) -> list[CheckResult]:
+    """全ての依存ツールをチェックする
+
+    各チェックはプロセスの起動待ちが中心のため並行に実行し、結果はDEPENDENCIESの順序で返す。
+
+    Args:
+        refresh: キャッシュ済みの確認結果を破棄して再確認するか
+    """
+    if refresh:
+        _probe_command.cache_clear()
+    with ThreadPoolExecutor(max_workers=len(DEPENDENCIES)) as executor:
+        return list(executor.map(check_dependency, DEPENDENCIES))
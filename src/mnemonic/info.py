@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import codecs
+import os
+from collections.abc import Container
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
 import chardet
 
+from mnemonic._fs import scan_tree
+from mnemonic.converter.manager import ConversionManager
+
+# エンコーディング検出のために読み込むスクリプト先頭のバイト数
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+
 
 @dataclass(frozen=True)
 class FileStats:
@@ -41,6 +50,9 @@ class GameAnalyzer(Protocol):
 def detect_engine(path: Path) -> str:
     """エンジンを検出する
 
+    ディレクトリは1回だけ走査する。.xp3はRGSSアーカイブより優先するため、
+    .xp3が見つかった時点で確定し、RGSSアーカイブは走査後に判定する。
+
     Args:
         path: 解析対象ディレクトリ
 
@@ -50,16 +62,41 @@ def detect_engine(path: Path) -> str:
     if not path.is_dir():
         return "unknown"
 
-    for file in path.iterdir():
-        if file.suffix.lower() == ".xp3":
-            return "kirikiri"
+    found_rgss = False
+    with os.scandir(path) as it:
+        for entry in it:
+            suffix_lower = os.path.splitext(entry.name)[1].lower()
+            if suffix_lower == ".xp3":
+                return "kirikiri"
+            if suffix_lower.startswith(".rgss"):
+                found_rgss = True
+
+    return "rpgmaker" if found_rgss else "unknown"
+
+
+def _scan_files(path: Path, extensions: Container[str]) -> list[tuple[str, str, int]]:
+    """ディレクトリ配下の対象ファイルを再帰的に収集する
+
+    statは対象拡張子のファイルに対してのみ行う。
 
-    for file in path.iterdir():
-        suffix_lower = file.suffix.lower()
-        if suffix_lower.startswith(".rgss"):
-            return "rpgmaker"
+    Args:
+        path: 走査するディレクトリ
+        extensions: 対象とする小文字の拡張子
 
-    return "unknown"
+    Returns:
+        (パス, 小文字の拡張子, サイズ)のリスト（順序は不定）
+    """
+    entries = scan_tree(
+        os.fspath(path),
+        workers=ConversionManager.usable_cpu_count(),
+        extensions=extensions,
+        stat=True,
+    )
+    # statは走査スレッド上で取得済みのため、DirEntryのキャッシュから読む
+    return [
+        (entry.path, os.path.splitext(entry.name)[1].lower(), entry.stat().st_size)
+        for entry in entries
+    ]
 
 
 def collect_file_stats(path: Path, extensions: list[str]) -> FileStats:
@@ -72,55 +109,108 @@ def collect_file_stats(path: Path, extensions: list[str]) -> FileStats:
     Returns:
         ファイル統計情報
     """
-    if not path.is_dir():
-        return FileStats(count=0, extensions=(), total_size_bytes=0)
+    stats, _ = _collect_stats_by_category(path, {"": extensions})
+    return stats[""]
 
-    extensions_lower = {ext.lower() for ext in extensions}
-    found_extensions: set[str] = set()
-    count = 0
-    total_size = 0
 
-    for file in path.rglob("*"):
-        if not file.is_file():
-            continue
-        suffix_lower = file.suffix.lower()
-        if suffix_lower in extensions_lower:
-            count += 1
-            total_size += file.stat().st_size
-            found_extensions.add(suffix_lower)
-
-    return FileStats(
-        count=count,
-        extensions=tuple(sorted(found_extensions)),
-        total_size_bytes=total_size,
-    )
+def _collect_stats_by_category(
+    path: Path, categories: dict[str, list[str]], record: str | None = None
+) -> tuple[dict[str, FileStats], list[str]]:
+    """1回のディレクトリ走査で分類ごとのファイル統計を収集する
 
+    Args:
+        path: 解析対象ディレクトリ
+        categories: 分類名と対象拡張子リストの辞書。複数の分類に含まれる拡張子は
+            先に指定した分類に集計する
+        record: 見つかったファイルのパスを記録する分類名
+
+    Returns:
+        (分類名とファイル統計情報の辞書, recordの分類のファイルパスのリスト)のタプル。
+        ファイルパスは並列走査の順序に依存しないよう昇順に並べる
+    """
+    category_by_ext: dict[str, str] = {}
+    for category, extensions in categories.items():
+        for ext in extensions:
+            category_by_ext.setdefault(ext.lower(), category)
+
+    counts = dict.fromkeys(categories, 0)
+    sizes = dict.fromkeys(categories, 0)
+    found_extensions: dict[str, set[str]] = {category: set() for category in categories}
+    recorded: list[str] = []
+
+    if path.is_dir():
+        for file_path, suffix_lower, size in _scan_files(path, category_by_ext):
+            matched = category_by_ext[suffix_lower]
+            counts[matched] += 1
+            sizes[matched] += size
+            found_extensions[matched].add(suffix_lower)
+            if matched == record:
+                recorded.append(file_path)
+        recorded.sort()
+
+    stats = {
+        category: FileStats(
+            count=counts[category],
+            extensions=tuple(sorted(found_extensions[category])),
+            total_size_bytes=sizes[category],
+        )
+        for category in categories
+    }
+    return stats, recorded
+
+
+def _sniff_utf8(content: bytes) -> str | None:
+    """サンプルがASCIIまたはUTF-8として妥当かをCレベルの検査で判定する
+
+    chardetによる統計的な判定は純Pythonで遅いため、UTF-8として解釈できる
+    サンプルはこの関数で確定させる。サンプル末尾で途切れたマルチバイト文字は許容する。
+
+    Args:
+        content: ファイル先頭のサンプル
 
-def _detect_encoding(path: Path, script_extensions: list[str]) -> str | None:
+    Returns:
+        chardetと同じ表記のエンコーディング名。UTF-8として不正な場合や、
+        エスケープシーケンス方式のエンコーディングの可能性がある場合はNone
+    """
+    if content.isascii():
+        # ESCを含む7bitのデータはISO-2022-JP等のエスケープシーケンス方式の可能性があるため、
+        # ASCIIとは確定させずchardetに判定させる
+        return "ascii" if b"\x1b" not in content else None
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(content, final=False)
+    except UnicodeDecodeError:
+        return None
+    if content.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    return "utf-8"
+
+
+def _detect_encoding(script_paths: list[str]) -> str | None:
     """スクリプトファイルのエンコーディングを検出する
 
+    ファイル全体は読み込まず、先頭の_ENCODING_SAMPLE_SIZEバイトのみから判定する。
+    ASCII/UTF-8として妥当なサンプルはchardetを使わずに判定する。
+
     Args:
-        path: 解析対象ディレクトリ
-        script_extensions: スクリプトファイルの拡張子リスト
+        script_paths: スクリプトファイルのパスのリスト（先頭から順に検出を試みる）
 
     Returns:
         検出されたエンコーディング名、またはNone
     """
-    extensions_lower = {ext.lower() for ext in script_extensions}
-
-    for file in path.rglob("*"):
-        if not file.is_file():
+    for script_path in script_paths:
+        try:
+            with open(script_path, "rb") as f:
+                content = f.read(_ENCODING_SAMPLE_SIZE)
+        except OSError:
             continue
-        if file.suffix.lower() in extensions_lower:
-            try:
-                content = file.read_bytes()
-                if content:
-                    result = chardet.detect(content)
-                    encoding = result.get("encoding")
-                    if encoding:
-                        return encoding.lower()
-            except OSError:
-                continue
+        if content:
+            sniffed = _sniff_utf8(content)
+            if sniffed is not None:
+                return sniffed
+            result = chardet.detect(content)
+            encoding = result.get("encoding")
+            if encoding:
+                return encoding.lower()
 
     return None
 
@@ -141,18 +231,25 @@ def analyze_game(path: Path) -> GameInfo:
     audio_extensions = [".ogg", ".wav", ".mp3", ".flac"]
     video_extensions = [".mp4", ".avi", ".wmv", ".mkv"]
 
-    scripts = collect_file_stats(path, script_extensions)
-    images = collect_file_stats(path, image_extensions)
-    audio = collect_file_stats(path, audio_extensions)
-    video = collect_file_stats(path, video_extensions)
+    # 分類ごとに走査せず、1回の走査で全分類を集計し、エンコーディング検出用にスクリプトも記録する
+    stats, script_paths = _collect_stats_by_category(
+        path,
+        {
+            "scripts": script_extensions,
+            "images": image_extensions,
+            "audio": audio_extensions,
+            "video": video_extensions,
+        },
+        record="scripts",
+    )
 
-    detected_encoding = _detect_encoding(path, script_extensions)
+    detected_encoding = _detect_encoding(script_paths)
 
     return GameInfo(
         engine=engine,
-        scripts=scripts,
-        images=images,
-        audio=audio,
-        video=video,
+        scripts=stats["scripts"],
+        images=stats["images"],
+        audio=stats["audio"],
+        video=stats["video"],
         detected_encoding=detected_encoding,
     )
@@ -9,8 +9,8 @@ from __future__ import annotations
 
 import re
 import sys
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from enum import IntEnum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, TextIO
@@ -137,6 +137,19 @@ class BuildLogger:
         """
         return self._config
 
+    def is_enabled(self, level: VerboseLevel) -> bool:
+        """指定レベルのメッセージがいずれかの出力先に書き出されるかを返す
+
+        メッセージの組み立てに手間がかかる場合、呼び出し側で事前に確認するために使用する。
+
+        Args:
+            level: 判定するログレベル
+
+        Returns:
+            標準出力またはログファイルに出力される場合True
+        """
+        return self._log_file is not None or self._config.verbose_level >= level
+
     def _print(self, message: str, file: TextIO | None = None) -> None:
         """メッセージを出力する
 
@@ -151,15 +164,17 @@ class BuildLogger:
     def _log_to_file(self, level: str, message: str) -> None:
         """ファイルにログ出力する
 
+        書き込みはバッファリングし、メッセージごとのフラッシュは行わない。
+        バッファはエラー出力時と__exit__でファイルを閉じる際に書き出される。
+
         Args:
             level: ログレベル文字列
             message: 出力するメッセージ
         """
         if self._log_file:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             clean_message = self._strip_ansi(message)
             self._log_file.write(f"[{timestamp}] {level}: {clean_message}\n")
-            self._log_file.flush()
 
     def _strip_ansi(self, text: str) -> str:
         """ANSIエスケープシーケンスを除去する
@@ -170,6 +185,9 @@ class BuildLogger:
         Returns:
             ANSIエスケープシーケンスを除去したテキスト
         """
+        # エスケープ文字を含まない大半のメッセージでは正規表現の走査を省略する
+        if "\x1b" not in text:
+            return text
         return self._ANSI_ESCAPE_PATTERN.sub("", text)
 
     def info(self, message: str) -> None:
@@ -210,6 +228,9 @@ class BuildLogger:
         """
         self._print(f"エラー: {message}", file=sys.stderr)
         self._log_to_file("ERROR", message)
+        # 異常終了に備え、エラーまでのログはその時点でファイルに書き出す
+        if self._log_file:
+            self._log_file.flush()
 
     def warning(self, message: str) -> None:
         """警告メッセージを出力する（QUIET以上）
@@ -239,6 +260,9 @@ class BuildLogger:
             command: 実行したコマンドとその引数
             output: コマンドの出力
         """
+        # 出力されない場合はコマンド文字列の結合や出力の行分割を行わない
+        if not self.is_enabled(VerboseLevel.DEBUG):
+            return
         cmd_str = " ".join(command)
         self.debug(f"実行: {cmd_str}")
         if output:
@@ -253,6 +277,8 @@ class BuildLogger:
             dest: 変換先ファイルパス
             status: 変換ステータス
         """
+        if not self.is_enabled(VerboseLevel.VERBOSE):
+            return
         self.verbose(f"変換: {source.name} -> {dest.name} [{status}]")
 
     def log_summary(self, statistics: dict[str, Any]) -> None:
@@ -294,6 +320,14 @@ class ConsoleProgressDisplay:
         "sign": "Signing APK",
     }
 
+    # 進捗バーの幅と、更新ごとに生成し直さないよう事前に組み立てたバー文字列
+    _BAR_WIDTH = 40
+    _FULL_BAR = "\u2588" * _BAR_WIDTH
+    _EMPTY_BAR = "\u2591" * _BAR_WIDTH
+
+    # 進捗バーの最小再描画間隔（秒）。約30Hzを超える更新は目視できないため間引く
+    _MIN_REDRAW_INTERVAL = 1 / 30
+
     def __init__(self, use_color: bool = True, use_emoji: bool = True) -> None:
         """進捗表示を初期化する
 
@@ -306,6 +340,8 @@ class ConsoleProgressDisplay:
         self._phase: PipelinePhase | None = None
         self._total = 0
         self._current = 0
+        self._last_line: str | None = None
+        self._last_redraw: float | None = None
 
     def start(self, phase: PipelinePhase, total: int) -> None:
         """フェーズ開始を表示する
@@ -317,6 +353,8 @@ class ConsoleProgressDisplay:
         self._phase = phase
         self._total = total
         self._current = 0
+        self._last_line = None
+        self._last_redraw = None
         emoji = self.PHASE_EMOJI.get(phase.value, "") if self._use_emoji else ""
         name = self.PHASE_NAME.get(phase.value, str(phase))
         prefix = f"{emoji} " if emoji else ""
@@ -325,18 +363,33 @@ class ConsoleProgressDisplay:
     def update(self, current: int, message: str = "") -> None:
         """進捗を更新する
 
+        再描画は約30Hzに間引かれる。ただし完了時（current >= total）の更新は常に描画する。
+
         Args:
             current: 現在の進捗（処理済みアイテム数）
             message: 追加の進捗メッセージ（オプション）
         """
         self._current = current
         if self._total > 0:
+            now = time.monotonic()
+            if (
+                current < self._total
+                and self._last_redraw is not None
+                and now - self._last_redraw < self._MIN_REDRAW_INTERVAL
+            ):
+                return
             percent = int((current / self._total) * 100)
-            bar_width = 40
-            filled = int(bar_width * current / self._total)
-            bar = "\u2588" * filled + "\u2591" * (bar_width - filled)
+            filled = int(self._BAR_WIDTH * current / self._total)
+            bar = self._FULL_BAR[:filled] + self._EMPTY_BAR[filled:]
             msg_part = f" {message}" if message else ""
-            print(f"\r   [{bar}] {percent}%{msg_part}", end="", flush=True)
+            line = f"\r   [{bar}] {percent}%{msg_part}"
+            # 表示内容が変わらない更新では端末への出力を行わない
+            if line == self._last_line:
+                return
+            self._last_line = line
+            self._last_redraw = now
+            sys.stdout.write(line)
+            sys.stdout.flush()
 
     def finish(self, success: bool, message: str = "") -> None:
         """フェーズ終了を表示する
@@ -345,8 +398,7 @@ class ConsoleProgressDisplay:
             success: フェーズが成功したか
             message: 終了メッセージ（オプション）
         """
-        bar_width = 40
-        full_bar = "\u2588" * bar_width
+        full_bar = self._FULL_BAR
         if success:
             mark = "\u2713" if self._use_emoji else "done"
             print(f"\r   [{full_bar}] 100% {mark}")
@@ -10,7 +10,6 @@ import struct
 import zlib
 from dataclasses import dataclass
 from enum import Enum
-from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
@@ -20,6 +19,15 @@ XP3_MAGIC = b"XP3\x0d\x0a\x20\x0a\x1a\x8b\x67\x01"
 # テスト用の簡易マジックナンバー (テストフィクスチャで使用される形式)
 XP3_MAGIC_TEST = b"XP3\x0d\x0a\x1a\x0a"
 
+# インデックスの固定長フィールド（書式の解釈を呼び出しごとに繰り返さないよう事前にコンパイルする）
+_U64 = struct.Struct("<Q")
+# チャンクヘッダ: 4バイトのチャンク名, サイズ
+_CHUNK_HEADER = struct.Struct("<4sQ")
+# infoチャンク: flags, original_size, size, name_len
+_INFO_HEADER = struct.Struct("<IQQH")
+# segmチャンク: flags, offset, size, original_size
+_SEGM = struct.Struct("<IQQQ")
+
 
 class EncryptionType(Enum):
     """検出可能な暗号化タイプ
@@ -198,7 +206,7 @@ class XP3Archive:
         """
         try:
             # info_offsetを読み取る (オフセット11から8バイト)
-            info_offset = struct.unpack("<Q", header[11:19])[0]
+            info_offset = _U64.unpack_from(header, 11)[0]
 
             f.seek(info_offset)
             flag_byte = f.read(1)
@@ -213,12 +221,12 @@ class XP3Archive:
                 table_size_data = f.read(8)
                 if len(table_size_data) < 8:
                     return
-                table_size = struct.unpack("<Q", table_size_data)[0]
+                table_size = _U64.unpack(table_size_data)[0]
 
                 table_offset_data = f.read(8)
                 if len(table_offset_data) < 8:
                     return
-                table_offset = struct.unpack("<Q", table_offset_data)[0]
+                table_offset = _U64.unpack(table_offset_data)[0]
 
                 f.seek(table_offset)
                 self._read_file_table(f, table_size)
@@ -227,7 +235,7 @@ class XP3Archive:
                 compressed_size_data = f.read(8)
                 if len(compressed_size_data) < 8:
                     return
-                compressed_size = struct.unpack("<Q", compressed_size_data)[0]
+                compressed_size = _U64.unpack(compressed_size_data)[0]
 
                 # original_size (解凍後サイズ) を読み飛ばす
                 original_size_data = f.read(8)
@@ -268,49 +276,32 @@ class XP3Archive:
     def _parse_file_entries(self, table_data: bytes) -> None:
         """ファイルエントリをパースする
 
+        チャンクごとにコピーを作らないよう、テーブル全体のmemoryview上をオフセットで走査する。
+
         Args:
             table_data: テーブルデータ
         """
-        stream = BytesIO(table_data)
-
-        while True:
-            chunk_name = stream.read(4)
-            if len(chunk_name) < 4:
+        view = memoryview(table_data)
+        table_len = len(view)
+        pos = 0
+
+        while pos + _CHUNK_HEADER.size <= table_len:
+            chunk_name, chunk_size = _CHUNK_HEADER.unpack_from(view, pos)
+            pos += _CHUNK_HEADER.size
+            # サイズが大きすぎる場合はパース終了
+            if chunk_size > table_len:
                 break
 
-            if chunk_name != b"File":
-                # 不明なチャンクはスキップ
-                try:
-                    chunk_size_data = stream.read(8)
-                    if len(chunk_size_data) < 8:
-                        break
-                    chunk_size = struct.unpack("<Q", chunk_size_data)[0]
-                    # サイズが大きすぎる場合はパース終了
-                    if chunk_size > len(table_data):
-                        break
-                    stream.seek(chunk_size, 1)
-                except (struct.error, OSError, OverflowError):
-                    break
-                continue
-
-            try:
-                chunk_size_data = stream.read(8)
-                if len(chunk_size_data) < 8:
-                    break
-                chunk_size = struct.unpack("<Q", chunk_size_data)[0]
-                # サイズが大きすぎる場合はパース終了
-                if chunk_size > len(table_data):
-                    break
-                entry_data = stream.read(chunk_size)
-                entry = self._parse_single_entry(entry_data)
+            # 不明なチャンクはスキップ
+            if chunk_name == b"File":
+                entry = self._parse_single_entry(view[pos : pos + chunk_size])
                 if entry:
                     self._file_entries.append(entry)
                     if entry.is_encrypted:
                         self._is_encrypted = True
-            except (struct.error, OSError, OverflowError):
-                break
+            pos += chunk_size
 
-    def _parse_single_entry(self, entry_data: bytes) -> XP3FileEntry | None:
+    def _parse_single_entry(self, entry_data: bytes | memoryview) -> XP3FileEntry | None:
         """単一のファイルエントリをパースする
 
         Args:
@@ -319,7 +310,8 @@ class XP3Archive:
         Returns:
             パースされたファイルエントリ、または失敗時None
         """
-        stream = BytesIO(entry_data)
+        entry_len = len(entry_data)
+        pos = 0
         name = ""
         offset = 0
         size = 0
@@ -327,51 +319,34 @@ class XP3Archive:
         is_compressed = False
         is_encrypted = False
 
-        while True:
-            sub_chunk_name = stream.read(4)
-            if len(sub_chunk_name) < 4:
-                break
-
-            try:
-                sub_chunk_size = struct.unpack("<Q", stream.read(8))[0]
-            except struct.error:
-                break
+        while pos + _CHUNK_HEADER.size <= entry_len:
+            sub_chunk_name, sub_chunk_size = _CHUNK_HEADER.unpack_from(entry_data, pos)
+            pos += _CHUNK_HEADER.size
+            # サブチャンクがエントリ末尾を超える場合は読める範囲までを対象とする
+            available = min(sub_chunk_size, entry_len - pos)
 
             if sub_chunk_name == b"info":
                 # ファイル情報チャンク
-                info_data = stream.read(sub_chunk_size)
-                if len(info_data) >= 22:
-                    flags = struct.unpack("<I", info_data[0:4])[0]
-                    original_size = struct.unpack("<Q", info_data[4:12])[0]
-                    size = struct.unpack("<Q", info_data[12:20])[0]
-                    name_len = struct.unpack("<H", info_data[20:22])[0]
-                    if len(info_data) >= 22 + name_len * 2:
-                        name_bytes = info_data[22 : 22 + name_len * 2]
+                if available >= _INFO_HEADER.size:
+                    flags, original_size, size, name_len = _INFO_HEADER.unpack_from(entry_data, pos)
+                    name_start = pos + _INFO_HEADER.size
+                    name_end = name_start + name_len * 2
+                    if name_end - pos <= available:
                         try:
-                            name = name_bytes.decode("utf-16-le")
+                            name = str(entry_data[name_start:name_end], "utf-16-le")
                         except UnicodeDecodeError:
                             name = ""
 
                     is_encrypted = bool(flags & 0x80000000)
                     is_compressed = size != original_size
 
-            elif sub_chunk_name == b"segm":
+            elif sub_chunk_name == b"segm" and available >= _SEGM.size:
                 # セグメント情報チャンク
-                segm_data = stream.read(sub_chunk_size)
-                if len(segm_data) >= 28:
-                    flags = struct.unpack("<I", segm_data[0:4])[0]
-                    offset = struct.unpack("<Q", segm_data[4:12])[0]
-                    size = struct.unpack("<Q", segm_data[12:20])[0]
-                    original_size = struct.unpack("<Q", segm_data[20:28])[0]
-                    is_compressed = bool(flags & 0x07)
-
-            elif sub_chunk_name == b"adlr":
-                # Adler32チェックサムチャンク（スキップ）
-                stream.seek(sub_chunk_size, 1)
+                flags, offset, size, original_size = _SEGM.unpack_from(entry_data, pos)
+                is_compressed = bool(flags & 0x07)
 
-            else:
-                # 不明なサブチャンクはスキップ
-                stream.seek(sub_chunk_size, 1)
+            # adlr（Adler32チェックサム）や不明なサブチャンクは読み飛ばす
+            pos += sub_chunk_size
 
         if name:
             return XP3FileEntry(
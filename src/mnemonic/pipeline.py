@@ -464,11 +464,20 @@ class BuildPipeline:
             ImageConverter(),
         ]
 
+        # 動画はワーカーごとにFFmpegを並行実行するため、コアを分け合うようスレッド数を抑える
+        max_workers = ConversionManager.calculate_workers()
         if not self._config.skip_video:
-            converters.append(VideoConverter(timeout=self._config.ffmpeg_timeout))
+            converters.append(
+                VideoConverter(
+                    timeout=self._config.ffmpeg_timeout,
+                    threads=max(1, ConversionManager.usable_cpu_count() // max_workers),
+                )
+            )
 
         # 変換対象ファイルを変換（上書き）
-        manager = ConversionManager(converters=converters)
+        manager = ConversionManager(
+            converters=converters, max_workers=max_workers, use_processes=True
+        )
         manager.convert_directory(self._extract_dir, self._convert_dir)
 
     def _execute_build(self) -> None:
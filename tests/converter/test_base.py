@@ -1,6 +1,7 @@
 """Converter基底クラスのテスト"""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -143,6 +144,29 @@ class TestBaseConverter:
         assert len(extensions) > 0
         assert all(ext.startswith(".") for ext in extensions)
 
+    def test_convert_batch_returns_results_in_order(self, tmp_path: Path) -> None:
+        """convert_batchが入力と同じ順序で結果を返すことをテスト"""
+        converter = MockConverter()
+        pairs = [(tmp_path / f"source{i}.txt", tmp_path / f"dest{i}.txt") for i in range(3)]
+
+        results = converter.convert_batch(pairs)
+
+        assert [(r.source_path, r.dest_path) for r in results] == pairs
+        assert all(r.status == ConversionStatus.SUCCESS for r in results)
+
+    def test_convert_batch_returns_exception_in_place(self, tmp_path: Path) -> None:
+        """convert_batchが例外を結果の代わりに返し、残りのファイルを変換し続けることをテスト"""
+        converter = MockConverter()
+        pairs = [(tmp_path / f"source{i}.txt", tmp_path / f"dest{i}.txt") for i in range(2)]
+        ok = MockConverter().convert(*pairs[1])
+
+        with patch.object(converter, "convert", side_effect=[RuntimeError("壊れたファイル"), ok]):
+            results = converter.convert_batch(pairs)
+
+        assert isinstance(results[0], RuntimeError)
+        assert str(results[0]) == "壊れたファイル"
+        assert results[1] is ok
+
 
 class TestConversionResultProperties:
     """ConversionResultのユーティリティプロパティのテスト"""
@@ -267,3 +291,69 @@ class TestBaseConverterUtilities:
         size = converter._get_file_size(non_existent)
 
         assert size == 0
+
+    def test_ensure_parent_dir_creates_directory(self, tmp_path: Path) -> None:
+        """正常系: 変換先の親ディレクトリが作成されることをテスト"""
+        converter = MockConverter()
+        dest = tmp_path / "a" / "b" / "dest.txt"
+
+        converter._ensure_parent_dir(dest)
+
+        assert dest.parent.is_dir()
+
+    def test_ensure_parent_dir_skips_cached_directory(self, tmp_path: Path) -> None:
+        """正常系: 作成済みディレクトリに対してmkdirを再実行しないことをテスト"""
+        converter = MockConverter()
+        converter._ensure_parent_dir(tmp_path / "out" / "first.txt")
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            converter._ensure_parent_dir(tmp_path / "out" / "second.txt")
+
+        mock_mkdir.assert_not_called()
+
+    def test_open_dest_replaces_on_success(self, tmp_path: Path) -> None:
+        """正常系: 書き込み完了後に変換先が置き換えられ、一時ファイルが残らないことをテスト"""
+        converter = MockConverter()
+        dest = tmp_path / "dest.txt"
+        dest.write_bytes(b"old")
+
+        with converter._open_dest(dest) as fp:
+            fp.write(b"new")
+
+        assert dest.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_open_dest_keeps_existing_dest_on_error(self, tmp_path: Path) -> None:
+        """異常系: 書き込み中の例外では既存の変換先を変更せず、一時ファイルを削除することをテスト"""
+        converter = MockConverter()
+        dest = tmp_path / "dest.txt"
+        dest.write_bytes(b"old")
+
+        with pytest.raises(RuntimeError), converter._open_dest(dest) as fp:
+            fp.write(b"partial")
+            raise RuntimeError("boom")
+
+        assert dest.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_ensure_parent_dir_cache_is_per_instance(self, tmp_path: Path) -> None:
+        """正常系: 作成済みディレクトリのキャッシュがインスタンス間で共有されないことをテスト"""
+        MockConverter()._ensure_parent_dir(tmp_path / "out" / "first.txt")
+        (tmp_path / "out").rmdir()
+
+        MockConverter()._ensure_parent_dir(tmp_path / "out" / "second.txt")
+
+        assert (tmp_path / "out").is_dir()
+
+    def test_open_dest_recreates_deleted_cached_directory(self, tmp_path: Path) -> None:
+        """正常系: キャッシュ後に削除された親ディレクトリを作り直して書き込むことをテスト"""
+        converter = MockConverter()
+        dest = tmp_path / "out" / "dest.txt"
+        converter._ensure_parent_dir(dest)
+        (tmp_path / "out").rmdir()
+
+        converter._ensure_parent_dir(dest)
+        with converter._open_dest(dest) as fp:
+            fp.write(b"data")
+
+        assert dest.read_bytes() == b"data"
@@ -1,6 +1,8 @@
 """EncodingDetectorおよびEncodingConverterのテスト"""
 
+import io
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -168,6 +170,28 @@ class TestEncodingDetectorDetectBytes:
         assert isinstance(result, EncodingDetectionResult)
 
 
+class TestEncodingDetectorDetectStream:
+    """EncodingDetector.detect_streamメソッドのテスト"""
+
+    def test_matches_detect_bytes_for_whole_data(self, detector: EncodingDetector) -> None:
+        """先頭がASCIIのみのデータでもdetect_bytesにデータ全体を渡した場合と同じ結果になる"""
+        data = ("; comment line\n" * 6000 + "日本語のテキストです。\n" * 50).encode("shift_jis")
+        stream = io.BytesIO(data)
+        head = stream.read(65536)
+
+        result = detector.detect_stream(stream, head)
+
+        assert result == detector.detect_bytes(data)
+        assert result.encoding == "shift_jis"
+
+    def test_returns_none_for_empty_stream(self, detector: EncodingDetector) -> None:
+        """空のストリームではエンコーディングがNoneになる"""
+        result = detector.detect_stream(io.BytesIO(b""))
+
+        assert result.encoding is None
+        assert result.is_supported is False
+
+
 class TestEncodingDetectorIsTextFile:
     """EncodingDetector.is_text_fileメソッドのテスト"""
 
@@ -209,6 +233,31 @@ class TestEncodingDetectorIsTextFile:
         assert result is True
 
 
+class TestEncodingDetectorIsTextBytes:
+    """EncodingDetector.is_text_bytesメソッドのテスト"""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(b"", True, id="正常系: 空データはテキスト"),
+            pytest.param("テスト".encode(), True, id="正常系: UTF-8テキスト"),
+            pytest.param(b"abc\x00def", False, id="正常系: NULバイトを含むデータはバイナリ"),
+            pytest.param(
+                b"a" * 8192 + b"\x00", True, id="正常系: 先頭8KB以降のNULバイトは判定対象外"
+            ),
+            pytest.param(
+                bytes(range(1, 32)) * 4, False, id="正常系: 非印字文字の多いデータはバイナリ"
+            ),
+            pytest.param(b"line1\r\n\tline2\n", True, id="正常系: 制御文字は改行・タブのみ"),
+        ],
+    )
+    def test_distinguishes_text_and_binary_bytes(
+        self, detector: EncodingDetector, data: bytes, expected: bool
+    ) -> None:
+        """バイトデータのテキスト・バイナリを正しく判別できることを確認する"""
+        assert detector.is_text_bytes(data) is expected
+
+
 @pytest.fixture
 def converter() -> EncodingConverter:
     """EncodingConverterインスタンスを返すフィクスチャ"""
@@ -238,6 +287,15 @@ class TestEncodingConverterInit:
         converter = EncodingConverter(source_encoding="shift_jis")
         assert converter.source_encoding == "shift_jis"
 
+    def test_shares_default_detector_between_instances(self) -> None:
+        """デフォルトではEncodingDetectorをインスタンス間で共有することを確認する"""
+        assert EncodingConverter()._detector is EncodingConverter()._detector
+
+    def test_uses_custom_detector(self, detector: EncodingDetector) -> None:
+        """指定したEncodingDetectorを使用することを確認する"""
+        converter = EncodingConverter(detector=detector)
+        assert converter._detector is detector
+
 
 class TestEncodingConverterSupportedExtensions:
     """EncodingConverter.supported_extensionsのテスト"""
@@ -305,6 +363,25 @@ class TestEncodingConverterCanConvert:
             assert result is False
 
 
+class TestEncodingConverterCanConvertBytes:
+    """EncodingConverter.can_convert_bytesのテスト"""
+
+    @pytest.mark.parametrize(
+        "suffix, data, expected",
+        [
+            pytest.param(".ks", b"text content", True, id="正常系: 対応拡張子のテキスト"),
+            pytest.param(".KS", b"text content", True, id="正常系: 大文字の拡張子"),
+            pytest.param(".png", b"text content", False, id="正常系: 非対応拡張子"),
+            pytest.param(".ks", b"\x00\x01\x02", False, id="正常系: 対応拡張子のバイナリ"),
+        ],
+    )
+    def test_returns_expected_result(
+        self, converter: EncodingConverter, suffix: str, data: bytes, expected: bool
+    ) -> None:
+        """拡張子とデータ内容に基づいて正しい結果を返すことを確認する"""
+        assert converter.can_convert_bytes(suffix, data) is expected
+
+
 class TestEncodingConverterConvert:
     """EncodingConverter.convertのテスト"""
 
@@ -373,6 +450,57 @@ class TestEncodingConverterConvert:
 
         assert result.status == ConversionStatus.SKIPPED
 
+    @pytest.mark.parametrize(
+        "copy_unchanged, expected_exists",
+        [
+            pytest.param(True, True, id="正常系: copy_unchanged有効時は変換先にコピー"),
+            pytest.param(False, False, id="正常系: copy_unchanged無効時は変換先を作成しない"),
+        ],
+    )
+    def test_copy_unchanged_for_skipped_file(
+        self, tmp_path: Path, copy_unchanged: bool, expected_exists: bool
+    ) -> None:
+        """スキップ対象のファイルをcopy_unchanged設定に応じてコピーすることを確認する"""
+        converter = EncodingConverter(copy_unchanged=copy_unchanged)
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "out" / "dest.txt"
+        source.write_text("これは既にUTF-8のファイルです", encoding="utf-8")
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert dest.exists() is expected_exists
+        if expected_exists:
+            assert dest.read_bytes() == source.read_bytes()
+
+    def test_copy_unchanged_from_data(self, tmp_path: Path) -> None:
+        """読み込み済みの内容を既存の変換先へ置き換え方式で書き込むことを確認する"""
+        converter = EncodingConverter(copy_unchanged=True)
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "out" / "dest.txt"
+        data = "これは既にUTF-8のファイルです".encode()
+        dest.parent.mkdir()
+        dest.write_bytes(b"old")
+
+        result = converter.convert(source, dest, data=data)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert dest.read_bytes() == data
+        assert list(dest.parent.iterdir()) == [dest]
+
+    def test_copy_unchanged_same_file(self, tmp_path: Path) -> None:
+        """変換元と変換先が同一ファイルの場合は複製せずにスキップすることを確認する"""
+        converter = EncodingConverter(copy_unchanged=True)
+        source = tmp_path / "source.txt"
+        content = "これは既にUTF-8のファイルです".encode()
+        source.write_bytes(content)
+
+        result = converter.convert(source, source)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert source.read_bytes() == content
+        assert list(tmp_path.iterdir()) == [source]
+
     def test_uses_specified_source_encoding(self, tmp_path: Path) -> None:
         """指定されたソースエンコーディングを使用することを確認する"""
         converter = EncodingConverter(source_encoding="shift_jis")
@@ -429,6 +557,124 @@ class TestEncodingConverterConvert:
         assert dest.parent.exists()
         assert dest.exists()
 
+    def test_uses_supplied_data_without_reading_source(self, tmp_path: Path) -> None:
+        """dataを指定した場合は変換元ファイルを読み込まずに変換することを確認する"""
+        converter = EncodingConverter(source_encoding="shift_jis")
+        source = tmp_path / "not_read.txt"
+        dest = tmp_path / "dest.txt"
+        data = "読み込み済みデータ".encode("shift_jis")
+
+        result = converter.convert(source, dest, data=data)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert result.bytes_before == len(data)
+        assert dest.read_text(encoding="utf-8") == "読み込み済みデータ"
+
+    def test_converts_file_larger_than_stream_chunk(self, tmp_path: Path) -> None:
+        """チャンク境界をまたぐ多バイト文字を含む大きなファイルを変換できることを確認する"""
+        converter = EncodingConverter(source_encoding="shift_jis")
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+
+        # 奇数バイトの先頭でチャンク境界を2バイト文字の途中にずらす
+        test_text = "a" + "日本語テキスト" * 20000
+        source.write_bytes(test_text.encode("shift_jis"))
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert dest.read_text(encoding="utf-8") == test_text
+        assert result.bytes_after == dest.stat().st_size
+
+    def test_removes_partial_dest_on_decode_failure(self, tmp_path: Path) -> None:
+        """デコードに失敗した場合は変換先ファイルを残さないことを確認する"""
+        converter = EncodingConverter(source_encoding="utf-8", target_encoding="shift_jis")
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(b"valid text \xff\xfe invalid")
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.FAILED
+        assert not dest.exists()
+        assert list(tmp_path.iterdir()) == [source]
+
+    def test_keeps_existing_dest_on_decode_failure(self, tmp_path: Path) -> None:
+        """デコードに失敗した場合は既存の変換先ファイルを変更しないことを確認する"""
+        converter = EncodingConverter(source_encoding="utf-8", target_encoding="shift_jis")
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(b"valid text \xff\xfe invalid")
+        dest.write_bytes(b"existing")
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.FAILED
+        assert dest.read_bytes() == b"existing"
+
+    def test_converts_shift_jis_after_ascii_first_chunk(self, tmp_path: Path) -> None:
+        """先頭チャンクがASCIIのみでも後半のShift_JISを検出して変換することを確認する"""
+        converter = EncodingConverter()
+        source = tmp_path / "source.ks"
+        dest = tmp_path / "dest.ks"
+        test_text = "; comment line\n" * 6000 + "日本語のテキストです。これはテストです。\n" * 50
+        source.write_bytes(test_text.encode("shift_jis"))
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert dest.read_text(encoding="utf-8") == test_text
+
+
+class TestEncodingConverterConvertMany:
+    """EncodingConverter.convert_manyのテスト"""
+
+    @pytest.mark.parametrize(
+        "max_workers",
+        [
+            pytest.param(1, id="正常系: 単一ワーカーで逐次変換"),
+            pytest.param(2, id="正常系: 複数ワーカーでプロセス並列変換"),
+        ],
+    )
+    def test_converts_all_files_in_order(self, tmp_path: Path, max_workers: int) -> None:
+        """全ファイルを変換し、入力と同じ順序で結果を返すことを確認する"""
+        converter = EncodingConverter(source_encoding="shift_jis")
+        files: list[tuple[Path, Path]] = []
+        for i in range(3):
+            source = tmp_path / f"source{i}.txt"
+            source.write_bytes(f"並列変換テスト{i}".encode("shift_jis"))
+            files.append((source, tmp_path / "out" / f"dest{i}.txt"))
+
+        results = converter.convert_many(files, max_workers=max_workers)
+
+        assert [r.source_path for r in results] == [source for source, _ in files]
+        assert all(r.status == ConversionStatus.SUCCESS for r in results)
+        for i, (_, dest) in enumerate(files):
+            assert dest.read_text(encoding="utf-8") == f"並列変換テスト{i}"
+
+    def test_returns_empty_list_for_no_files(self, converter: EncodingConverter) -> None:
+        """空のリストを渡した場合は空のリストを返すことを確認する"""
+        assert converter.convert_many([]) == []
+
+    def test_default_workers_respect_cpu_affinity(self, tmp_path: Path) -> None:
+        """max_workers未指定時は使用可能なCPUコア数でワーカー数を決めることを確認する"""
+        converter = EncodingConverter(source_encoding="shift_jis")
+        files: list[tuple[Path, Path]] = []
+        for i in range(3):
+            source = tmp_path / f"source{i}.txt"
+            source.write_bytes(f"アフィニティ{i}".encode("shift_jis"))
+            files.append((source, tmp_path / f"dest{i}.txt"))
+
+        with (
+            patch("mnemonic.converter.manager._get_usable_cpu_count", return_value=1),
+            patch("os.cpu_count", return_value=16),
+            patch("mnemonic.converter.encoding.ProcessPoolExecutor") as mock_executor,
+        ):
+            results = converter.convert_many(files)
+
+        mock_executor.assert_not_called()
+        assert all(r.status == ConversionStatus.SUCCESS for r in results)
+
 
 class TestEncodingConverterConvertBytes:
     """EncodingConverter.convert_bytesのテスト"""
@@ -1,7 +1,11 @@
 """TLGImageDecoderおよびImageConverterのテスト"""
 
+import os
+import shutil
+import struct
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from PIL import Image
@@ -11,6 +15,7 @@ from mnemonic.converter.image import (
     ImageConverter,
     QualityPreset,
     TLGImageDecoder,
+    TLGInfo,
     TLGVersion,
 )
 
@@ -79,23 +84,113 @@ class TestIsTlgFile:
         result = decoder.is_tlg_file(nonexistent_path)
         assert result is False
 
+    def test_is_tlg_file_directory(self, tmp_path: Path) -> None:
+        """ディレクトリに対してFalseを返すことを確認"""
+        decoder = TLGImageDecoder()
+
+        result = decoder.is_tlg_file(tmp_path)
+        assert result is False
+
+
+class TestDetectVersion:
+    """_detect_versionメソッドのテスト"""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(TLG5_MAGIC + b"\x00" * 4, TLGVersion.TLG5, id="正常系: TLG5"),
+            pytest.param(TLG6_MAGIC + b"\x00" * 4, TLGVersion.TLG6, id="正常系: TLG6"),
+            pytest.param(
+                memoryview(TLG6_MAGIC), TLGVersion.TLG6, id="正常系: memoryviewも判定できる"
+            ),
+            pytest.param(b"TLG7.0\x00raw\x1a", TLGVersion.UNKNOWN, id="異常系: 未知のバージョン"),
+            pytest.param(b"TLG5.0\x00sds\x1a", TLGVersion.UNKNOWN, id="異常系: 未対応の形式"),
+            pytest.param(b"TLG5", TLGVersion.UNKNOWN, id="異常系: マジックバイトが不完全"),
+        ],
+    )
+    def test_detect_version(self, data: bytes, expected: TLGVersion) -> None:
+        """マジックバイトからTLGバージョンを正しく判定できることを確認"""
+        decoder = TLGImageDecoder()
+
+        assert decoder._detect_version(data) is expected
+
+    def test_bytes_apis_reject_non_tlg_data(self) -> None:
+        """TLG形式でないデータに対してValueErrorを発生させることを確認"""
+        decoder = TLGImageDecoder()
+
+        with pytest.raises(ValueError):
+            decoder.get_info_from_bytes(b"PNG\x00" * 4)
+
 
 class TestGetInfo:
     """get_infoメソッドのテスト"""
 
-    def test_get_info_raises_not_implemented(self) -> None:
-        """get_infoがNotImplementedErrorを発生させることを確認"""
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(
+                TLG5_MAGIC + struct.pack("<BIII", 4, 640, 480, 4),
+                TLGInfo(TLGVersion.TLG5, 640, 480, has_alpha=True),
+                id="正常系: TLG5（RGBA）",
+            ),
+            pytest.param(
+                TLG5_MAGIC + struct.pack("<BIII", 3, 800, 600, 4),
+                TLGInfo(TLGVersion.TLG5, 800, 600, has_alpha=False),
+                id="正常系: TLG5（RGB）",
+            ),
+            pytest.param(
+                TLG6_MAGIC + struct.pack("<BBBBIII", 4, 0, 0, 0, 1280, 720, 0),
+                TLGInfo(TLGVersion.TLG6, 1280, 720, has_alpha=True),
+                id="正常系: TLG6（RGBA）",
+            ),
+            pytest.param(
+                TLG6_MAGIC + struct.pack("<BBBBIII", 1, 0, 0, 0, 32, 16, 0),
+                TLGInfo(TLGVersion.TLG6, 32, 16, has_alpha=False),
+                id="正常系: TLG6（グレースケール）",
+            ),
+        ],
+    )
+    def test_get_info_from_bytes(self, data: bytes, expected: TLGInfo) -> None:
+        """ヘッダからバージョン・サイズ・アルファの有無を読み取れることを確認"""
         decoder = TLGImageDecoder()
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".tlg") as f:
-            f.write(TLG5_MAGIC + b"\x00" * 100)
-            temp_path = Path(f.name)
+        assert decoder.get_info_from_bytes(data) == expected
 
-        try:
-            with pytest.raises(NotImplementedError):
-                decoder.get_info(temp_path)
-        finally:
-            temp_path.unlink()
+    def test_get_info(self, tmp_path: Path) -> None:
+        """ファイルからメタ情報を取得できることを確認"""
+        decoder = TLGImageDecoder()
+        path = tmp_path / "image.tlg"
+        path.write_bytes(TLG5_MAGIC + struct.pack("<BIII", 4, 320, 240, 4) + b"\x00" * 100)
+
+        assert decoder.get_info(path) == TLGInfo(TLGVersion.TLG5, 320, 240, has_alpha=True)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param(TLG5_MAGIC + b"\x04\x00\x01", id="異常系: TLG5ヘッダが途中で途切れている"),
+            pytest.param(TLG6_MAGIC + b"\x04" * 8, id="異常系: TLG6ヘッダが途中で途切れている"),
+            pytest.param(
+                TLG5_MAGIC + struct.pack("<BIII", 1, 8, 8, 4), id="異常系: TLG5で未対応の色数"
+            ),
+            pytest.param(
+                TLG6_MAGIC + struct.pack("<BBBBIII", 2, 0, 0, 0, 8, 8, 0),
+                id="異常系: TLG6で未対応の色数",
+            ),
+        ],
+    )
+    def test_get_info_from_bytes_invalid_header(self, data: bytes) -> None:
+        """不正なヘッダに対してValueErrorを発生させることを確認"""
+        decoder = TLGImageDecoder()
+
+        with pytest.raises(ValueError):
+            decoder.get_info_from_bytes(data)
+
+    def test_get_info_nonexistent_file(self) -> None:
+        """存在しないファイルに対してFileNotFoundErrorを発生させることを確認"""
+        decoder = TLGImageDecoder()
+
+        with pytest.raises(FileNotFoundError):
+            decoder.get_info(Path("/nonexistent/path/to/file.tlg"))
 
 
 class TestDecode:
@@ -115,6 +210,22 @@ class TestDecode:
         finally:
             temp_path.unlink()
 
+    @pytest.mark.parametrize(
+        "file_content",
+        [
+            pytest.param(b"", id="異常系: 空ファイル"),
+            pytest.param(b"PNG\x00" * 4, id="異常系: TLG形式でないファイル"),
+        ],
+    )
+    def test_decode_rejects_non_tlg_file(self, tmp_path: Path, file_content: bytes) -> None:
+        """TLG形式でないファイルに対してValueErrorを発生させることを確認"""
+        decoder = TLGImageDecoder()
+        path = tmp_path / "not_tlg.tlg"
+        path.write_bytes(file_content)
+
+        with pytest.raises(ValueError):
+            decoder.decode(path)
+
 
 class TestDecodeToFile:
     """decode_to_fileメソッドのテスト"""
@@ -214,6 +325,51 @@ class TestImageConverter:
         with Image.open(dest) as img:
             assert img.format == "WEBP"
 
+    def test_convert_records_written_size(self, bmp_image: Path, temp_dir: Path) -> None:
+        """変換後のサイズが出力ファイルのサイズと一致することを確認"""
+        converter = ImageConverter()
+        dest = temp_dir / "output.webp"
+
+        result = converter.convert(bmp_image, dest)
+
+        assert result.bytes_after == dest.stat().st_size
+
+    def test_convert_failure_leaves_no_empty_dest(self, bmp_image: Path, temp_dir: Path) -> None:
+        """WebPの保存に失敗した場合に空の変換先ファイルが残らないことを確認"""
+        converter = ImageConverter()
+        dest = temp_dir / "output.webp"
+
+        with (
+            patch.object(Image.Image, "save", side_effect=OSError("image size exceeds limit")),
+            pytest.raises(OSError),
+        ):
+            converter.convert(bmp_image, dest)
+
+        assert not dest.exists()
+        assert sorted(p.name for p in temp_dir.iterdir()) == [bmp_image.name]
+
+    @pytest.mark.parametrize(
+        "mode, color, expected_mode",
+        [
+            pytest.param("L", 128, "RGB", id="正常系: グレースケール画像はRGBで保存"),
+            pytest.param("P", 1, "RGB", id="正常系: パレット画像はRGBで保存"),
+        ],
+    )
+    def test_convert_non_rgb_mode(
+        self, temp_dir: Path, mode: str, color: int, expected_mode: str
+    ) -> None:
+        """RGB/RGBA以外のモードの画像もWebPに変換できることを確認"""
+        source = temp_dir / f"test_{mode}.png"
+        Image.new(mode, (32, 32), color=color).save(source, "PNG")
+        converter = ImageConverter()
+        dest = temp_dir / "output.webp"
+
+        result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        with Image.open(dest) as img:
+            assert img.mode == expected_mode
+
     def test_convert_jpg_to_webp(self, jpg_image: Path, temp_dir: Path) -> None:
         """JPGファイルをWebPに変換できることを確認"""
         converter = ImageConverter()
@@ -294,6 +450,35 @@ class TestImageConverter:
         assert result.status == ConversionStatus.SUCCESS
         assert dest.exists()
 
+    @pytest.mark.parametrize(
+        "mode, color",
+        [
+            pytest.param("P", 0, id="正常系: 透過インデックスを持つパレット画像"),
+            pytest.param("L", 0, id="正常系: 透過色を持つグレースケール画像"),
+            pytest.param("RGB", (0, 0, 0), id="正常系: 透過色を持つRGB画像"),
+        ],
+    )
+    def test_transparency_info_uses_lossless_alpha(
+        self, temp_dir: Path, mode: str, color: int | tuple[int, int, int]
+    ) -> None:
+        """tRNSの透過色を持つ画像はアルファ付きのロスレスで保存されることを確認"""
+        source = temp_dir / "transparent.png"
+        img = Image.new(mode, (10, 10), color=color)
+        if mode == "P":
+            img.putpalette([0, 0, 0, 255, 0, 0])
+        img.paste(1 if mode == "P" else (255 if mode == "L" else (255, 0, 0)), (0, 0, 5, 10))
+        img.save(source, transparency=color)
+        dest = temp_dir / "output.webp"
+
+        result = ImageConverter(lossless_alpha=True).convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert b"VP8L" in dest.read_bytes()
+        with Image.open(dest) as saved:
+            assert saved.mode == "RGBA"
+            assert saved.getpixel((9, 0))[3] == 0
+            assert saved.getpixel((0, 0))[3] == 255
+
     def test_lossless_alpha_option_false(self, png_with_alpha: Path, temp_dir: Path) -> None:
         """lossless_alpha=Falseで非ロスレスアルファが適用されることを確認"""
         converter = ImageConverter(lossless_alpha=False)
@@ -305,6 +490,10 @@ class TestImageConverter:
         assert result.status == ConversionStatus.SUCCESS
         assert dest.exists()
 
+    def test_is_not_cpu_bound(self) -> None:
+        """Pillowの処理はGILを解放するため、スレッドで実行されることを確認"""
+        assert ImageConverter.cpu_bound is False
+
     def test_supported_extensions(self) -> None:
         """supported_extensionsが正しい拡張子を返すことを確認"""
         converter = ImageConverter()
@@ -380,6 +569,71 @@ class TestImageConverter:
         assert result.status == ConversionStatus.SUCCESS
         assert dest.exists()
 
+    def test_convert_skips_up_to_date_dest(self, bmp_image: Path, temp_dir: Path) -> None:
+        """変換先が変換元より新しい場合は再変換せずスキップすることを確認"""
+        converter = ImageConverter(skip_up_to_date=True)
+        dest = temp_dir / "output.webp"
+        dest.write_bytes(b"existing")
+        source_mtime = bmp_image.stat().st_mtime_ns
+        os.utime(dest, ns=(source_mtime, source_mtime + 1_000_000_000))
+
+        result = converter.convert(bmp_image, dest)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert result.bytes_before == bmp_image.stat().st_size
+        assert result.bytes_after == len(b"existing")
+        assert dest.read_bytes() == b"existing"
+
+    def test_convert_overwrites_stale_dest(self, bmp_image: Path, temp_dir: Path) -> None:
+        """変換先が変換元より古い場合は再変換することを確認"""
+        converter = ImageConverter(skip_up_to_date=True)
+        dest = temp_dir / "output.webp"
+        dest.write_bytes(b"stale")
+        source_mtime = bmp_image.stat().st_mtime_ns
+        os.utime(dest, ns=(source_mtime, source_mtime - 1_000_000_000))
+
+        result = converter.convert(bmp_image, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        with Image.open(dest) as img:
+            assert img.format == "WEBP"
+
+    @pytest.mark.parametrize(
+        "skip_up_to_date,dest_offset_ns",
+        [
+            pytest.param(False, 1_000_000_000, id="正常系: 既定ではスキップしない"),
+            pytest.param(True, 0, id="正常系: 更新日時が同じ場合はスキップしない"),
+        ],
+    )
+    def test_convert_does_not_skip_dest(
+        self, bmp_image: Path, temp_dir: Path, skip_up_to_date: bool, dest_offset_ns: int
+    ) -> None:
+        """スキップが無効、または変換先が厳密に新しくない場合は再変換することを確認"""
+        converter = ImageConverter(skip_up_to_date=skip_up_to_date)
+        dest = temp_dir / "output.webp"
+        dest.write_bytes(b"existing")
+        source_mtime = bmp_image.stat().st_mtime_ns
+        os.utime(dest, ns=(source_mtime, source_mtime + dest_offset_ns))
+
+        result = converter.convert(bmp_image, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        with Image.open(dest) as img:
+            assert img.format == "WEBP"
+
+    def test_convert_overwrites_dest_copied_with_mtime(self, png_image: Path) -> None:
+        """更新日時を保ってコピーされた同名ファイルへの変換は再エンコードされることを確認"""
+        converter = ImageConverter(skip_up_to_date=True)
+        dest = png_image.parent / "copied" / png_image.name
+        dest.parent.mkdir()
+        shutil.copy2(png_image, dest)
+
+        result = converter.convert(png_image, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        with Image.open(dest) as img:
+            assert img.format == "WEBP"
+
     @pytest.mark.xfail(reason="TLGImageDecoder.decodeが未実装")
     def test_convert_tlg_to_webp(self, temp_dir: Path) -> None:
         """TLGファイルをWebPに変換できることを確認（未実装のため失敗予定）"""
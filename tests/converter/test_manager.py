@@ -1,6 +1,8 @@
 """ConversionManagerのテスト"""
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Lock
 from unittest.mock import MagicMock, patch
@@ -16,6 +18,7 @@ from mnemonic.converter import (
     ConversionTask,
     RetryConfig,
 )
+from mnemonic.converter.manager import _backoff_delay, _batch_size, _get_usable_cpu_count
 
 
 class MockConverter(BaseConverter):
@@ -210,6 +213,12 @@ class TestConversionManagerInit:
         assert manager.progress_callback is progress_callback
 
 
+class ExtensionBasedMockConverter(MockConverter):
+    """拡張子のみで判定するテスト用のConverter"""
+
+    extension_based = True
+
+
 class TestConversionManagerGetConverterForFile:
     """ConversionManager.get_converter_for_fileのテスト"""
 
@@ -248,6 +257,55 @@ class TestConversionManagerGetConverterForFile:
 
         assert converter is first_converter
 
+    def test_get_converter_matches_uppercase_extension(self, tmp_path: Path) -> None:
+        """正常系: 拡張子の大文字小文字を区別しない"""
+        txt_converter = MockConverter(extensions=(".txt",))
+
+        manager = ConversionManager(converters=[txt_converter], max_workers=1)
+
+        assert manager.get_converter_for_file(tmp_path / "TEST.TXT") is txt_converter
+
+    def test_extension_based_converter_skips_can_convert(self, tmp_path: Path) -> None:
+        """正常系: 拡張子のみで判定するConverterはcan_convertを呼ばずに選ばれる"""
+        converter = ExtensionBasedMockConverter(extensions=(".txt",))
+
+        manager = ConversionManager(converters=[converter], max_workers=1)
+
+        with patch.object(converter, "can_convert") as mock_can_convert:
+            result = manager.get_converter_for_file(tmp_path / "test.txt")
+
+        assert result is converter
+        mock_can_convert.assert_not_called()
+
+    def test_content_based_converter_is_checked_before_later_converters(
+        self, tmp_path: Path
+    ) -> None:
+        """正常系: 先に登録された内容判定のConverterが拒否した場合は次の候補を返す"""
+        content_converter = MockConverter(extensions=(".txt",))
+        fallback_converter = ExtensionBasedMockConverter(extensions=(".txt",))
+
+        manager = ConversionManager(
+            converters=[content_converter, fallback_converter], max_workers=1
+        )
+
+        with patch.object(content_converter, "can_convert", return_value=False) as mock_check:
+            result = manager.get_converter_for_file(tmp_path / "test.txt")
+
+        assert result is fallback_converter
+        mock_check.assert_called_once_with(tmp_path / "test.txt")
+
+    def test_get_converter_accepts_str_path(self, tmp_path: Path) -> None:
+        """正常系: 文字列のパスでもConverterを取得できる"""
+        content_converter = MockConverter(extensions=(".txt",))
+
+        manager = ConversionManager(converters=[content_converter], max_workers=1)
+
+        with patch.object(content_converter, "can_convert", return_value=True) as mock_check:
+            result = manager.get_converter_for_file(str(tmp_path / "test.txt"))
+
+        assert result is content_converter
+        mock_check.assert_called_once_with(tmp_path / "test.txt")
+
 
 class TestConversionManagerConvertFiles:
     """ConversionManager.convert_filesのテスト"""
@@ -365,6 +423,210 @@ class TestConversionManagerConvertFiles:
         assert len(final_calls) > 0
 
 
+class TestConversionManagerIterConvertFiles:
+    """ConversionManager.iter_convert_filesとkeep_resultsのテスト"""
+
+    def test_iter_convert_files_yields_all_results(self, tmp_path: Path) -> None:
+        """正常系: 全ファイルの変換結果を逐次返す"""
+        files = []
+        for name in ("a.txt", "b.txt", "c.pdf"):
+            source = tmp_path / name
+            source.write_text("content")
+            files.append((source, tmp_path / f"out_{name}"))
+
+        callback = MagicMock()
+        manager = ConversionManager(
+            converters=[MockConverter(extensions=(".txt",))],
+            max_workers=2,
+            progress_callback=callback,
+        )
+
+        results = list(manager.iter_convert_files(files))
+
+        assert sorted(r.source_path.name for r in results) == ["a.txt", "b.txt", "c.pdf"]
+        statuses = {r.source_path.name: r.status for r in results}
+        assert statuses["c.pdf"] == ConversionStatus.SKIPPED
+        assert statuses["a.txt"] == ConversionStatus.SUCCESS
+        callback.assert_not_called()
+
+    def test_convert_files_without_keeping_results(self, tmp_path: Path) -> None:
+        """正常系: keep_results=Falseの場合は件数のみ集計する"""
+        files = []
+        for i in range(3):
+            source = tmp_path / f"source_{i}.txt"
+            source.write_text("content")
+            files.append((source, tmp_path / f"dest_{i}.txt"))
+
+        callback = MagicMock()
+        manager = ConversionManager(
+            converters=[MockConverter(extensions=(".txt",))],
+            max_workers=1,
+            progress_callback=callback,
+        )
+
+        summary = manager.convert_files(files, keep_results=False)
+
+        assert summary.total == 3
+        assert summary.success == 3
+        assert summary.results == []
+        assert callback.call_args_list[-1][0] == (3, 3)
+
+
+class CpuBoundMockConverter(MockConverter):
+    """プロセスプールで実行されるテスト用のConverter"""
+
+    cpu_bound = True
+
+
+class CrashOnceConverter(CpuBoundMockConverter):
+    """初回のcrash.txtの変換でワーカープロセスを異常終了させるテスト用のConverter"""
+
+    def __init__(self, marker: Path) -> None:
+        super().__init__(extensions=(".txt",))
+        self._marker = marker
+
+    def convert(self, source: Path, dest: Path) -> ConversionResult:
+        if source.name == "crash.txt" and not self._marker.exists():
+            self._marker.touch()
+            os._exit(1)
+        return super().convert(source, dest)
+
+
+class TestConversionManagerProcessPool:
+    """ConversionManagerのプロセスプール実行のテスト"""
+
+    def test_convert_files_with_processes(self, tmp_path: Path) -> None:
+        """正常系: CPUバウンドなConverterはプロセスプールで変換される"""
+        files = []
+        for i in range(3):
+            source = tmp_path / f"source_{i}.txt"
+            source.write_text(f"content {i}")
+            files.append((source, tmp_path / f"dest_{i}.txt"))
+
+        callback = MagicMock()
+        converter = CpuBoundMockConverter(extensions=(".txt",))
+        manager = ConversionManager(
+            converters=[converter],
+            max_workers=2,
+            progress_callback=callback,
+            use_processes=True,
+        )
+
+        summary = manager.convert_files(files)
+
+        assert summary.success == 3
+        assert {r.source_path for r in summary.results} == {source for source, _ in files}
+        # 変換は子プロセスで行われるため、親プロセスのConverterは呼ばれない
+        assert converter._call_count == 0
+        assert callback.call_args_list[-1][0] == (3, 3)
+
+    def test_recovers_from_worker_crash(self, tmp_path: Path) -> None:
+        """正常系: ワーカーが異常終了してもプールを作り直して変換を続ける"""
+        files = []
+        for name in ("a", "crash", "b"):
+            source = tmp_path / f"{name}.txt"
+            source.write_text("content")
+            files.append((source, tmp_path / f"{name}_out.txt"))
+
+        converter = CrashOnceConverter(marker=tmp_path / "crashed")
+        manager = ConversionManager(
+            converters=[converter],
+            retry_config=RetryConfig(max_attempts=2),
+            max_workers=1,
+            use_processes=True,
+        )
+
+        with patch("mnemonic.converter.manager._backoff_delay", return_value=0.0):
+            summary = manager.convert_files(files)
+
+        assert (tmp_path / "crashed").exists()
+        assert summary.total == 3
+        assert summary.success == 3
+
+    def test_process_tasks_are_submitted_in_batches(self, tmp_path: Path) -> None:
+        """正常系: プロセスプールへの初回投入はConverterごとのバッチにまとめられる"""
+        files = []
+        for i in range(10):
+            source = tmp_path / f"source_{i}.txt"
+            source.write_text(f"content {i}")
+            files.append((source, tmp_path / f"dest_{i}.txt"))
+
+        converter = CpuBoundMockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=1, use_processes=True)
+
+        # 投入回数を数えるため、同一プロセス内で実行されるスレッドプールに差し替える
+        with (
+            patch("mnemonic.converter.manager.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch.object(converter, "convert_batch", wraps=converter.convert_batch) as mock_batch,
+        ):
+            summary = manager.convert_files(files)
+
+        assert summary.success == 10
+        # 10件を1ワーカー×4バッチに分割: 3, 3, 3, 1件
+        assert [len(c.args[0]) for c in mock_batch.call_args_list] == [3, 3, 3, 1]
+
+    def test_non_cpu_bound_converter_runs_in_threads(self, tmp_path: Path) -> None:
+        """正常系: CPUバウンドでないConverterはuse_processes有効時もスレッドで変換される"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        unsupported = tmp_path / "source.pdf"
+        unsupported.write_text("pdf content")
+
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=2, use_processes=True)
+
+        summary = manager.convert_files(
+            [(source, tmp_path / "dest.txt"), (unsupported, tmp_path / "dest.pdf")]
+        )
+
+        assert summary.success == 1
+        assert summary.skipped == 1
+        assert converter._call_count == 1
+
+
+class TestConversionManagerPoolReuse:
+    """ConversionManagerのワーカープール再利用のテスト"""
+
+    def test_pool_is_shut_down_after_call_without_context(self, tmp_path: Path) -> None:
+        """正常系: withブロック外では呼び出しごとにプールを破棄する"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+
+        manager = ConversionManager(converters=[MockConverter()], max_workers=1)
+        manager.convert_files([(source, tmp_path / "dest.txt")])
+
+        assert manager._thread_pool is None
+
+    def test_pool_is_reused_within_context(self, tmp_path: Path) -> None:
+        """正常系: withブロック内では呼び出し間で同じプールを再利用する"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+
+        with ConversionManager(converters=[MockConverter()], max_workers=1) as manager:
+            manager.convert_files([(source, tmp_path / "dest1.txt")])
+            first_pool = manager._thread_pool
+            summary = manager.convert_files([(source, tmp_path / "dest2.txt")])
+
+            assert first_pool is not None
+            assert manager._thread_pool is first_pool
+            assert summary.success == 1
+
+        assert manager._thread_pool is None
+
+    def test_close_shuts_down_pools(self, tmp_path: Path) -> None:
+        """正常系: closeでプールを破棄し、以降は呼び出しごとに破棄する"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+
+        manager = ConversionManager(converters=[MockConverter()], max_workers=1).__enter__()
+        manager.convert_files([(source, tmp_path / "dest.txt")])
+        manager.close()
+
+        assert manager._thread_pool is None
+        manager.convert_files([(source, tmp_path / "dest.txt")])
+        assert manager._thread_pool is None
+
+
 class TestConversionManagerRetry:
     """ConversionManagerのリトライ機能のテスト"""
 
@@ -382,7 +644,7 @@ class TestConversionManagerRetry:
             converters=[converter], retry_config=retry_config, max_workers=1
         )
 
-        with patch("time.sleep"):
+        with patch("mnemonic.converter.manager._backoff_delay", return_value=0.0):
             summary = manager.convert_files([(source, dest)])
 
         assert summary.success == 1
@@ -403,7 +665,7 @@ class TestConversionManagerRetry:
             converters=[converter], retry_config=retry_config, max_workers=1
         )
 
-        with patch("time.sleep"):
+        with patch("mnemonic.converter.manager._backoff_delay", return_value=0.0):
             summary = manager.convert_files([(source, dest)])
 
         assert summary.success == 0
@@ -424,15 +686,20 @@ class TestConversionManagerRetry:
             converters=[converter], retry_config=retry_config, max_workers=1
         )
 
-        sleep_calls: list[float] = []
-        with patch("time.sleep", side_effect=lambda x: sleep_calls.append(x)):
+        delays: list[float] = []
+
+        def record_delay(config: RetryConfig, retry_count: int) -> float:
+            delays.append(_backoff_delay(config, retry_count))
+            return 0.0
+
+        with patch("mnemonic.converter.manager._backoff_delay", side_effect=record_delay):
             manager.convert_files([(source, dest)])
 
         # リトライ1回目: 1.0 * (2.0 ** 0) = 1.0秒
         # リトライ2回目: 1.0 * (2.0 ** 1) = 2.0秒
-        assert len(sleep_calls) == 2
-        assert sleep_calls[0] == 1.0
-        assert sleep_calls[1] == 2.0
+        assert len(delays) == 2
+        assert delays[0] == 1.0
+        assert delays[1] == 2.0
 
     def test_retry_on_exception(self, tmp_path: Path) -> None:
         """正常系: 例外発生時もリトライが行われる"""
@@ -447,12 +714,88 @@ class TestConversionManagerRetry:
             converters=[converter], retry_config=retry_config, max_workers=1
         )
 
-        with patch("time.sleep"):
+        with patch("mnemonic.converter.manager._backoff_delay", return_value=0.0):
+            summary = manager.convert_files([(source, dest)])
+
+        assert summary.failed == 1
+        assert converter._call_count == 2
+
+    @pytest.mark.parametrize(
+        "use_processes",
+        [
+            pytest.param(False, id="正常系: スレッドプールで変換"),
+            pytest.param(True, id="正常系: プロセスプールへバッチで変換"),
+        ],
+    )
+    def test_retry_exhausted_message_is_consistent(
+        self, tmp_path: Path, use_processes: bool
+    ) -> None:
+        """正常系: 例外で失敗し続けた場合の結果はスレッドとプロセスで同じメッセージになる"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        converter = CpuBoundMockConverter(extensions=(".txt",), raise_exception=True)
+        manager = ConversionManager(
+            converters=[converter],
+            retry_config=RetryConfig(max_attempts=2),
+            max_workers=1,
+            use_processes=use_processes,
+        )
+
+        # 同一プロセス内で実行されるスレッドプールに差し替え、バッチの経路を通す
+        with (
+            patch("mnemonic.converter.manager.ProcessPoolExecutor", ThreadPoolExecutor),
+            patch("mnemonic.converter.manager._backoff_delay", return_value=0.0),
+        ):
             summary = manager.convert_files([(source, dest)])
 
         assert summary.failed == 1
+        assert summary.results[0].message == "最大リトライ回数超過: 変換中にエラーが発生しました"
         assert converter._call_count == 2
 
+    def test_backoff_does_not_block_worker(self, tmp_path: Path) -> None:
+        """正常系: バックオフ中も他のファイルの変換がワーカーで進む"""
+        files = []
+        for name in ("a", "b"):
+            source = tmp_path / f"{name}.txt"
+            source.write_text("content")
+            files.append((source, tmp_path / f"{name}_out.txt"))
+
+        # 最初の1回（a.txt）だけ失敗するConverter
+        converter = MockConverter(extensions=(".txt",), fail_count=1)
+        retry_config = RetryConfig(max_attempts=2, backoff_base=0.2)
+
+        manager = ConversionManager(
+            converters=[converter], retry_config=retry_config, max_workers=1
+        )
+
+        summary = manager.convert_files(files)
+
+        assert summary.success == 2
+        # a.txtのバックオフ中にb.txtが先に完了する
+        assert [r.source_path.name for r in summary.results] == ["b.txt", "a.txt"]
+
+    def test_skipped_result_is_not_retried(self, tmp_path: Path) -> None:
+        """正常系: スキップ結果はリトライしない"""
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        converter = MockConverter(extensions=(".txt",))
+        skipped = ConversionResult(
+            source_path=source, dest_path=None, status=ConversionStatus.SKIPPED
+        )
+        manager = ConversionManager(
+            converters=[converter], retry_config=RetryConfig(max_attempts=3), max_workers=1
+        )
+
+        with patch.object(converter, "convert", return_value=skipped) as mock_convert:
+            summary = manager.convert_files([(source, dest)])
+
+        assert summary.skipped == 1
+        assert mock_convert.call_count == 1
+
 
 class TestConversionManagerConvertDirectory:
     """ConversionManager.convert_directoryのテスト"""
@@ -546,6 +889,103 @@ class TestConversionManagerConvertDirectory:
         assert "sub" in str(result.dest_path)
         assert "nested" in str(result.dest_path)
 
+    def test_convert_directory_relative_source(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """正常系: カレントディレクトリを変換元にしても変換先パスが正しく求まる"""
+        source_dir = tmp_path / "source"
+        (source_dir / "sub").mkdir(parents=True)
+        (source_dir / "sub" / "file.txt").write_text("content")
+        dest_dir = tmp_path / "dest"
+        monkeypatch.chdir(source_dir)
+
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=1)
+
+        summary = manager.convert_directory(Path("."), dest_dir)
+
+        assert summary.results[0].source_path == Path("sub") / "file.txt"
+        assert summary.results[0].dest_path == dest_dir / "sub" / "file.txt"
+
+    def test_convert_directory_many_subdirectories(self, tmp_path: Path) -> None:
+        """正常系: 複数階層・複数のサブディレクトリを並列に走査できる"""
+        source_dir = tmp_path / "source"
+        for i in range(5):
+            nested = source_dir / f"dir{i}" / "a" / "b"
+            nested.mkdir(parents=True)
+            (nested / f"file{i}.txt").write_text("content")
+            (source_dir / f"dir{i}" / f"top{i}.txt").write_text("content")
+
+        dest_dir = tmp_path / "dest"
+
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=2)
+
+        summary = manager.convert_directory(source_dir, dest_dir)
+
+        assert summary.total == 10
+        expected = {dest_dir / f"dir{i}" / "a" / "b" / f"file{i}.txt" for i in range(5)}
+        expected |= {dest_dir / f"dir{i}" / f"top{i}.txt" for i in range(5)}
+        assert {r.dest_path for r in summary.results} == expected
+
+    def test_convert_directory_resolves_converter_once_per_file(self, tmp_path: Path) -> None:
+        """正常系: Converterの判定はファイルごとに1回だけ行われる"""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file1.txt").write_text("content1")
+        (source_dir / "file2.txt").write_text("content2")
+
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=1)
+
+        with patch.object(
+            manager, "get_converter_for_file", wraps=manager.get_converter_for_file
+        ) as mock_dispatch:
+            summary = manager.convert_directory(source_dir, tmp_path / "dest")
+
+        assert summary.success == 2
+        assert mock_dispatch.call_count == 2
+
+    def test_convert_directory_nonexistent_source(self, tmp_path: Path) -> None:
+        """正常系: 存在しないディレクトリは空として扱う"""
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=1)
+
+        summary = manager.convert_directory(tmp_path / "missing", tmp_path / "dest")
+
+        assert summary.total == 0
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="シンボリックリンク非対応環境")
+    def test_convert_directory_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        """正常系: ディレクトリへのシンボリックリンクは辿らない"""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("content")
+        (source_dir / "loop").symlink_to(source_dir, target_is_directory=True)
+
+        converter = MockConverter(extensions=(".txt",))
+        manager = ConversionManager(converters=[converter], max_workers=1)
+
+        summary = manager.convert_directory(source_dir, tmp_path / "dest")
+
+        assert summary.total == 1
+
+
+class TestBatchSize:
+    """_batch_sizeのテスト"""
+
+    @pytest.mark.parametrize(
+        "task_count, max_workers, expected",
+        [
+            pytest.param(1, 4, 1, id="正常系: タスクが少ない場合は1件ずつ"),
+            pytest.param(10, 1, 3, id="正常系: ワーカーあたり4バッチに分割"),
+            pytest.param(10000, 2, 32, id="正常系: 上限は32件"),
+        ],
+    )
+    def test_batch_size(self, task_count: int, max_workers: int, expected: int) -> None:
+        """タスク数とワーカー数からバッチの大きさが決まる"""
+        assert _batch_size(task_count, max_workers) == expected
+
 
 class TestCalculateWorkers:
     """ConversionManager.calculate_workersのテスト"""
@@ -553,13 +993,14 @@ class TestCalculateWorkers:
     def test_memory_based_calculation(self) -> None:
         """正常系: メモリベースのワーカー数計算"""
         # 2000MBなら4ワーカー
-        workers = ConversionManager.calculate_workers(available_memory_mb=2000)
-        assert workers == 4
+        with patch("mnemonic.converter.manager._get_usable_cpu_count", return_value=8):
+            workers = ConversionManager.calculate_workers(available_memory_mb=2000)
+            assert workers == 4
 
     def test_cpu_based_limit(self) -> None:
         """正常系: CPUコア数による制限"""
         # 十分なメモリがあってもCPUコア数で制限される
-        with patch("os.cpu_count", return_value=2):
+        with patch("mnemonic.converter.manager._get_usable_cpu_count", return_value=2):
             workers = ConversionManager.calculate_workers(available_memory_mb=10000)
             assert workers == 2
 
@@ -573,7 +1014,7 @@ class TestCalculateWorkers:
         # 4GB = 4096MB
         with (
             patch("mnemonic.converter.manager._get_available_memory_mb", return_value=4096),
-            patch("os.cpu_count", return_value=8),
+            patch("mnemonic.converter.manager._get_usable_cpu_count", return_value=8),
         ):
             workers = ConversionManager.calculate_workers()
             # 4096 // 500 = 8, min(8, 8) = 8
@@ -583,12 +1024,35 @@ class TestCalculateWorkers:
         """正常系: psutilが利用できない場合のフォールバック"""
         with (
             patch("mnemonic.converter.manager._get_available_memory_mb", return_value=None),
-            patch("os.cpu_count", return_value=4),
+            patch("mnemonic.converter.manager._get_usable_cpu_count", return_value=4),
         ):
             # psutilがない場合はCPUコア数のみで計算
             workers = ConversionManager.calculate_workers()
             assert workers == 4
 
+    def test_usable_cpu_count_respects_affinity(self) -> None:
+        """正常系: CPUアフィニティで制限されたコア数を使用する"""
+        with (
+            patch("os.sched_getaffinity", return_value={0, 1}, create=True),
+            patch("os.cpu_count", return_value=16),
+        ):
+            assert _get_usable_cpu_count() == 2
+
+    def test_public_usable_cpu_count_respects_affinity(self) -> None:
+        """正常系: ConversionManager.usable_cpu_countもCPUアフィニティを反映する"""
+        with (
+            patch("os.sched_getaffinity", return_value={0, 1, 2}, create=True),
+            patch("os.cpu_count", return_value=16),
+        ):
+            assert ConversionManager.usable_cpu_count() == 3
+
+    def test_usable_cpu_count_without_affinity(self) -> None:
+        """正常系: sched_getaffinityが無い環境ではos.cpu_countを使用する"""
+        with patch("mnemonic.converter.manager.os", wraps=os) as mock_os:
+            del mock_os.sched_getaffinity
+            mock_os.cpu_count.return_value = 6
+            assert _get_usable_cpu_count() == 6
+
 
 class TestConversionManagerSummary:
     """ConversionManagerのサマリー生成テスト"""
@@ -1,11 +1,13 @@
 """ScriptAdjusterのテスト"""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from mnemonic.converter.base import ConversionStatus
-from mnemonic.converter.script import AdjustmentRule, ScriptAdjuster
+from mnemonic.converter.manager import ConversionManager
+from mnemonic.converter.script import AdjustmentRule, ScriptAdjuster, _is_literal_rule
 
 
 @pytest.fixture
@@ -34,6 +36,11 @@ class TestAdjustmentRule:
         assert rule.replacement == "replaced"
         assert rule.description == "テストルール"
 
+    def test_anchor_defaults_to_none(self) -> None:
+        """anchorのデフォルト値がNoneであることを確認する"""
+        rule = AdjustmentRule(pattern=r"test", replacement="replaced", description="テスト")
+        assert rule.anchor is None
+
     def test_is_frozen_dataclass(self) -> None:
         """AdjustmentRuleがイミュータブルであることを確認する"""
         rule = AdjustmentRule(
@@ -77,6 +84,90 @@ class TestScriptAdjusterInit:
         adjuster = ScriptAdjuster(add_encoding_directive=False)
         assert adjuster.add_encoding_directive is False
 
+    def test_default_copy_unchanged_is_false(self) -> None:
+        """デフォルトでcopy_unchangedがFalseであることを確認する"""
+        adjuster = ScriptAdjuster()
+        assert adjuster.copy_unchanged is False
+
+    def test_is_cpu_bound(self) -> None:
+        """プロセスプールでの実行対象であることを確認する"""
+        assert ScriptAdjuster.cpu_bound is True
+
+
+class TestScriptAdjusterCache:
+    """ScriptAdjusterの調整結果キャッシュのテスト"""
+
+    def test_cache_is_disabled_by_default(self) -> None:
+        """デフォルトではキャッシュを使用しないことを確認する"""
+        assert ScriptAdjuster().cache_dir is None
+
+    def test_second_conversion_uses_cache(self, tmp_path: Path) -> None:
+        """同じ内容の2回目の変換では調整を省略することを確認する"""
+        cache_dir = tmp_path / "cache"
+        source = tmp_path / "test.ks"
+        source.write_text('Plugins.link("test.dll");', encoding="utf-8")
+        first = ScriptAdjuster(cache_dir=cache_dir)
+        first_result = first.convert(source, tmp_path / "first.ks")
+
+        second = ScriptAdjuster(cache_dir=cache_dir)
+        with patch.object(second, "adjust_content") as mock_adjust:
+            second_result = second.convert(source, tmp_path / "second.ks")
+
+        mock_adjust.assert_not_called()
+        assert second_result.status == ConversionStatus.SUCCESS
+        assert second_result.message == first_result.message
+        assert (tmp_path / "second.ks").read_bytes() == (tmp_path / "first.ks").read_bytes()
+
+    def test_cached_skip_result(self, tmp_path: Path) -> None:
+        """調整不要だった結果もキャッシュされることを確認する"""
+        cache_dir = tmp_path / "cache"
+        source = tmp_path / "test.ks"
+        source.write_text("var x = 1;", encoding="utf-8")
+        ScriptAdjuster(cache_dir=cache_dir).convert(source, tmp_path / "first.ks")
+
+        adjuster = ScriptAdjuster(cache_dir=cache_dir)
+        with patch.object(adjuster, "adjust_content") as mock_adjust:
+            result = adjuster.convert(source, tmp_path / "second.ks")
+
+        mock_adjust.assert_not_called()
+        assert result.status == ConversionStatus.SKIPPED
+        assert not (tmp_path / "second.ks").exists()
+
+    def test_rule_change_invalidates_cache(self, tmp_path: Path) -> None:
+        """ルールが変わるとキャッシュを使わないことを確認する"""
+        cache_dir = tmp_path / "cache"
+        source = tmp_path / "test.ks"
+        source.write_text("OLD_FUNCTION();", encoding="utf-8")
+        ScriptAdjuster(cache_dir=cache_dir).convert(source, tmp_path / "first.ks")
+
+        custom_rules = [
+            AdjustmentRule(pattern="OLD_FUNCTION", replacement="NEW_FUNCTION", description="変更")
+        ]
+        result = ScriptAdjuster(rules=custom_rules, cache_dir=cache_dir).convert(
+            source, tmp_path / "second.ks"
+        )
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert (tmp_path / "second.ks").read_text(encoding="utf-8") == "NEW_FUNCTION();"
+
+
+class TestScriptAdjusterProcessPool:
+    """ConversionManagerのプロセスプール経由での変換テスト"""
+
+    def test_converts_in_process_pool(self, tmp_path: Path) -> None:
+        """プロセスプールでスクリプトが調整されることを確認する"""
+        source = tmp_path / "scenario.ks"
+        source.write_text('Plugins.link("test.dll");\n', encoding="utf-8")
+        dest = tmp_path / "out" / "scenario.ks"
+
+        manager = ConversionManager(
+            converters=[ScriptAdjuster()], max_workers=1, use_processes=True
+        )
+        summary = manager.convert_files([(source, dest)])
+
+        assert summary.success == 1
+        assert "// Plugins.link" in dest.read_text(encoding="utf-8")
+
 
 class TestScriptAdjusterDefaultRules:
     """DEFAULT_RULESのテスト"""
@@ -231,6 +322,143 @@ Plugins.link("c.dll");
         assert "OLD_FUNCTION()" not in adjusted
         assert count == 1
 
+    def test_applies_multiple_rules(self) -> None:
+        """複数ルールを適用し、各ルールの後方参照を展開できることを確認する"""
+        custom_rules = [
+            AdjustmentRule(
+                pattern=r"^(\s*)(Plugins\.link\(.*?\);)",
+                replacement=r"\1// \2",
+                description="プラグイン無効化",
+            ),
+            AdjustmentRule(
+                pattern=r"OLD_(\w+)\(\)",
+                replacement=r"NEW_\1()",
+                description="関数名変更",
+            ),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        content = '  Plugins.link("a.dll");\nvar x = OLD_FUNC();\nvar y = OLD_CALL();\n'
+        adjusted, count = adjuster.adjust_content(content)
+
+        assert adjusted == (
+            '  // Plugins.link("a.dll");\nvar x = NEW_FUNC();\nvar y = NEW_CALL();\n'
+        )
+        assert count == 3
+
+    def test_skips_content_without_any_match(self) -> None:
+        """どのルールもマッチしない内容は変更しないことを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"OLD_(\w+)", replacement=r"NEW_\1", description="1"),
+            AdjustmentRule(pattern=r"foo+", replacement="bar", description="2"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("var x = 1;\n")
+
+        assert adjusted == "var x = 1;\n"
+        assert count == 0
+
+    def test_applies_rules_with_numbered_backreference(self) -> None:
+        """パターン内の番号付き後方参照を含むルールも他のルールと併用できることを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"(\w+)=\1", replacement="same", description="1"),
+            AdjustmentRule(pattern=r"OLD_(\w+)", replacement=r"NEW_\1", description="2"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("a=a OLD_x")
+
+        assert adjusted == "same NEW_x"
+        assert count == 2
+
+    def test_applies_chained_rules_in_order(self) -> None:
+        """後のルールが前のルールの置換結果にも適用されることを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"a(\d)", replacement=r"b\1", description="1"),
+            AdjustmentRule(pattern=r"b(\d)", replacement=r"c\1", description="2"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("a1")
+
+        assert adjusted == "c1"
+        assert count == 2
+
+    def test_falls_back_when_rules_cannot_be_fused(self) -> None:
+        """グループ名が衝突するルールも順に適用できることを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"(?P<name>foo)", replacement="bar", description="1"),
+            AdjustmentRule(pattern=r"(?P<name>baz)", replacement="qux", description="2"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("foo baz")
+
+        assert adjusted == "bar qux"
+        assert count == 2
+
+    def test_applies_literal_and_regex_rules(self) -> None:
+        """リテラルのルールと正規表現のルールを併用できることを確認する"""
+        custom_rules = [
+            AdjustmentRule(
+                pattern="MIDISoundBuffer",
+                replacement="WaveSoundBuffer",
+                description="クラス名変更",
+            ),
+            *ScriptAdjuster.DEFAULT_RULES,
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        content = 'Plugins.link("a.dll");\nvar a = new MIDISoundBuffer();\nMIDISoundBuffer.x;\n'
+        adjusted, count = adjuster.adjust_content(content)
+
+        assert "MIDISoundBuffer" not in adjusted
+        assert adjusted.count("WaveSoundBuffer") == 2
+        assert adjusted.startswith('// Plugins.link("a.dll");')
+        assert count == 3
+
+    def test_skips_rule_when_anchor_is_absent(self) -> None:
+        """アンカー文字列を含まない内容ではルールの走査を省略することを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"fo+", replacement="bar", description="1", anchor="foo"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        # パターンにはマッチするがアンカーを含まないため走査されない
+        adjusted, count = adjuster.adjust_content("fo")
+
+        assert adjusted == "fo"
+        assert count == 0
+
+    def test_applies_only_rules_whose_anchor_is_present(self) -> None:
+        """アンカーを含むルールのみを組み合わせて適用できることを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"A(\d)", replacement=r"a\1", description="1", anchor="A"),
+            AdjustmentRule(pattern=r"B(\d)", replacement=r"b\1", description="2", anchor="B"),
+            AdjustmentRule(pattern=r"C(\d)", replacement=r"c\1", description="3", anchor="C"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("A1 C2 A3")
+
+        assert adjusted == "a1 c2 a3"
+        assert count == 3
+
+    def test_applies_literal_and_regex_rules_in_declared_order(self) -> None:
+        """リテラルのルールと正規表現のルールが定義順に適用されることを確認する"""
+        custom_rules = [
+            AdjustmentRule(pattern=r"foo(\d)", replacement=r"bar\1", description="1"),
+            AdjustmentRule(pattern="bar1", replacement="baz", description="2"),
+            AdjustmentRule(pattern="qux", replacement="foo2", description="3"),
+        ]
+        adjuster = ScriptAdjuster(rules=custom_rules)
+
+        adjusted, count = adjuster.adjust_content("foo1 qux")
+
+        assert adjusted == "baz foo2"
+        assert count == 3
+
     def test_preserves_japanese_comments(self, adjuster: ScriptAdjuster) -> None:
         """日本語コメントを保持することを確認する"""
         content = """// これは日本語のコメントです
@@ -247,6 +475,23 @@ var x = 1;  // 変数xを初期化
         assert count == 0
 
 
+class TestIsLiteralRule:
+    """_is_literal_ruleのテスト"""
+
+    @pytest.mark.parametrize(
+        "pattern, replacement, expected",
+        [
+            pytest.param("MIDISoundBuffer", "Wave", True, id="正常系: 英数字のみはリテラル"),
+            pytest.param("Plugins.link", "x", False, id="正常系: メタ文字を含むパターンは正規表現"),
+            pytest.param("foo", r"\g<0>bar", False, id="正常系: 後方参照を含む置換は正規表現"),
+        ],
+    )
+    def test_is_literal_rule(self, pattern: str, replacement: str, expected: bool) -> None:
+        """パターンと置換文字列からリテラルのルールかを判定することを確認する"""
+        rule = AdjustmentRule(pattern=pattern, replacement=replacement, description="テスト")
+        assert _is_literal_rule(rule) is expected
+
+
 class TestScriptAdjusterAddStartupDirective:
     """ScriptAdjuster.add_startup_directiveのテスト"""
 
@@ -303,6 +548,31 @@ class TestScriptAdjusterConvert:
         assert "// Disabled for Android" in converted
         assert "[message" in converted
 
+    @pytest.mark.parametrize(
+        "repeat",
+        [
+            pytest.param(1, id="正常系: 小さなファイル"),
+            pytest.param(5000, id="正常系: メモリマップで読み込む大きなファイル"),
+        ],
+    )
+    def test_normalizes_line_endings_to_lf(
+        self, adjuster: ScriptAdjuster, tmp_path: Path, repeat: int
+    ) -> None:
+        """CRLF/CRの改行コードをLFに統一して出力することを確認する"""
+        source = tmp_path / "test.ks"
+        dest = tmp_path / "output" / "test.ks"
+        raw = b'Plugins.link("test.dll");\r\n' + b"[p]\r\n[cm]\r" * repeat
+        source.write_bytes(raw)
+
+        result = adjuster.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert result.bytes_before == len(raw)
+        converted = dest.read_bytes()
+        assert b"\r" not in converted
+        assert converted.startswith(b'// Plugins.link("test.dll"); // Disabled for Android\n')
+        assert converted.count(b"\n") == 1 + 2 * repeat
+
     def test_converts_tjs_file_with_plugin_calls(
         self, adjuster: ScriptAdjuster, tmp_path: Path
     ) -> None:
@@ -373,6 +643,32 @@ var x = 1;
         result = adjuster.convert(source, dest)
 
         assert result.status == ConversionStatus.SKIPPED
+        assert result.dest_path is None
+        assert not dest.exists()
+
+    def test_copies_unchanged_file_when_enabled(self, tmp_path: Path) -> None:
+        """copy_unchanged有効時は調整不要なファイルをそのままコピーすることを確認する"""
+        source = tmp_path / "clean.ks"
+        dest = tmp_path / "output" / "clean.ks"
+        content = '[message text="日本語"]\n'
+        source.write_text(content, encoding="utf-8")
+
+        result = ScriptAdjuster(copy_unchanged=True).convert(source, dest)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert result.dest_path == dest
+        assert dest.read_bytes() == source.read_bytes()
+        assert result.bytes_after == result.bytes_before
+
+    def test_copy_unchanged_allows_same_source_and_dest(self, tmp_path: Path) -> None:
+        """copy_unchanged有効時に変換元と変換先が同じでも失敗しないことを確認する"""
+        source = tmp_path / "clean.ks"
+        source.write_text("[wait time=1000]\n", encoding="utf-8")
+
+        result = ScriptAdjuster(copy_unchanged=True).convert(source, source)
+
+        assert result.status == ConversionStatus.SKIPPED
+        assert source.read_text(encoding="utf-8") == "[wait time=1000]\n"
 
     def test_records_bytes_before_and_after(self, adjuster: ScriptAdjuster, tmp_path: Path) -> None:
         """変換前後のバイト数を記録することを確認する"""
@@ -399,6 +695,60 @@ var x = 1;
 
         assert result.status == ConversionStatus.FAILED
 
+    def test_returns_failed_for_unreadable_source(
+        self, adjuster: ScriptAdjuster, tmp_path: Path
+    ) -> None:
+        """読み込めないパスの場合FAILEDを返すことを確認する"""
+        source = tmp_path / "directory.ks"
+        source.mkdir()
+        dest = tmp_path / "output.ks"
+
+        result = adjuster.convert(source, dest)
+
+        assert result.status == ConversionStatus.FAILED
+        assert not dest.exists()
+
+    def test_records_byte_size_of_multibyte_content(
+        self, adjuster: ScriptAdjuster, tmp_path: Path
+    ) -> None:
+        """マルチバイト文字を含む場合もバイト単位のサイズを記録することを確認する"""
+        source = tmp_path / "test.ks"
+        dest = tmp_path / "output.ks"
+        source.write_text('Plugins.link("日本語.dll");', encoding="utf-8")
+
+        result = adjuster.convert(source, dest)
+
+        assert result.bytes_before == source.stat().st_size
+        assert result.bytes_after == dest.stat().st_size
+
+    def test_converts_large_file(self, adjuster: ScriptAdjuster, tmp_path: Path) -> None:
+        """メモリマップで読み込む大きなファイルも調整できることを確認する"""
+        source = tmp_path / "large.ks"
+        dest = tmp_path / "output.ks"
+        padding = "; 日本語のコメント行です\n" * 5000
+        source.write_text(padding + 'Plugins.link("test.dll");\n', encoding="utf-8")
+
+        result = adjuster.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert result.bytes_before == source.stat().st_size
+        adjusted = dest.read_text(encoding="utf-8")
+        assert adjusted.startswith(padding)
+        assert "// Disabled for Android" in adjusted
+
+    def test_returns_failed_for_invalid_utf8(
+        self, adjuster: ScriptAdjuster, tmp_path: Path
+    ) -> None:
+        """UTF-8としてデコードできない場合FAILEDを返すことを確認する"""
+        source = tmp_path / "sjis.ks"
+        source.write_bytes("日本語".encode("shift_jis"))
+        dest = tmp_path / "output.ks"
+
+        result = adjuster.convert(source, dest)
+
+        assert result.status == ConversionStatus.FAILED
+        assert not dest.exists()
+
     def test_creates_dest_directory_if_not_exists(
         self, adjuster: ScriptAdjuster, tmp_path: Path
     ) -> None:
@@ -1,12 +1,15 @@
 """VideoConverterのテスト"""
 
+import json
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from mnemonic.converter import ConversionStatus, VideoConverter, VideoInfo
+from mnemonic.converter.video import _detect_ffmpeg
 
 
 class TestVideoInfo:
@@ -84,6 +87,21 @@ class TestVideoConverterInit:
         assert converter._audio_codec == "opus"
         assert converter._timeout == 600
 
+    def test_default_output_options(self) -> None:
+        """正常系: デフォルトの出力オプションをテスト"""
+        converter = VideoConverter()
+        assert converter._output_options == {
+            "threads": 0,
+            "movflags": "+faststart",
+            "preset": "veryfast",
+            "crf": 23,
+        }
+
+    def test_preset_and_crf_can_be_omitted(self) -> None:
+        """正常系: presetとcrfにNoneを指定すると出力オプションに含めないことをテスト"""
+        converter = VideoConverter(preset=None, crf=None, threads=4)
+        assert converter._output_options == {"threads": 4, "movflags": "+faststart"}
+
 
 class TestVideoConverterSupportedExtensions:
     """VideoConverter.supported_extensionsのテスト"""
@@ -135,6 +153,13 @@ class TestVideoConverterCanConvert:
 class TestVideoConverterIsFFmpegAvailable:
     """VideoConverter.is_ffmpeg_availableのテスト"""
 
+    @pytest.fixture(autouse=True)
+    def clear_ffmpeg_cache(self) -> Iterator[None]:
+        """FFmpeg確認結果のキャッシュをテストごとにクリアする"""
+        _detect_ffmpeg.cache_clear()
+        yield
+        _detect_ffmpeg.cache_clear()
+
     def test_ffmpeg_available(self) -> None:
         """正常系: FFmpegが利用可能な場合Trueを返すことをテスト"""
         converter = VideoConverter()
@@ -166,6 +191,17 @@ class TestVideoConverterIsFFmpegAvailable:
 
         assert result is False
 
+    def test_result_is_cached(self) -> None:
+        """正常系: 2回目以降の確認ではFFmpegを起動しないことをテスト"""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            first = VideoConverter().is_ffmpeg_available()
+            second = VideoConverter().is_ffmpeg_available()
+
+        assert first is True
+        assert second is True
+        mock_run.assert_called_once()
+
 
 class TestVideoConverterGetVideoInfo:
     """VideoConverter.get_video_infoのテスト"""
@@ -203,8 +239,8 @@ class TestVideoConverterGetVideoInfo:
             },
         }
 
-        with patch("ffmpeg.probe") as mock_probe:
-            mock_probe.return_value = mock_probe_result
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(mock_probe_result).encode())
             info = converter.get_video_info(video_file)
 
         assert info.width == 640
@@ -214,6 +250,11 @@ class TestVideoConverterGetVideoInfo:
         assert info.video_codec == "mpeg1video"
         assert info.audio_codec == "mp2"
         assert info.bitrate == 1500000
+        args = mock_run.call_args.args[0]
+        assert args[0] == "ffprobe"
+        assert "-show_streams" not in args
+        assert args[args.index("-show_entries") + 1].startswith("stream=")
+        assert mock_run.call_args.kwargs["timeout"] == 300
 
     def test_get_video_info_no_audio_stream(self, tmp_path: Path) -> None:
         """正常系: 音声ストリームがない動画の情報を取得することをテスト"""
@@ -236,8 +277,8 @@ class TestVideoConverterGetVideoInfo:
             },
         }
 
-        with patch("ffmpeg.probe") as mock_probe:
-            mock_probe.return_value = mock_probe_result
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(mock_probe_result).encode())
             info = converter.get_video_info(video_file)
 
         assert info.has_audio is False
@@ -249,14 +290,26 @@ class TestVideoConverterGetVideoInfo:
         invalid_file = tmp_path / "invalid.mpg"
         invalid_file.write_bytes(b"not a video")
 
-        with patch("ffmpeg.probe") as mock_probe:
-            mock_probe.side_effect = Exception("Invalid video file")
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(1, "ffprobe")
 
             with pytest.raises(ValueError) as exc_info:
                 converter.get_video_info(invalid_file)
 
             assert "動画情報を取得できません" in str(exc_info.value)
 
+    def test_get_video_info_probe_timeout(self, tmp_path: Path) -> None:
+        """異常系: ffprobeがタイムアウトした場合ValueErrorを発生させることをテスト"""
+        converter = VideoConverter(timeout=5)
+        video_file = tmp_path / "slow.mpg"
+        video_file.write_bytes(b"dummy video content")
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.TimeoutExpired("ffprobe", 5)
+
+            with pytest.raises(ValueError, match="動画情報を取得できません"):
+                converter.get_video_info(video_file)
+
 
 class TestVideoConverterConvert:
     """VideoConverter.convertのテスト"""
@@ -298,8 +351,8 @@ class TestVideoConverterConvert:
         assert result.status == ConversionStatus.SUCCESS
         assert result.source_path == source
         assert result.dest_path == dest
-        assert result.bytes_before > 0
-        assert result.bytes_after > 0
+        assert result.bytes_before == len(b"dummy video content")
+        assert result.bytes_after == len(b"converted video content larger than input")
 
     def test_convert_ffmpeg_error(self, tmp_path: Path) -> None:
         """異常系: FFmpegがエラーを返す場合FAILEDを返すことをテスト"""
@@ -378,6 +431,9 @@ class TestVideoConverterConvert:
         mock_output.assert_called_once()
         call_kwargs = mock_output.call_args[1]
         assert call_kwargs.get("vcodec") == "libx265"
+        assert call_kwargs.get("preset") == "veryfast"
+        assert call_kwargs.get("crf") == 23
+        assert call_kwargs.get("movflags") == "+faststart"
         assert call_kwargs.get("acodec") == "opus"
 
 
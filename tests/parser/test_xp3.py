@@ -4,6 +4,8 @@ TDD Step 3: XP3Archive, XP3EncryptionChecker の実装テスト。
 実装後のため、実際の動作を検証する。
 """
 
+import struct
+import zlib
 from pathlib import Path
 
 import pytest
@@ -15,6 +17,47 @@ from mnemonic.parser import (
     XP3EncryptionChecker,
     XP3EncryptionError,
 )
+from mnemonic.parser.xp3 import XP3_MAGIC
+
+
+def _build_xp3(
+    path: Path, files: dict[str, bytes], encrypted: bool = False, extra_chunk: bytes = b""
+) -> None:
+    """ファイルテーブルを持つ標準形式のXP3アーカイブを作成する
+
+    Args:
+        path: 作成するXP3ファイルのパス
+        files: アーカイブに格納するファイル名と内容の辞書（非圧縮で格納する）
+        encrypted: 各エントリに暗号化フラグを立てるか
+        extra_chunk: ファイルテーブルの先頭に置くFile以外のチャンク
+    """
+    header_size = len(XP3_MAGIC) + 8
+    body = bytearray()
+    table = bytearray(extra_chunk)
+    for name, data in files.items():
+        offset = header_size + len(body)
+        body += data
+        name_bytes = name.encode("utf-16-le")
+        info = struct.pack(
+            "<IQQH",
+            0x80000000 if encrypted else 0,
+            len(data),
+            len(data),
+            len(name_bytes) // 2,
+        )
+        info += name_bytes
+        segm = struct.pack("<IQQQ", 0, offset, len(data), len(data))
+        adlr = struct.pack("<I", zlib.adler32(data))
+        entry = b"".join(
+            tag + struct.pack("<Q", len(chunk)) + chunk
+            for tag, chunk in ((b"info", info), (b"segm", segm), (b"adlr", adlr))
+        )
+        table += b"File" + struct.pack("<Q", len(entry)) + entry
+
+    compressed = zlib.compress(bytes(table))
+    info_offset = header_size + len(body)
+    index = b"\x01" + struct.pack("<QQ", len(compressed), len(table)) + compressed
+    path.write_bytes(XP3_MAGIC + struct.pack("<Q", info_offset) + bytes(body) + index)
 
 
 class TestEncryptionType:
@@ -306,6 +349,49 @@ class TestXP3ArchiveIntegration:
         with pytest.raises(FileNotFoundError):
             archive.extract_file("data/script.ks", output_path)
 
+    def test_list_files_parses_standard_index(self, tmp_path: Path) -> None:
+        """正常系: 標準形式のファイルテーブルからファイル一覧を取得する"""
+        xp3_file = tmp_path / "test.xp3"
+        _build_xp3(xp3_file, {"data/first.ks": b"first", "画像/bg.png": b"\x89PNG"})
+
+        archive = XP3Archive(xp3_file)
+
+        assert archive.list_files() == ["data/first.ks", "画像/bg.png"]
+        assert archive.is_encrypted() is False
+
+    def test_extract_file_from_standard_index(self, tmp_path: Path) -> None:
+        """正常系: 標準形式のアーカイブからファイルを展開する"""
+        xp3_file = tmp_path / "test.xp3"
+        _build_xp3(xp3_file, {"a.txt": b"alpha", "b.txt": b"bravo"})
+        output_path = tmp_path / "output" / "b.txt"
+
+        XP3Archive(xp3_file).extract_file("b.txt", output_path)
+
+        assert output_path.read_bytes() == b"bravo"
+
+    def test_detects_encrypted_entry(self, tmp_path: Path) -> None:
+        """正常系: 暗号化フラグを持つエントリを検出する"""
+        xp3_file = tmp_path / "test.xp3"
+        _build_xp3(xp3_file, {"a.txt": b"alpha"}, encrypted=True)
+
+        assert XP3Archive(xp3_file).is_encrypted() is True
+
+    def test_skips_unknown_table_chunk(self, tmp_path: Path) -> None:
+        """正常系: ファイルテーブル内の不明なチャンクを読み飛ばす"""
+        xp3_file = tmp_path / "test.xp3"
+        unknown = b"hnfn" + struct.pack("<Q", 6) + b"\x00" * 6
+        _build_xp3(xp3_file, {"a.txt": b"alpha"}, extra_chunk=unknown)
+
+        assert XP3Archive(xp3_file).list_files() == ["a.txt"]
+
+    def test_truncated_index_yields_no_files(self, tmp_path: Path) -> None:
+        """異常系: 途中で切れたファイルテーブルは読めた範囲のみ扱う"""
+        xp3_file = tmp_path / "test.xp3"
+        _build_xp3(xp3_file, {"a.txt": b"alpha"})
+        xp3_file.write_bytes(xp3_file.read_bytes()[:-4])
+
+        assert XP3Archive(xp3_file).list_files() == []
+
     @pytest.mark.parametrize(
         "filename",
         [
@@ -1,5 +1,8 @@
 """依存ツールチェッカーのテスト"""
 
+import subprocess
+from unittest.mock import patch
+
 import pytest
 
 from mnemonic.doctor import (
@@ -7,6 +10,8 @@ from mnemonic.doctor import (
     CheckResult,
     DependencyChecker,
     DependencyInfo,
+    _extract_version,
+    _probe_command,
     check_all_dependencies,
     check_dependency,
 )
@@ -219,9 +224,36 @@ class TestDependencyCheckerProtocol:
         assert hasattr(DependencyChecker, "check_one")
 
 
+class TestExtractVersion:
+    """_extract_version関数のテスト"""
+
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            pytest.param("Python 3.12.1", "3.12.1", id="正常系: 3要素のバージョン"),
+            pytest.param("tool 1.2 build 20240101", "1.2", id="正常系: 2要素のバージョン"),
+            pytest.param(
+                "ffmpeg version n6.0 built with gcc 12.2.0",
+                "12.2.0",
+                id="正常系: 位置によらず3要素のバージョンを優先",
+            ),
+            pytest.param("Version 17", "17", id="正常系: version表記"),
+            pytest.param("no digits here", None, id="異常系: 数字なし"),
+        ],
+    )
+    def test_extract_version(self, output: str, expected: str | None) -> None:
+        """パターンの優先順に従ってバージョンを抽出する"""
+        assert _extract_version(output) == expected
+
+
 class TestCheckDependency:
     """check_dependency関数のテスト"""
 
+    @pytest.fixture(autouse=True)
+    def clear_probe_cache(self) -> None:
+        """コマンド確認結果のキャッシュをテストごとにクリアする"""
+        _probe_command.cache_clear()
+
     def test_check_dependency_is_callable(self) -> None:
         """check_dependencyは呼び出し可能"""
         assert callable(check_dependency)
@@ -304,6 +336,57 @@ class TestCheckDependency:
         assert result.found is False
         assert result.message is not None
 
+    def test_check_dependency_skips_subprocess_when_not_on_path(self) -> None:
+        """PATH上に無いコマンドはプロセスを起動せずに未検出となる"""
+        test_info = DependencyInfo(
+            name="NotFound",
+            command="nonexistent_command_xyz123",
+            version_flag="--version",
+            required=True,
+        )
+
+        with patch("mnemonic.doctor.subprocess.run") as mock_run:
+            result = check_dependency(test_info)
+
+        assert result.found is False
+        assert result.message == "コマンド 'nonexistent_command_xyz123' が見つかりません"
+        mock_run.assert_not_called()
+
+    def test_check_dependency_reads_only_output_head(self) -> None:
+        """長いバナー出力は先頭部分のみからバージョンを抽出する"""
+        test_info = DependencyInfo(
+            name="Banner",
+            command="python",
+            version_flag="--version",
+            required=True,
+        )
+        banner = b"tool 1.2\n" + b"x" * 600 + b" 9.9.9"
+
+        with patch("mnemonic.doctor.subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, banner, b"")
+            result = check_dependency(test_info)
+
+        assert result.found is True
+        assert result.version == "1.2"
+        assert mock_run.call_args.kwargs["stdin"] is subprocess.DEVNULL
+
+    def test_check_dependency_caches_probe(self) -> None:
+        """同じコマンドの2回目以降のチェックではプロセスを起動しない"""
+        test_info = DependencyInfo(
+            name="Python",
+            command="python",
+            version_flag="--version",
+            required=True,
+        )
+
+        with patch("mnemonic.doctor.subprocess.run", wraps=subprocess.run) as mock_run:
+            first = check_dependency(test_info)
+            second = check_dependency(test_info)
+            refreshed = check_dependency(test_info, refresh=True)
+
+        assert first == second == refreshed
+        assert mock_run.call_count == 2
+
 
 class TestCheckAllDependencies:
     """check_all_dependencies関数のテスト"""
@@ -334,3 +417,9 @@ class TestCheckAllDependencies:
         expected_names = {d.name for d in DEPENDENCIES}
 
         assert result_names == expected_names
+
+    def test_check_all_dependencies_preserves_order(self) -> None:
+        """check_all_dependenciesの結果はDEPENDENCIESと同じ順序になる"""
+        results = check_all_dependencies()
+
+        assert [r.name for r in results] == [d.name for d in DEPENDENCIES]
@@ -0,0 +1,60 @@
+"""ファイルシステム走査モジュールのテスト"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from mnemonic._fs import scan_tree
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """ネストしたディレクトリ構造を作成するフィクスチャ"""
+    (tmp_path / "a.ks").write_text("a", encoding="utf-8")
+    (tmp_path / "b.PNG").write_bytes(b"png")
+    nested = tmp_path / "sub" / "deep"
+    nested.mkdir(parents=True)
+    (tmp_path / "sub" / "c.ks").write_text("cc", encoding="utf-8")
+    (nested / "d.txt").write_text("ddd", encoding="utf-8")
+    return tmp_path
+
+
+class TestScanTree:
+    """scan_tree関数のテスト"""
+
+    @pytest.mark.parametrize(
+        "recursive, expected",
+        [
+            pytest.param(
+                True,
+                ["a.ks", "b.PNG", "sub/c.ks", "sub/deep/d.txt"],
+                id="正常系: サブディレクトリも再帰的に走査",
+            ),
+            pytest.param(False, ["a.ks", "b.PNG"], id="正常系: 直下のファイルのみ走査"),
+        ],
+    )
+    def test_scan_tree(self, tree: Path, recursive: bool, expected: list[str]) -> None:
+        """ファイルのみを列挙し、ディレクトリは結果に含めないことを確認"""
+        entries = scan_tree(os.fspath(tree), workers=2, recursive=recursive)
+
+        assert sorted(Path(e.path).relative_to(tree).as_posix() for e in entries) == expected
+
+    def test_scan_tree_filters_extensions(self, tree: Path) -> None:
+        """拡張子を大文字小文字を区別せずに絞り込み、statを取得できることを確認"""
+        entries = scan_tree(os.fspath(tree), workers=1, extensions={".ks", ".png"}, stat=True)
+
+        sizes = {e.name: e.stat().st_size for e in entries}
+        assert sizes == {"a.ks": 1, "b.PNG": 3, "c.ks": 2}
+
+    def test_scan_tree_does_not_follow_directory_symlinks(self, tree: Path) -> None:
+        """シンボリックリンクのディレクトリを辿らないことを確認"""
+        (tree / "sub" / "loop").symlink_to(tree, target_is_directory=True)
+
+        entries = scan_tree(os.fspath(tree), workers=1)
+
+        assert len(entries) == 4
+
+    def test_scan_tree_nonexistent_directory(self, tmp_path: Path) -> None:
+        """存在しないディレクトリは空として扱うことを確認"""
+        assert scan_tree(os.fspath(tmp_path / "missing"), workers=1) == []
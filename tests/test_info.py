@@ -1,12 +1,17 @@
 """ゲーム情報解析モジュールのテスト"""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from mnemonic.info import (
+    _ENCODING_SAMPLE_SIZE,
     FileStats,
     GameInfo,
+    _scan_files,
+    _sniff_utf8,
     analyze_game,
     collect_file_stats,
     detect_engine,
@@ -133,6 +138,40 @@ class TestDetectEngine:
         result = detect_engine(tmp_path)
         assert result == "kirikiri"
 
+    def test_detect_engine_scans_directory_once(self, tmp_path: Path) -> None:
+        """ディレクトリの走査は1回のみ行う"""
+        (tmp_path / "Game.rgss3a").touch()
+        (tmp_path / "readme.txt").touch()
+
+        with patch("mnemonic.info.os.scandir", wraps=os.scandir) as m:
+            result = detect_engine(tmp_path)
+
+        assert result == "rpgmaker"
+        assert m.call_count == 1
+
+
+class TestSniffUtf8:
+    """_sniff_utf8関数のテスト"""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            pytest.param(b"[wait time=100]\n", "ascii", id="正常系: ASCIIのみ"),
+            pytest.param("日本語".encode(), "utf-8", id="正常系: UTF-8"),
+            pytest.param(
+                b"\xef\xbb\xbf" + "日本語".encode(), "utf-8-sig", id="正常系: BOM付きUTF-8"
+            ),
+            pytest.param(
+                "日本語".encode()[:-1], "utf-8", id="正常系: 末尾で途切れたマルチバイト文字"
+            ),
+            pytest.param("日本語".encode("shift_jis"), None, id="異常系: Shift_JIS"),
+            pytest.param("日本語".encode("iso-2022-jp"), None, id="異常系: ISO-2022-JP"),
+        ],
+    )
+    def test_sniff_utf8(self, content: bytes, expected: str | None) -> None:
+        """ASCII/UTF-8として妥当なサンプルのみエンコーディング名を返す"""
+        assert _sniff_utf8(content) == expected
+
 
 class TestCollectFileStats:
     """collect_file_stats関数のテスト"""
@@ -194,6 +233,32 @@ class TestCollectFileStats:
         assert ".jpg" not in result.extensions
         assert ".gif" not in result.extensions
 
+    def test_collect_file_stats_nonexistent_dir(self, tmp_path: Path) -> None:
+        """存在しないディレクトリの場合、count=0を返す"""
+        result = collect_file_stats(tmp_path / "missing", [".txt"])
+        assert result.count == 0
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="シンボリックリンク非対応環境")
+    def test_collect_file_stats_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        """ディレクトリへのシンボリックリンクは辿らない"""
+        (tmp_path / "file1.txt").write_text("root")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        result = collect_file_stats(tmp_path, [".txt"])
+        assert result.count == 1
+
+    def test_collect_file_stats_many_subdirectories(self, tmp_path: Path) -> None:
+        """複数階層・複数のサブディレクトリを並列に走査できる"""
+        for i in range(5):
+            nested = tmp_path / f"dir{i}" / "a" / "b"
+            nested.mkdir(parents=True)
+            (nested / f"file{i}.txt").write_text("12345")
+            (tmp_path / f"dir{i}" / f"skip{i}.bin").write_bytes(b"\x00")
+
+        result = collect_file_stats(tmp_path, [".txt"])
+        assert result.count == 5
+        assert result.total_size_bytes == 25
+
 
 class TestAnalyzeGame:
     """analyze_game関数のテスト"""
@@ -214,6 +279,23 @@ class TestAnalyzeGame:
         assert result.audio.count == 1
         assert result.video.count == 1
 
+    def test_analyze_game_walks_directory_once(self, tmp_path: Path) -> None:
+        """全分類の統計を1回のディレクトリ走査で収集する"""
+        subdir = tmp_path / "data"
+        subdir.mkdir()
+        (subdir / "script.ks").write_text("script", encoding="utf-8")
+        (subdir / "image.PNG").write_bytes(b"\x89PNG")
+        (subdir / "voice.ogg").write_bytes(b"OggS")
+
+        with patch("mnemonic.info._scan_files", wraps=_scan_files) as mock_walk:
+            result = analyze_game(tmp_path)
+
+        assert mock_walk.call_count == 1
+        assert result.scripts.total_size_bytes == 6
+        assert result.images.extensions == (".png",)
+        assert result.audio.count == 1
+        assert result.video.count == 0
+
     def test_analyze_game_rpgmaker(self, tmp_path: Path) -> None:
         """RPGツクールゲームを正しく解析する"""
         (tmp_path / "Game.rgss3a").touch()
@@ -235,6 +317,37 @@ class TestAnalyzeGame:
         result = analyze_game(tmp_path)
         assert result.detected_encoding is not None
 
+    def test_analyze_game_encoding_detection_reads_only_sample(self, tmp_path: Path) -> None:
+        """エンコーディング検出ではスクリプトの先頭部分のみを読み込む"""
+        script = tmp_path / "script.ks"
+        script.write_text("日本語テキスト\n" * 10000, encoding="shift_jis")
+
+        with patch("mnemonic.info.chardet.detect", return_value={"encoding": "SHIFT_JIS"}) as m:
+            result = analyze_game(tmp_path)
+
+        assert result.detected_encoding == "shift_jis"
+        assert len(m.call_args.args[0]) == _ENCODING_SAMPLE_SIZE
+
+    def test_analyze_game_utf8_skips_chardet(self, tmp_path: Path) -> None:
+        """UTF-8のスクリプトではchardetを呼び出さない"""
+        (tmp_path / "script.ks").write_text("日本語テキスト\n" * 100, encoding="utf-8")
+
+        with patch("mnemonic.info.chardet.detect") as m:
+            result = analyze_game(tmp_path)
+
+        assert result.detected_encoding == "utf-8"
+        m.assert_not_called()
+
+    def test_analyze_game_detects_iso2022jp(self, tmp_path: Path) -> None:
+        """ISO-2022-JPのスクリプトをASCIIと誤判定しない"""
+        (tmp_path / "script.ks").write_bytes(
+            ("日本語のテキストです。これはテストです。\n" * 20).encode("iso-2022-jp")
+        )
+
+        result = analyze_game(tmp_path)
+
+        assert result.detected_encoding == "iso-2022-jp"
+
     def test_analyze_game_no_scripts_no_encoding(self, tmp_path: Path) -> None:
         """スクリプトがない場合、エンコーディングはNone"""
         result = analyze_game(tmp_path)
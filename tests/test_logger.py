@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -292,6 +293,37 @@ class TestBuildLogger:
         assert progress._use_color is False
         assert progress._use_emoji is False
 
+    @pytest.mark.parametrize(
+        "verbose_level,level,expected",
+        [
+            pytest.param(VerboseLevel.NORMAL, VerboseLevel.NORMAL, True, id="正常系: 同じレベル"),
+            pytest.param(VerboseLevel.NORMAL, VerboseLevel.DEBUG, False, id="正常系: 上位レベル"),
+            pytest.param(VerboseLevel.DEBUG, VerboseLevel.VERBOSE, True, id="正常系: 下位レベル"),
+        ],
+    )
+    def test_is_enabled(
+        self, verbose_level: VerboseLevel, level: VerboseLevel, expected: bool
+    ) -> None:
+        """詳細レベルに応じて出力の有無を判定する"""
+        logger = BuildLogger(LogConfig(verbose_level=verbose_level))
+        assert logger.is_enabled(level) is expected
+
+    def test_is_enabled_with_log_file(self, tmp_path: Path) -> None:
+        """ログファイル出力中は全レベルが出力対象となる"""
+        config = LogConfig(verbose_level=VerboseLevel.QUIET, log_file=tmp_path / "test.log")
+        with BuildLogger(config) as logger:
+            assert logger.is_enabled(VerboseLevel.DEBUG) is True
+        assert logger.is_enabled(VerboseLevel.DEBUG) is False
+
+    def test_log_command_skips_formatting_when_disabled(self) -> None:
+        """出力されない場合はコマンド出力の行分割を行わない"""
+        logger = BuildLogger(LogConfig(verbose_level=VerboseLevel.NORMAL))
+        output = Mock(spec=str)
+
+        logger.log_command(["gradle", "build"], output)
+
+        output.splitlines.assert_not_called()
+
     # --- ファイル出力のテスト ---
 
     def test_log_to_file(self, tmp_path: Path) -> None:
@@ -315,6 +347,14 @@ class TestBuildLogger:
         assert "\x1b[" not in content
         assert "カラーメッセージ" in content
 
+    def test_strip_ansi_skips_regex_for_plain_text(self) -> None:
+        """エスケープ文字を含まないテキストは正規表現を使わずにそのまま返す"""
+        logger = BuildLogger(LogConfig())
+        with patch.object(BuildLogger, "_ANSI_ESCAPE_PATTERN") as mock_pattern:
+            result = logger._strip_ansi("plain message")
+        assert result == "plain message"
+        mock_pattern.sub.assert_not_called()
+
     def test_context_manager_closes_file(self, tmp_path: Path) -> None:
         """コンテキストマネージャがファイルを閉じる"""
         log_file = tmp_path / "test.log"
@@ -325,6 +365,27 @@ class TestBuildLogger:
         # ファイルが閉じられていることを確認
         assert logger._log_file is None or logger._log_file.closed
 
+    def test_error_flushes_log_file(self, tmp_path: Path) -> None:
+        """エラー出力時はそれまでのログがファイルに書き出される"""
+        log_file = tmp_path / "test.log"
+        config = LogConfig(verbose_level=VerboseLevel.QUIET, log_file=log_file)
+        with BuildLogger(config) as logger:
+            logger.info("before error")
+            logger.error("failure")
+            content = log_file.read_text()
+        assert "INFO: before error" in content
+        assert "ERROR: failure" in content
+
+    def test_info_does_not_flush_log_file(self, tmp_path: Path) -> None:
+        """通常のログ出力ではメッセージごとにフラッシュしない"""
+        log_file = tmp_path / "test.log"
+        config = LogConfig(verbose_level=VerboseLevel.QUIET, log_file=log_file)
+        with BuildLogger(config) as logger:
+            assert logger._log_file is not None
+            with patch.object(logger._log_file, "flush") as mock_flush:
+                logger.info("message")
+            mock_flush.assert_not_called()
+
     def test_all_log_levels_written_to_file(self, tmp_path: Path) -> None:
         """全てのログレベルがファイルに書き込まれる"""
         log_file = tmp_path / "test.log"
@@ -400,6 +461,43 @@ class TestConsoleProgressDisplay:
         # 25%なので、約10個のバーがあるはず（40 * 0.25 = 10）
         assert captured.out.count("\u2588") == 10  # filled blocks
 
+    def test_update_skips_identical_frame(self, capsys: CaptureFixture[str]) -> None:
+        """表示内容が変わらない更新は出力しない"""
+        display = ConsoleProgressDisplay()
+        display.start(PipelinePhase.CONVERT, 1000)
+        _ = capsys.readouterr()  # start の出力をクリア
+        display.update(500)
+        display.update(501)
+        captured = capsys.readouterr()
+        assert captured.out.count("50%") == 1
+        assert display._current == 501
+
+    def test_update_throttles_redraw(self, capsys: CaptureFixture[str]) -> None:
+        """最小再描画間隔内の更新は出力しない"""
+        display = ConsoleProgressDisplay()
+        display.start(PipelinePhase.CONVERT, 100)
+        _ = capsys.readouterr()  # start の出力をクリア
+        with patch("mnemonic.logger.time.monotonic", side_effect=[10.0, 10.01, 10.1]):
+            display.update(10)
+            display.update(20)
+            display.update(30)
+        captured = capsys.readouterr()
+        assert "10%" in captured.out
+        assert "20%" not in captured.out
+        assert "30%" in captured.out
+        assert display._current == 30
+
+    def test_update_always_draws_final_frame(self, capsys: CaptureFixture[str]) -> None:
+        """完了時の更新は間引かれずに出力される"""
+        display = ConsoleProgressDisplay()
+        display.start(PipelinePhase.CONVERT, 100)
+        _ = capsys.readouterr()  # start の出力をクリア
+        with patch("mnemonic.logger.time.monotonic", side_effect=[10.0, 10.001]):
+            display.update(99)
+            display.update(100)
+        captured = capsys.readouterr()
+        assert "100%" in captured.out
+
     def test_finish_success(self, capsys: CaptureFixture[str]) -> None:
         """成功時の終了表示"""
         display = ConsoleProgressDisplay(use_emoji=True)
@@ -5,7 +5,7 @@ TDDワークフローの第2段階として、実装前に作成されたテス
 """
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -786,3 +786,31 @@ class TestBuildPipelineFindGameIcon:
         result = pipeline._find_game_icon()
 
         assert result is None
+
+
+class TestBuildPipelineExecuteConvert:
+    """BuildPipeline._execute_convertのテスト"""
+
+    def test_splits_ffmpeg_threads_across_workers(self, tmp_path: Path) -> None:
+        """FFmpegのスレッド数を変換ワーカー数で分け合う"""
+        input_file = tmp_path / "game.exe"
+        input_file.write_bytes(b"\x00" * 100)
+        extract_dir = tmp_path / "extract"
+        extract_dir.mkdir()
+
+        pipeline = BuildPipeline(
+            PipelineConfig(input_path=input_file, output_path=tmp_path / "output.apk")
+        )
+        pipeline._extract_dir = extract_dir
+
+        with (
+            patch("mnemonic.pipeline.ConversionManager") as mock_manager,
+            patch("mnemonic.pipeline.VideoConverter") as mock_video,
+        ):
+            mock_manager.usable_cpu_count.return_value = 8
+            mock_manager.calculate_workers.return_value = 4
+            pipeline._execute_convert()
+            pipeline._cleanup_temp_dirs()
+
+        assert mock_video.call_args.kwargs["threads"] == 2
+        assert mock_manager.call_args.kwargs["max_workers"] == 4